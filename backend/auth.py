@@ -5,7 +5,10 @@ This module provides JWT verification for Clerk authentication tokens.
 It uses PyJWT with Clerk's JWKS endpoint to verify tokens.
 """
 
+import asyncio
+import hashlib
 import os
+import time
 import jwt
 from jwt import PyJWKClient
 from fastapi import HTTPException, Depends, status
@@ -13,12 +16,24 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
 from functools import lru_cache
 
+from response_cache import TTLCache
+
 # Clerk JWKS URL for token verification
 CLERK_JWKS_URL = os.getenv(
     "CLERK_JWKS_URL",
     "https://awaited-prawn-51.clerk.accounts.dev/.well-known/jwks.json"
 )
 
+# How long the fetched JWKS is trusted before it is re-fetched
+JWKS_CACHE_SECONDS = 3600
+
+# Verified token claims, so repeat calls with the same session token skip
+# the RSA verification; entries are never served within
+# TOKEN_EXPIRY_MARGIN_SECONDS of the token's own expiry
+TOKEN_CACHE_SECONDS = 300
+TOKEN_EXPIRY_MARGIN_SECONDS = 10
+token_cache = TTLCache(maxsize=20_000, ttl=TOKEN_CACHE_SECONDS)
+
 # HTTP Bearer security scheme
 security = HTTPBearer(auto_error=False)
 
@@ -27,9 +42,22 @@ security = HTTPBearer(auto_error=False)
 def get_jwks_client():
     """
     Get a cached JWKS client for Clerk token verification.
-    Uses LRU cache to avoid creating new clients for each request.
+    Uses LRU cache to avoid creating new clients for each request; the
+    client itself caches the key set and the resolved signing keys.
     """
-    return PyJWKClient(CLERK_JWKS_URL)
+    return PyJWKClient(CLERK_JWKS_URL, cache_keys=True, lifespan=JWKS_CACHE_SECONDS)
+
+
+def _token_cache_key(token: str) -> str:
+    return hashlib.blake2b(token.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def get_cached_claims(token: str) -> Optional[dict]:
+    """Claims of a previously verified token, or None if not cached or near expiry."""
+    claims = token_cache.get(_token_cache_key(token))
+    if claims is None or claims["exp"] <= time.time() + TOKEN_EXPIRY_MARGIN_SECONDS:
+        return None
+    return claims
 
 
 def verify_clerk_token(token: str) -> dict:
@@ -45,6 +73,10 @@ def verify_clerk_token(token: str) -> dict:
     Raises:
         HTTPException: If the token is invalid or expired
     """
+    cached = get_cached_claims(token)
+    if cached is not None:
+        return cached
+    
     try:
         jwks_client = get_jwks_client()
         signing_key = jwks_client.get_signing_key_from_jwt(token)
@@ -59,6 +91,8 @@ def verify_clerk_token(token: str) -> dict:
                 "verify_iat": True,
             }
         )
+        if "exp" in payload:
+            token_cache.set(_token_cache_key(token), payload)
         return payload
         
     except jwt.ExpiredSignatureError:
@@ -109,7 +143,15 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    return verify_clerk_token(credentials.credentials)
+    return await _verify_token_async(credentials.credentials)
+
+
+async def _verify_token_async(token: str) -> dict:
+    """verify_clerk_token, running cache misses (JWKS fetch, RSA verify) off the event loop."""
+    cached = get_cached_claims(token)
+    if cached is not None:
+        return cached
+    return await asyncio.to_thread(verify_clerk_token, token)
 
 
 async def get_optional_user(
@@ -130,6 +172,6 @@ async def get_optional_user(
         return None
     
     try:
-        return verify_clerk_token(credentials.credentials)
+        return await _verify_token_async(credentials.credentials)
     except HTTPException:
         return None
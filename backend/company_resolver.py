@@ -34,6 +34,8 @@ class CompanyResolver:
         self.mapping_file = mapping_file
         self.company_mapping = self._load_mapping()
         self.reverse_mapping = self._build_reverse_mapping()
+        self.name_index = self._build_name_index()
+        self.normalized_names = {ticker: names for ticker, _, names in self.name_index}
     
     def _load_mapping(self) -> Dict[str, any]:
         """
@@ -102,6 +104,25 @@ class CompanyResolver:
         """Build reverse mapping from ticker to company info."""
         return self.company_mapping.copy()
     
+    def _build_name_index(self) -> List[Tuple[str, Dict, Tuple[str, ...]]]:
+        """
+        Precompute (ticker, company_info, normalized names) for every company.
+        
+        Names are the primary name followed by the aliases, so resolve()
+        doesn't re-normalize the whole mapping on every keystroke.
+        """
+        return [
+            (
+                ticker,
+                company_info,
+                tuple(
+                    self._normalize_text(name)
+                    for name in [company_info['primary_name']] + company_info.get('aliases', [])
+                ),
+            )
+            for ticker, company_info in self.company_mapping.items()
+        ]
+    
     def _normalize_text(self, text: str) -> str:
         """Normalize text for comparison (lowercase, strip whitespace)."""
         return text.lower().strip()
@@ -137,6 +158,32 @@ class CompanyResolver:
         Returns:
             List of matches with ticker, company_name, exchange, country, and confidence score
         """
+        return self._rank_matches(query, min_score)[:max_results]
+    
+    def resolve_with_ambiguity(
+        self, query: str, max_results: int = 5, min_score: float = 0.6
+    ) -> Tuple[List[Dict[str, any]], bool]:
+        """
+        resolve() and detect_ambiguity() from a single scan of the mapping.
+        
+        Ambiguity only counts matches with confidence >= 0.8, and those are
+        the same for any min_score up to 0.8, so one ranking serves both.
+        
+        Returns:
+            (matches, is_ambiguous)
+        """
+        if min_score > 0.8:
+            return (
+                self.resolve(query, max_results, min_score),
+                self.detect_ambiguity(query),
+            )
+        
+        matches = self._rank_matches(query, min_score)
+        high_confidence = sum(1 for m in matches[:10] if m['confidence'] >= 0.8)
+        return matches[:max_results], high_confidence > 1
+    
+    def _rank_matches(self, query: str, min_score: float) -> List[Dict[str, any]]:
+        """All matches for a query, sorted by confidence (descending)."""
         if not query or not query.strip():
             return []
         
@@ -159,17 +206,13 @@ class CompanyResolver:
                 }]
         
         # Search through company names and aliases
-        for ticker, company_info in self.company_mapping.items():
+        for ticker, company_info, names_norm in self.name_index:
             primary_name = company_info['primary_name']
-            aliases = company_info.get('aliases', [])
-            all_names = [primary_name] + aliases
             
             best_match_type = None
             best_score = 0.0
             
-            for name in all_names:
-                name_norm = self._normalize_text(name)
-                
+            for name_norm in names_norm:
                 # Exact match (case-insensitive)
                 if query_norm == name_norm:
                     best_match_type = 'exact'
@@ -208,10 +251,10 @@ class CompanyResolver:
                     'confidence': best_score
                 })
         
-        # Sort by confidence (descending) and return top results
+        # Sort by confidence (descending)
         matches.sort(key=lambda x: x['confidence'], reverse=True)
         
-        return matches[:max_results]
+        return matches
     
     def get_company_name(self, ticker: str) -> Optional[str]:
         """Get the primary company name for a ticker symbol."""
@@ -281,7 +324,7 @@ class CompanyResolver:
         
         # Normalize and check if name matches
         name_norm = self._normalize_text(company_name)
-        primary_norm = self._normalize_text(company_info['primary_name'])
+        primary_norm, *aliases_norm = self.normalized_names[ticker]
         
         # Check exact match
         if name_norm == primary_norm:
@@ -296,17 +339,16 @@ class CompanyResolver:
             }
         
         # Check aliases
-        for alias in company_info.get('aliases', []):
-            if name_norm == self._normalize_text(alias):
-                return {
-                    'is_valid': True,
-                    'ticker': ticker,
-                    'resolved_name': company_info['primary_name'],
-                    'exchange': company_info.get('exchange', ''),
-                    'country': company_info.get('country', ''),
-                    'message': f"Matched via alias: {company_info['primary_name']} ({ticker})",
-                    'confidence': 0.95
-                }
+        if name_norm in aliases_norm:
+            return {
+                'is_valid': True,
+                'ticker': ticker,
+                'resolved_name': company_info['primary_name'],
+                'exchange': company_info.get('exchange', ''),
+                'country': company_info.get('country', ''),
+                'message': f"Matched via alias: {company_info['primary_name']} ({ticker})",
+                'confidence': 0.95
+            }
         
         # Partial match
         if name_norm in primary_norm or primary_norm in name_norm:
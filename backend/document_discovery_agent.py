@@ -13,36 +13,66 @@ HARD REQUIREMENTS:
 
 import os
 import re
+import asyncio
+import hashlib
 import logging
+import threading
 import time
 import concurrent.futures
-from typing import List, Dict, Optional, Tuple, Any, Set
-from dataclasses import dataclass, asdict, field
+from array import array
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple, Any, Set, NamedTuple, Callable
+from dataclasses import dataclass, field
 from datetime import datetime
 from urllib.parse import urlparse, urljoin, parse_qs
 
+import httpx
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+try:
+    from requests_cache import CachedSession
+    HAS_REQUESTS_CACHE = True
+except ImportError:
+    HAS_REQUESTS_CACHE = False
 
 # Local imports
-from .financial_keywords import (
-    TIER_KEYWORDS,
-    TIER_1_UNIVERSAL,
-    TIER_2_PERIODIC,
-    TIER_3_REGULATORY,
-    TIER_4_INVESTOR_RELATIONS,
+from financial_keywords import (
     TIER_7_URL_PATHS,
-    TIER_8_MULTILINGUAL,
-    get_all_keywords,
-    get_url_path_patterns,
+    TIER_KEYWORDS_LOWER,
     detect_document_type,
     detect_language,
     is_english_version,
     get_language_preference_note,
     calculate_confidence_score,
+    calculate_confidence_scores_batch,
+    count_tier_matches,
+    match_all_tiers,
     extract_year_from_text,
 )
 
+from response_cache import TTLCache, normalize_query
+
+# Memoized keyword classifiers; titles and URLs repeat across search
+# phases, subpages and the English-preference pass
+_detect_document_type = lru_cache(maxsize=4096)(detect_document_type)
+_detect_language = lru_cache(maxsize=4096)(detect_language)
+_is_english_version = lru_cache(maxsize=4096)(is_english_version)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -74,6 +104,16 @@ IR_SUBPAGE_KEYWORDS = [
     "informe anual",  # Spanish
 ]
 
+IR_SUBPAGE_KEYWORDS_LOWER = tuple(kw.lower() for kw in IR_SUBPAGE_KEYWORDS)
+
+# One-pass substring test for IR_SUBPAGE_KEYWORDS. Keywords containing a
+# shorter keyword ("annual report" contains "report") can never change the
+# outcome and are dropped from the alternation.
+_IR_SUBPAGE_KEYWORD_RE = re.compile('|'.join(
+    re.escape(kw) for kw in IR_SUBPAGE_KEYWORDS_LOWER
+    if not any(other != kw and other in kw for other in IR_SUBPAGE_KEYWORDS_LOWER)
+))
+
 # URL patterns indicating DEEP report listing pages (STRONG POSITIVES)
 # These are pages that contain actual document links, not landing pages
 REPORT_LISTING_PATTERNS = [
@@ -111,6 +151,12 @@ REPORT_LISTING_PATTERNS = [
     r'/ir/financial',
 ]
 
+# Search-result URL/title fragments that identify an IR page
+IR_INDICATOR_RE = re.compile(
+    r'investor|ir\.|/ir/|/ir-|shareholders|annual-report|financial',
+    re.IGNORECASE,
+)
+
 # URL patterns for IR LANDING PAGES (HARD NEGATIVES - reject as source_page)
 # These are too shallow - we need to go deeper to find actual docs
 IR_LANDING_PATTERNS = [
@@ -205,25 +251,308 @@ OFFICIAL_REGULATOR_DOMAINS = [
     'asx.com.au', 'sgx.com',
 ]
 
+# Normalize once at import: helpers compare against lowercased input, and
+# domain lists are matched against the URL host by set lookup
+THIRD_PARTY_DOMAIN_BLOCKLIST = frozenset(d.lower() for d in THIRD_PARTY_DOMAIN_BLOCKLIST)
+THIRD_PARTY_CONTENT_BLOCKLIST = tuple(t.lower() for t in THIRD_PARTY_CONTENT_BLOCKLIST)
+OFFICIAL_DOCUMENT_SIGNALS = tuple(s.lower() for s in OFFICIAL_DOCUMENT_SIGNALS)
+OFFICIAL_REGULATOR_DOMAINS = frozenset(d.lower() for d in OFFICIAL_REGULATOR_DOMAINS)
+
 # Legacy alias for compatibility
 DOCUMENT_PAGE_URL_PATTERNS = REPORT_LISTING_PATTERNS
 
+# Each pattern list compiled once into a single alternation
+_DOC_URL_RE = re.compile(
+    '|'.join(f'(?:{p})' for p in DOCUMENT_PAGE_URL_PATTERNS), re.IGNORECASE
+)
+_IR_LANDING_RE = re.compile(
+    '|'.join(f'(?:{p})' for p in IR_LANDING_PATTERNS), re.IGNORECASE
+)
+
+# Natural language query parsing
+_YEAR_RANGE_RE = re.compile(r'(\d{4})\s*(?:to|-)\s*(\d{4})')
+_SINGLE_YEAR_RE = re.compile(r'\b(20\d{2})\b')
+QUERY_DOC_TYPE_PATTERNS = [
+    (re.compile(r'annual\s*report'), 'annual report'),
+    (re.compile(r'quarterly\s*report'), 'quarterly report'),
+    (re.compile(r'quarterly\s*earnings'), 'quarterly earnings'),
+    (re.compile(r'financial\s*statements?'), 'financial statements'),
+    (re.compile(r'investor\s*presentation'), 'investor presentation'),
+    (re.compile(r'earnings\s*release'), 'earnings release'),
+    (re.compile(r'10-k'), '10-K'),
+    (re.compile(r'10-q'), '10-Q'),
+    (re.compile(r'20-f'), '20-F'),
+]
+
+# Tokens (single words and two-word doc-type phrases) dropped from a query
+# to leave the company name. Matched on whole tokens, so names containing
+# these strings ("Toyota", "Fromageries Bel") are left intact.
+_QUERY_STOP_PHRASES = frozenset([
+    ('annual',), ('report',), ('reports',), ('for',),
+    ('from',), ('to',), ('between',),
+    ('annual', 'report'), ('annual', 'reports'),
+    ('quarterly', 'report'), ('quarterly', 'reports'),
+    ('quarterly', 'earnings'),
+    ('financial', 'statement'), ('financial', 'statements'),
+    ('investor', 'presentation'), ('investor', 'presentations'),
+    ('earnings', 'release'), ('earnings', 'releases'),
+    ('10-k',), ('10-q',), ('20-f',),
+])
+_QUERY_TOKEN_PUNCTUATION = ',;:'
+
+# Maximum queries per Serper batch request
+SERPER_BATCH_SIZE = 100
+
+# Persistent cache for responses fetched through the shared session (Serper)
+HTTP_CACHE_PATH = os.getenv("DISCOVERY_HTTP_CACHE", ".discovery_http_cache")
+HTTP_CACHE_EXPIRE_SECONDS = 86400
+
+# Concurrent requests when validating candidate PDF links
+PDF_VALIDATION_CONCURRENCY = 20
+
+# Results of discover_investor_documents keyed by the parsed request, so
+# paraphrased queries for the same company/types/years reuse one discovery
+QUERY_RESULT_CACHE_SECONDS = 3600
+_query_result_cache = TTLCache(maxsize=2048, ttl=QUERY_RESULT_CACHE_SECONDS)
+
+# HEAD responses from servers (often CDNs) that do not implement HEAD;
+# these are retried with a ranged GET
+HEAD_UNSUPPORTED_STATUSES = frozenset({403, 405, 501})
+
+# Crawled pages larger than this are not parsed
+MAX_CRAWL_PAGE_BYTES = 5 * 1024 * 1024
+
+
+# Quarter/half markers, mapped to (priority, label). Quarters win over
+# halves regardless of where they appear in the text.
+_QUARTER_RE = re.compile(
+    r'q[1-4]|h[12]|first quarter|second quarter|third quarter|fourth quarter'
+    r'|half year|first half|second half',
+    re.IGNORECASE,
+)
+_QUARTER_MAP = {
+    'q1': (0, 'Q1'), 'first quarter': (0, 'Q1'),
+    'q2': (1, 'Q2'), 'second quarter': (1, 'Q2'),
+    'q3': (2, 'Q3'), 'third quarter': (2, 'Q3'),
+    'q4': (3, 'Q4'), 'fourth quarter': (3, 'Q4'),
+    'h1': (4, 'H1'), 'half year': (4, 'H1'), 'first half': (4, 'H1'),
+    'h2': (5, 'H2'), 'second half': (5, 'H2'),
+}
+
+
+@lru_cache(maxsize=4096)
+def _extract_quarter(text: str) -> Optional[str]:
+    """Extract quarter (Q1-Q4) or half (H1/H2) from text."""
+    best = None
+    for match in _QUARTER_RE.finditer(text):
+        found = _QUARTER_MAP[match.group(0).lower()]
+        if best is None or found < best:
+            best = found
+            if best[0] == 0:
+                break
+    return best[1] if best else None
+
+
+_ANCHOR_STRAINER = SoupStrainer('a', href=True)
+
+
+class PageLink(NamedTuple):
+    """An <a href> on a crawled page."""
+    href: str
+    text: str   # Link text, stripped text nodes joined without separator
+    title: str  # title attribute, "" if absent
+
+
+def extract_page_links(content: bytes) -> List[PageLink]:
+    """
+    Parse an HTML page once and return its links.
+    
+    Uses selectolax's Lexbor parser when available and falls back to
+    BeautifulSoup restricted to <a href> elements; both produce the same
+    link text. PDF extraction and subpage discovery share the result, so
+    each page is parsed exactly once.
+    """
+    if HAS_SELECTOLAX:
+        tree = LexborHTMLParser(content)
+        return [
+            PageLink(
+                href=node.attributes.get('href') or '',
+                text=node.text(strip=True) or '',
+                title=node.attributes.get('title') or '',
+            )
+            for node in tree.css('a[href]')
+        ]
+    
+    # Only build tree nodes for anchors; the rest of the page is skipped
+    soup = BeautifulSoup(content, 'html.parser', parse_only=_ANCHOR_STRAINER)
+    return [
+        PageLink(
+            href=link['href'],
+            text=link.get_text(strip=True) or '',
+            title=link.get('title', ''),
+        )
+        for link in soup.find_all('a', href=True)
+    ]
+
+
+def _run_coroutine(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+    
+    Falls back to a worker thread when called from inside a running
+    event loop (e.g. a FastAPI async endpoint), where asyncio.run() fails.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+@lru_cache(maxsize=1)
+def _shared_session() -> requests.Session:
+    """
+    One pooled keep-alive session for Serper, validation and page fetches,
+    shared by every agent in the process (API keys are sent per request).
+    
+    With requests-cache installed, responses made through this session
+    persist in sqlite for a day, so repeated runs for overlapping companies
+    reuse Serper results. URL, body and Range header form the cache key;
+    API keys are redacted. Batch PDF validation goes through httpx
+    (_validate_pdf_urls_async) and is not cached.
+    """
+    if HAS_REQUESTS_CACHE:
+        session = CachedSession(
+            HTTP_CACHE_PATH,
+            backend='sqlite',
+            expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+            allowable_codes=(200, 206),
+            allowable_methods=('GET', 'HEAD', 'POST'),
+            match_headers=['Range'],
+            ignored_parameters=['X-API-KEY', 'Authorization', 'api_key', 'apikey'],
+        )
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Connection': 'keep-alive',
+    })
+    return session
+
+
+async def _read_capped(response: httpx.Response, url: str) -> Optional[bytes]:
+    """Read a streamed response body, giving up past MAX_CRAWL_PAGE_BYTES."""
+    declared = response.headers.get('Content-Length', '')
+    if declared.isdigit() and int(declared) > MAX_CRAWL_PAGE_BYTES:
+        logger.warning(f"Skipping oversized page ({declared} bytes): {url}")
+        return None
+    
+    body = bytearray()
+    async for chunk in response.aiter_bytes():
+        body.extend(chunk)
+        if len(body) > MAX_CRAWL_PAGE_BYTES:
+            logger.warning(f"Skipping oversized page (>{MAX_CRAWL_PAGE_BYTES} bytes): {url}")
+            return None
+    return bytes(body)
+
+
+def _is_pdf_buffer(buf: bytes) -> bool:
+    """True if the first KB of a response carries the %PDF- header."""
+    # The PDF spec allows the header anywhere in the first 1024 bytes
+    return b'%PDF-' in buf[:1024]
+
+
+def _is_pdf_response(content_type: str, head: bytes) -> bool:
+    """Decide from a response's Content-Type and first bytes whether it is a PDF."""
+    return 'application/pdf' in content_type.lower() or _is_pdf_buffer(head)
+
+
+def _head_verdict(status_code: int, content_type: str) -> Optional[bool]:
+    """
+    Decide from a HEAD response whether a URL is a PDF.
+    
+    Returns None when the HEAD is inconclusive (HEAD unsupported, or a
+    Content-Type such as application/octet-stream) and the first bytes
+    must be fetched with a ranged GET.
+    """
+    if status_code in HEAD_UNSUPPORTED_STATUSES:
+        return None
+    content_type = content_type.lower()
+    if 'application/pdf' in content_type:
+        return True
+    if 'text/html' in content_type:
+        return False
+    return None
+
+
+async def _read_prefix(response: httpx.Response, size: int) -> bytes:
+    """Read at most `size` bytes from a streamed response."""
+    head = bytearray()
+    async for chunk in response.aiter_bytes():
+        head.extend(chunk)
+        if len(head) >= size:
+            break
+    return bytes(head[:size])
+
+
+class _RateLimiter:
+    """
+    Thread-safe limiter allowing at most `calls` acquisitions per `period` seconds.
+    
+    Callers block in acquire() until a slot is free, so worker threads
+    sharing one limiter stay within the API's request budget.
+    """
+    
+    def __init__(self, calls: int, period: float):
+        self.calls = calls
+        self.period = period
+        self._timestamps: List[float] = []
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._timestamps = [t for t in self._timestamps if now - t < self.period]
+                if len(self._timestamps) < self.calls:
+                    self._timestamps.append(now)
+                    return
+                wait = self.period - (now - self._timestamps[0])
+            time.sleep(wait)
+
+
+def _matches_domain(url: str, domains: frozenset) -> bool:
+    """True if the URL's host is one of `domains` or a subdomain of one."""
+    host = urlparse(url).hostname or ""
+    while host:
+        if host in domains:
+            return True
+        _, _, host = host.partition('.')
+    return False
+
 
 def is_third_party_source(url: str, text: str = "") -> bool:
     """
     Check if a URL or text indicates third-party research.
     Returns True if this is S&P, Moody's, or similar (should be REJECTED).
     """
-    url_lower = url.lower()
-    text_lower = text.lower() if text else ""
-    
     # Check domain blocklist
-    for blocked_domain in THIRD_PARTY_DOMAIN_BLOCKLIST:
-        if blocked_domain in url_lower:
-            return True
+    if _matches_domain(url, THIRD_PARTY_DOMAIN_BLOCKLIST):
+        return True
     
     # Check content blocklist
-    combined = f"{url_lower} {text_lower}"
+    combined = f"{url} {text}".lower() if text else url.lower()
     for blocked_term in THIRD_PARTY_CONTENT_BLOCKLIST:
         if blocked_term in combined:
             return True
@@ -236,7 +565,7 @@ def has_official_document_signal(text: str, url: str = "") -> bool:
     Check if text/URL contains signals of an official company document.
     At least ONE signal must be present for acceptance.
     """
-    combined = f"{text.lower()} {url.lower()}"
+    combined = f"{text} {url}".lower()
     
     for signal in OFFICIAL_DOCUMENT_SIGNALS:
         if signal in combined:
@@ -247,11 +576,30 @@ def has_official_document_signal(text: str, url: str = "") -> bool:
 
 def is_official_regulator_domain(url: str) -> bool:
     """Check if URL is from an official regulator/exchange."""
-    url_lower = url.lower()
-    for domain in OFFICIAL_REGULATOR_DOMAINS:
-        if domain in url_lower:
-            return True
-    return False
+    return _matches_domain(url, OFFICIAL_REGULATOR_DOMAINS)
+
+
+def _canonical_url_key(url: str) -> bytes:
+    """
+    Compact key identifying a URL in the visited set.
+    
+    Ignores scheme, fragment, case and trailing slashes so http/https and
+    '#section' variants of the same page are only fetched once. The query
+    string is kept because download handlers often select the file by it.
+    """
+    parsed = urlparse(url)
+    key = f"{parsed.netloc}{parsed.path.rstrip('/')}"
+    if parsed.query:
+        key = f"{key}?{parsed.query}"
+    return hashlib.blake2b(key.lower().encode('utf-8'), digest_size=16).digest()
+
+
+def _path_depth(path: str) -> int:
+    """Number of path segments, e.g. '/investors/reports/' -> 2."""
+    stripped = path.strip('/')
+    if not stripped:
+        return 0
+    return stripped.count('/') + 1
 
 
 def calculate_source_score(
@@ -269,7 +617,25 @@ def calculate_source_score(
     + 50 if official company/regulator domain
     - 1000 if third-party blocklist triggered
     - 50 if generic IR landing page
+    
+    Scores without accompanying text are memoized per URL.
     """
+    if not text:
+        return _calculate_source_score_cached(url, pdf_count, verified_domain)
+    return _calculate_source_score(url, pdf_count, verified_domain, text)
+
+
+@lru_cache(maxsize=2048)
+def _calculate_source_score_cached(url: str, pdf_count: int, verified_domain: str) -> int:
+    return _calculate_source_score(url, pdf_count, verified_domain, "")
+
+
+def _calculate_source_score(
+    url: str,
+    pdf_count: int,
+    verified_domain: str,
+    text: str,
+) -> int:
     score = 0
     parsed = urlparse(url)
     path = parsed.path.lower()
@@ -279,8 +645,7 @@ def calculate_source_score(
     score += 10 * pdf_count
     
     # Path depth bonus
-    path_depth = len([s for s in path.split('/') if s])
-    score += 2 * path_depth
+    score += 2 * _path_depth(path)
     
     # Official domain bonus
     if verified_domain and verified_domain.lower() in domain:
@@ -293,16 +658,12 @@ def calculate_source_score(
         score -= 1000
     
     # Landing page penalty
-    for pattern in IR_LANDING_PATTERNS:
-        if re.search(pattern, path, re.IGNORECASE):
-            score -= 50
-            break
+    if _IR_LANDING_RE.search(path):
+        score -= 50
     
     # Report listing bonus
-    for pattern in REPORT_LISTING_PATTERNS:
-        if re.search(pattern, path, re.IGNORECASE):
-            score += 30
-            break
+    if _DOC_URL_RE.search(path):
+        score += 30
     
     return score
 
@@ -323,20 +684,19 @@ def is_valid_source_page(url: str, has_pdfs: bool = False) -> bool:
     path = parsed.path.lower()
     
     # Check for strong positive patterns (deep listing pages)
-    for pattern in REPORT_LISTING_PATTERNS:
-        if re.search(pattern, path, re.IGNORECASE):
-            return True
+    if _DOC_URL_RE.search(path):
+        return True
     
     # Check for hard negative patterns (landing pages)
-    for pattern in IR_LANDING_PATTERNS:
-        if re.search(pattern, path, re.IGNORECASE):
-            # Landing page - only valid if it directly contains PDFs
-            return has_pdfs
+    if _IR_LANDING_RE.search(path):
+        # Landing page - only valid if it directly contains PDFs
+        return has_pdfs
     
     # Neutral - accept if has PDFs
     return has_pdfs
 
 
+@lru_cache(maxsize=2048)
 def get_source_page_depth_score(url: str) -> int:
     """
     Score a URL by how deep/specific it is for report listing.
@@ -349,7 +709,7 @@ def get_source_page_depth_score(url: str) -> int:
     score = 0
     
     # More path segments = deeper
-    score += len([s for s in path.split('/') if s]) * 10
+    score += _path_depth(path) * 10
     
     # Strong positive patterns increase score
     for pattern in REPORT_LISTING_PATTERNS:
@@ -364,7 +724,7 @@ def get_source_page_depth_score(url: str) -> int:
     return score
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveredDocument:
     """Represents a discovered financial document with all metadata."""
     company_name: str
@@ -379,10 +739,31 @@ class DiscoveredDocument:
     quarter: Optional[str] = None
     language_notes: Optional[str] = None  # Notes about language preference
     additional_metadata: Optional[Dict] = None
+    # Dedup key derived from pdf_url, computed once at construction
+    _normalized_url: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._normalized_url = self.pdf_url.lower().rstrip('/')
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return {
+            "company_name": self.company_name,
+            "document_title": self.document_title,
+            "reporting_period": self.reporting_period,
+            "document_type": self.document_type,
+            "pdf_url": self.pdf_url,
+            "source_page_url": self.source_page_url,
+            "language": self.language,
+            "confidence_score": self.confidence_score,
+            "year": self.year,
+            "quarter": self.quarter,
+            "language_notes": self.language_notes,
+            "additional_metadata": (
+                dict(self.additional_metadata)
+                if self.additional_metadata is not None else None
+            ),
+        }
     
     def to_output_format(self) -> Dict:
         """Convert to the required output JSON schema with language info."""
@@ -399,7 +780,7 @@ class DiscoveredDocument:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveryResult:
     """Complete discovery result in the required JSON schema."""
     company: str
@@ -429,6 +810,85 @@ class DiscoveryResult:
         return result
 
 
+class DocumentBuffer:
+    """
+    Column-oriented buffer of discovered documents.
+    
+    Keeps the fields used by dedup, year filtering and ranking in parallel
+    arrays (urls / years / confidences) so those phases only touch the
+    columns they need. Documents without a year are stored as year 0.
+    """
+    
+    __slots__ = ('documents', 'urls', 'years', 'confidences')
+    
+    def __init__(self, documents: Optional[List[DiscoveredDocument]] = None):
+        self.documents: List[DiscoveredDocument] = []
+        self.urls: List[str] = []
+        self.years = array('i')
+        self.confidences = array('d')
+        if documents:
+            self.extend(documents)
+    
+    def __len__(self) -> int:
+        return len(self.documents)
+    
+    def append(self, doc: DiscoveredDocument) -> None:
+        self.documents.append(doc)
+        self.urls.append(doc._normalized_url)
+        self.years.append(doc.year or 0)
+        self.confidences.append(doc.confidence_score)
+    
+    def extend(self, docs: List[DiscoveredDocument]) -> None:
+        for doc in docs:
+            self.append(doc)
+    
+    def _select(self, indices: List[int]) -> "DocumentBuffer":
+        selected = DocumentBuffer()
+        selected.documents = [self.documents[i] for i in indices]
+        selected.urls = [self.urls[i] for i in indices]
+        selected.years = array('i', (self.years[i] for i in indices))
+        selected.confidences = array('d', (self.confidences[i] for i in indices))
+        return selected
+    
+    def where(self, mask: List[bool]) -> "DocumentBuffer":
+        """Keep documents whose mask entry is true."""
+        return self._select([i for i, keep in enumerate(mask) if keep])
+    
+    def dedup(self) -> "DocumentBuffer":
+        """Keep the first document for each normalized URL."""
+        first_index: Dict[str, int] = {}
+        for i, url in enumerate(self.urls):
+            first_index.setdefault(url, i)
+        return self._select(list(first_index.values()))
+    
+    def filter_years(self, start_year: int, end_year: int) -> "DocumentBuffer":
+        """Keep documents inside the year range, or without a detected year."""
+        return self._select([
+            i for i, year in enumerate(self.years)
+            if year == 0 or start_year <= year <= end_year
+        ])
+    
+    def top(self, limit: int) -> List[DiscoveredDocument]:
+        """Return up to `limit` documents, newest year first, then by confidence."""
+        if not self.documents:
+            return []
+        
+        if HAS_NUMPY:
+            # Zero-copy views over the columns; lexsort is stable, so ties
+            # keep insertion order like the pure-Python path below
+            years = np.frombuffer(self.years, dtype=np.intc)
+            confidences = np.frombuffer(self.confidences, dtype=np.float64)
+            order = np.lexsort((-confidences, -years))[:limit].tolist()
+        else:
+            years, confidences = self.years, self.confidences
+            order = sorted(
+                range(len(self.documents)),
+                key=lambda i: (-years[i], -confidences[i]),
+            )[:limit]
+        
+        return [self.documents[i] for i in order]
+
+
 class FinancialDocumentDiscoveryAgent:
     """
     Enhanced agent for discovering financial documents with DEEP CRAWLING.
@@ -448,6 +908,8 @@ class FinancialDocumentDiscoveryAgent:
         openai_api_key: Optional[str] = None,
         max_crawl_depth: int = 3,
         request_delay: float = 1.0,
+        max_crawl_concurrency: int = 4,
+        validate_pdf_links: bool = True,
     ):
         """
         Initialize the discovery agent.
@@ -458,24 +920,30 @@ class FinancialDocumentDiscoveryAgent:
             openai_api_key: OpenAI API key for intelligent parsing
             max_crawl_depth: Maximum depth for crawling IR pages
             request_delay: Delay between requests (rate limiting)
+            max_crawl_concurrency: Maximum concurrent page fetches during deep crawl
+            validate_pdf_links: Drop candidates whose URL does not serve a PDF
         """
         self.serper_key = serper_api_key or os.getenv("SERPER_API_KEY")
         self.tavily_key = tavily_api_key or os.getenv("TAVILY_API_KEY")
         self.openai_key = openai_api_key or os.getenv("OPENAI_API_KEY")
         self.max_crawl_depth = max_crawl_depth
         self.request_delay = request_delay
+        self.max_crawl_concurrency = max_crawl_concurrency
+        self.validate_pdf_links = validate_pdf_links
         
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-        })
+        # Shared Serper request budget for parallel searches
+        self._serper_limiter = _RateLimiter(calls=5, period=1.0)
+        
+        # Process-wide pooled session, so connections stay warm across agents
+        self.session = _shared_session()
         
         # Track visited URLs to avoid loops
-        self._visited_urls: Set[str] = set()
+        self._visited_urls: Set[bytes] = set()
         self._pages_checked: List[str] = []
         
+        # Created on first fallback and reused so its HTTP client stays warm
+        self._openrouter_retriever = None
+        
     def discover_documents(
         self,
         company: str,
@@ -483,6 +951,7 @@ class FinancialDocumentDiscoveryAgent:
         start_year: Optional[int] = None,
         end_year: Optional[int] = None,
         max_results: int = 50,
+        progress: Optional[Callable[[str, int], None]] = None,
     ) -> DiscoveryResult:
         """
         Discover financial documents for a company.
@@ -500,6 +969,8 @@ class FinancialDocumentDiscoveryAgent:
             start_year: Start year for search
             end_year: End year for search
             max_results: Maximum number of results
+            progress: Optional callback invoked after each phase with the
+                phase name and the number of candidate documents so far
             
         Returns:
             DiscoveryResult with structured JSON output
@@ -520,7 +991,11 @@ class FinancialDocumentDiscoveryAgent:
             doc_types = ["annual report", "quarterly report", "financial statements", 
                         "earnings", "10-K", "10-Q", "20-F"]
         
-        all_documents: List[DiscoveredDocument] = []
+        all_documents = DocumentBuffer()
+        
+        def report(phase: str) -> None:
+            if progress is not None:
+                progress(phase, len(all_documents))
         
         # ========================================
         # Phase 0: Company Disambiguation
@@ -530,7 +1005,7 @@ class FinancialDocumentDiscoveryAgent:
         verified_identity = None
         
         try:
-            from .company_disambiguator import (
+            from company_disambiguator import (
                 CompanyDisambiguator, 
                 CompanyIdentityCard, 
                 AmbiguityError,
@@ -592,6 +1067,7 @@ class FinancialDocumentDiscoveryAgent:
             pdf_docs = self._search_direct_pdfs(search_company, doc_types, start_year, end_year)
             all_documents.extend(pdf_docs)
             logger.info(f"Direct PDF search found {len(pdf_docs)} documents")
+            report("direct_pdf_search")
         
         # ========================================
         # Phase 2: Find and Deep Crawl IR Site
@@ -608,6 +1084,7 @@ class FinancialDocumentDiscoveryAgent:
             )
             all_documents.extend(ir_docs)
             logger.info(f"IR crawl found {len(ir_docs)} documents")
+            report("ir_crawl")
         
         # ========================================
         # Phase 3: Fallback - SEC/Regulator Search
@@ -619,6 +1096,7 @@ class FinancialDocumentDiscoveryAgent:
             )
             all_documents.extend(fallback_docs)
             logger.info(f"Fallback search found {len(fallback_docs)} documents")
+            report("regulator_search")
         
         # ========================================
         # Phase 4: OpenRouter ChatGPT Fallback
@@ -631,28 +1109,30 @@ class FinancialDocumentDiscoveryAgent:
             )
             all_documents.extend(openrouter_docs)
             logger.info(f"OpenRouter fallback found {len(openrouter_docs)} documents")
+            report("openrouter_fallback")
         
         # ========================================
         # Phase 5: Deduplicate and Filter
         # ========================================
-        unique_documents = self._deduplicate_documents(all_documents)
+        # Deduplicate by URL, then filter to requested year range
+        filtered_docs = all_documents.dedup().filter_years(start_year, end_year)
         
-        # Filter to requested year range
-        filtered_docs = [
-            doc for doc in unique_documents
-            if doc.year is None or (start_year <= doc.year <= end_year)
-        ]
+        # Check all candidate links in one concurrent batch
+        if self.validate_pdf_links and len(filtered_docs):
+            validity = self._validate_pdf_urls(
+                [doc.pdf_url for doc in filtered_docs.documents]
+            )
+            filtered_docs = filtered_docs.where(
+                [validity.get(doc.pdf_url, True) for doc in filtered_docs.documents]
+            )
         
         # ========================================
         # Phase 6: Apply English-First Preference
         # ========================================
-        filtered_docs = self._apply_english_preference(filtered_docs)
-        
-        # Sort by year descending, then by confidence
-        filtered_docs.sort(key=lambda d: (d.year or 0, d.confidence_score), reverse=True)
+        preferred_docs = self._apply_english_preference(filtered_docs.documents)
         
-        # Limit results
-        final_documents = filtered_docs[:max_results]
+        # Sort by year descending, then by confidence, and limit results
+        final_documents = DocumentBuffer(preferred_docs).top(max_results)
         
         # Build notes
         if final_documents:
@@ -678,6 +1158,16 @@ class FinancialDocumentDiscoveryAgent:
         logger.info(f"Total unique documents found: {len(final_documents)}")
         return result
     
+    async def discover_documents_async(self, *args, **kwargs) -> DiscoveryResult:
+        """
+        Awaitable discover_documents for async callers (same arguments).
+        
+        Discovery runs in a worker thread of the running loop's default
+        executor; its crawl and PDF validation keep their own event loop
+        there, so the caller's loop is never blocked.
+        """
+        return await asyncio.to_thread(self.discover_documents, *args, **kwargs)
+    
     def _search_direct_pdfs(
         self,
         company: str,
@@ -692,6 +1182,7 @@ class FinancialDocumentDiscoveryAgent:
             return documents
         
         # Build targeted queries for each year and doc type
+        search_jobs: List[Tuple[str, int, str]] = []
         for year in range(end_year, start_year - 1, -1):
             for doc_type in doc_types[:3]:  # Limit doc types per year
                 queries = [
@@ -701,20 +1192,35 @@ class FinancialDocumentDiscoveryAgent:
                 ]
                 
                 for query in queries[:2]:  # Limit queries
-                    try:
-                        results = self._execute_serper_search(query)
-                        docs = self._extract_pdfs_from_search(
-                            company, results, year, doc_type
-                        )
-                        documents.extend(docs)
-                        time.sleep(self.request_delay / 2)
-                    except Exception as e:
-                        logger.warning(f"Search failed: {e}")
+                    search_jobs.append((query, year, doc_type))
+        
+        # Serper accepts a JSON array of queries and returns results in the
+        # same order, so each batch costs one round-trip
+        batches = [
+            search_jobs[i:i + SERPER_BATCH_SIZE]
+            for i in range(0, len(search_jobs), SERPER_BATCH_SIZE)
+        ]
+        
+        def run_batch(batch: List[Tuple[str, int, str]]) -> List[Dict]:
+            try:
+                return self._execute_serper_batch([query for query, _, _ in batch])
+            except Exception as e:
+                logger.warning(f"Search failed: {e}")
+                return []
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=6) as executor:
+            for batch, batch_results in zip(batches, executor.map(run_batch, batches)):
+                for (_, year, doc_type), results in zip(batch, batch_results):
+                    docs = self._extract_pdfs_from_search(
+                        company, results, year, doc_type
+                    )
+                    documents.extend(docs)
         
         return documents
     
     def _execute_serper_search(self, query: str) -> Dict:
         """Execute a Serper API search."""
+        self._serper_limiter.acquire()
         response = self.session.post(
             'https://google.serper.dev/search',
             headers={
@@ -733,6 +1239,28 @@ class FinancialDocumentDiscoveryAgent:
         else:
             raise Exception(f"Serper API error: {response.status_code}")
     
+    def _execute_serper_batch(self, queries: List[str]) -> List[Dict]:
+        """Execute several Serper searches in one request; results follow query order."""
+        self._serper_limiter.acquire()
+        response = self.session.post(
+            'https://google.serper.dev/search',
+            headers={
+                'X-API-KEY': self.serper_key,
+                'Content-Type': 'application/json'
+            },
+            json=[{'q': query, 'num': 15} for query in queries],
+            timeout=30
+        )
+        
+        if response.status_code != 200:
+            raise Exception(f"Serper API error: {response.status_code}")
+        
+        results = response.json()
+        # A single-query batch may come back as a bare object
+        if isinstance(results, dict):
+            results = [results]
+        return results
+    
     def _extract_pdfs_from_search(
         self,
         company: str,
@@ -742,6 +1270,7 @@ class FinancialDocumentDiscoveryAgent:
     ) -> List[DiscoveredDocument]:
         """Extract PDF documents from search results."""
         documents = []
+        candidates = []
         
         for result in results.get('organic', []):
             url = result.get('link', '')
@@ -758,17 +1287,27 @@ class FinancialDocumentDiscoveryAgent:
                 detected_year = year
             
             # Detect document type
-            doc_type_detected = detect_document_type(f"{title} {url}")
+            doc_type_detected = _detect_document_type(f"{title} {url}")
             
-            # Calculate confidence
             tier_matches = self._count_tier_matches(f"{title} {snippet} {url}")
-            confidence = calculate_confidence_score(
-                has_pdf=True,
-                has_year=detected_year is not None,
-                tier_matches=tier_matches,
-                has_url_path_match=True
-            )
-            
+            candidates.append((url, title, detected_year, doc_type_detected, tier_matches))
+        
+        if not candidates:
+            return documents
+        
+        # Calculate confidence for all results in one pass
+        confidences = calculate_confidence_scores_batch(
+            has_pdf=[True] * len(candidates),
+            has_year=[c[2] is not None for c in candidates],
+            has_url_path_match=[True] * len(candidates),
+            tier_counts=[
+                [c[4].get(tier, 0) for tier in range(9)] for c in candidates
+            ],
+        )
+        
+        for (url, title, detected_year, doc_type_detected, _), confidence in zip(
+            candidates, confidences
+        ):
             # Build document
             document = DiscoveredDocument(
                 company_name=company,
@@ -777,8 +1316,8 @@ class FinancialDocumentDiscoveryAgent:
                 document_type=doc_type_detected or doc_type,
                 pdf_url=url,
                 source_page_url=url,
-                language=detect_language(title),
-                confidence_score=confidence,
+                language=_detect_language(title),
+                confidence_score=float(confidence),
                 year=detected_year,
                 quarter=self._extract_quarter(title),
             )
@@ -817,19 +1356,14 @@ class FinancialDocumentDiscoveryAgent:
                 
                 for result in results.get('organic', []):
                     url = result.get('link', '')
-                    title = result.get('title', '').lower()
+                    title = result.get('title', '')
                     
                     # Skip PDFs - we want the page
                     if url.endswith('.pdf'):
                         continue
                     
                     # Look for IR page indicators
-                    ir_indicators = [
-                        'investor', 'ir.', '/ir/', '/ir-',
-                        'shareholders', 'annual-report', 'financial'
-                    ]
-                    
-                    if any(ind in url.lower() or ind in title for ind in ir_indicators):
+                    if IR_INDICATOR_RE.search(url) or IR_INDICATOR_RE.search(title):
                         logger.info(f"Found IR page: {url}")
                         self._pages_checked.append(url)
                         return url
@@ -848,7 +1382,6 @@ class FinancialDocumentDiscoveryAgent:
         doc_types: List[str],
         start_year: int,
         end_year: int,
-        depth: int = 0,
     ) -> List[DiscoveredDocument]:
         """
         Deep crawl the IR site to find actual PDF documents.
@@ -858,61 +1391,122 @@ class FinancialDocumentDiscoveryAgent:
         - Financial Results pages
         - Document archives
         - SEC Filings sections
-        """
-        documents = []
-        
-        if depth > self.max_crawl_depth:
-            return documents
         
-        # Normalize URL
-        normalized_url = ir_url.rstrip('/').lower()
-        if normalized_url in self._visited_urls:
-            return documents
+        Subpages are fetched concurrently (see _deep_crawl_ir_site_async).
+        """
+        return _run_coroutine(
+            self._deep_crawl_ir_site_async(
+                company, ir_url, doc_types, start_year, end_year
+            )
+        )
+    
+    async def _deep_crawl_ir_site_async(
+        self,
+        company: str,
+        ir_url: str,
+        doc_types: List[str],
+        start_year: int,
+        end_year: int,
+    ) -> List[DiscoveredDocument]:
+        """
+        Crawl the IR site with bounded concurrency.
         
-        self._visited_urls.add(normalized_url)
-        self._pages_checked.append(ir_url)
+        Subpages at each level are fetched in parallel, at most
+        max_crawl_concurrency per host. The rate-limit delay is applied
+        inside the per-host semaphore to stay polite to each site.
+        """
+        host_semaphores: Dict[str, asyncio.Semaphore] = {}
         
-        try:
-            logger.info(f"Crawling (depth {depth}): {ir_url}")
-            time.sleep(self.request_delay)
-            
-            response = self.session.get(ir_url, timeout=15)
-            response.raise_for_status()
+        async with httpx.AsyncClient(
+            headers=dict(self.session.headers),
+            timeout=15,
+            follow_redirects=True,
+        ) as client:
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # ========================================
-            # Step 1: Extract PDFs from current page
-            # ========================================
-            pdf_docs = self._extract_pdfs_from_page(
-                company, soup, ir_url, start_year, end_year
-            )
-            documents.extend(pdf_docs)
-            logger.info(f"Found {len(pdf_docs)} PDFs on {ir_url}")
-            
-            # ========================================
-            # Step 2: Find and crawl subpages
-            # ========================================
-            if depth < self.max_crawl_depth:
-                subpage_urls = self._find_document_subpages(soup, ir_url)
-                logger.info(f"Found {len(subpage_urls)} potential subpages to crawl")
+            async def crawl(url: str, depth: int) -> List[DiscoveredDocument]:
+                documents = []
+                
+                if depth > self.max_crawl_depth:
+                    return documents
+                
+                url_key = _canonical_url_key(url)
+                if url_key in self._visited_urls:
+                    return documents
                 
-                for subpage_url in subpage_urls[:5]:  # Limit subpages
-                    sub_docs = self._deep_crawl_ir_site(
-                        company, subpage_url, doc_types, 
-                        start_year, end_year, depth + 1
+                self._visited_urls.add(url_key)
+                self._pages_checked.append(url)
+                
+                try:
+                    host = urlparse(url).netloc.lower()
+                    semaphore = host_semaphores.setdefault(
+                        host, asyncio.Semaphore(self.max_crawl_concurrency)
+                    )
+                    async with semaphore:
+                        logger.info(f"Crawling (depth {depth}): {url}")
+                        await asyncio.sleep(self.request_delay)
+                        async with client.stream('GET', url) as response:
+                            response.raise_for_status()
+                            content_type = response.headers.get('Content-Type', '').lower()
+                            final_url = str(response.url)
+                            
+                            # Only HTML pages are worth parsing for links
+                            is_html = not content_type or 'html' in content_type
+                            content = await _read_capped(response, url) if is_html else None
+                    
+                    if not is_html:
+                        if 'pdf' in content_type:
+                            # The "page" is itself a document
+                            pdf_doc = self._document_from_pdf_url(
+                                company, final_url, url, start_year, end_year
+                            )
+                            if pdf_doc:
+                                documents.append(pdf_doc)
+                        else:
+                            logger.debug(f"Skipping non-HTML page ({content_type}): {url}")
+                        return documents
+                    
+                    if content is None:
+                        return documents
+                    
+                    links = extract_page_links(content)
+                    
+                    # ========================================
+                    # Step 1: Extract PDFs from current page
+                    # ========================================
+                    pdf_docs = self._extract_pdfs_from_page(
+                        company, links, url, start_year, end_year
                     )
-                    documents.extend(sub_docs)
+                    documents.extend(pdf_docs)
+                    logger.info(f"Found {len(pdf_docs)} PDFs on {url}")
+                    
+                    # ========================================
+                    # Step 2: Find and crawl subpages concurrently
+                    # ========================================
+                    if depth < self.max_crawl_depth:
+                        subpage_urls = self._find_document_subpages(links, url)
+                        logger.info(f"Found {len(subpage_urls)} potential subpages to crawl")
+                        
+                        results = await asyncio.gather(
+                            *[crawl(u, depth + 1) for u in subpage_urls[:5]],  # Limit subpages
+                            return_exceptions=True,
+                        )
+                        for sub_docs in results:
+                            if isinstance(sub_docs, BaseException):
+                                logger.warning(f"Subpage crawl failed: {sub_docs}")
+                                continue
+                            documents.extend(sub_docs)
+                    
+                except Exception as e:
+                    logger.warning(f"Error crawling {url}: {e}")
+                
+                return documents
             
-        except Exception as e:
-            logger.warning(f"Error crawling {ir_url}: {e}")
-        
-        return documents
+            return await crawl(ir_url, 0)
     
     def _extract_pdfs_from_page(
         self,
         company: str,
-        soup: BeautifulSoup,
+        links: List[PageLink],
         page_url: str,
         start_year: int,
         end_year: int,
@@ -922,8 +1516,8 @@ class FinancialDocumentDiscoveryAgent:
         rejected_third_party = 0
         
         # Find all links
-        for link in soup.find_all('a', href=True):
-            href = link['href']
+        for link in links:
+            href = link.href
             
             # Get the actual PDF URL
             pdf_url = self._resolve_pdf_url(href, page_url)
@@ -931,13 +1525,14 @@ class FinancialDocumentDiscoveryAgent:
                 continue
             
             # Skip duplicate URLs
-            if pdf_url.lower() in self._visited_urls:
+            pdf_key = _canonical_url_key(pdf_url)
+            if pdf_key in self._visited_urls:
                 continue
-            self._visited_urls.add(pdf_url.lower())
+            self._visited_urls.add(pdf_key)
             
             # Get link text and title
-            link_text = link.get_text(strip=True) or ""
-            title_attr = link.get('title', '')
+            link_text = link.text
+            title_attr = link.title
             combined_text = f"{link_text} {title_attr} {pdf_url}"
             
             # ========================================
@@ -980,6 +1575,39 @@ class FinancialDocumentDiscoveryAgent:
         
         return documents
     
+    def _document_from_pdf_url(
+        self,
+        company: str,
+        pdf_url: str,
+        source_page: str,
+        start_year: int,
+        end_year: int,
+    ) -> Optional[DiscoveredDocument]:
+        """Build a document for a crawl target that turned out to be a PDF."""
+        # The crawl already marked source_page as visited; only a redirect
+        # to some other, already seen URL is a duplicate
+        pdf_key = _canonical_url_key(pdf_url)
+        if pdf_key != _canonical_url_key(source_page) and pdf_key in self._visited_urls:
+            return None
+        self._visited_urls.add(pdf_key)
+        
+        if is_third_party_source(pdf_url):
+            return None
+        
+        title = self._extract_filename(pdf_url)
+        detected_year = extract_year_from_text(pdf_url)
+        if detected_year and not (start_year <= detected_year <= end_year):
+            return None
+        
+        return self._create_document(
+            company=company,
+            title=title,
+            pdf_url=pdf_url,
+            source_page=source_page,
+            combined_text=f"{title} {pdf_url}",
+            detected_year=detected_year,
+        )
+    
     def _resolve_pdf_url(self, href: str, base_url: str) -> Optional[str]:
         """
         Resolve a link to a direct PDF URL.
@@ -1010,39 +1638,72 @@ class FinancialDocumentDiscoveryAgent:
         
         return None
     
-    def _validate_pdf_url(self, url: str) -> bool:
+    def _validate_pdf_urls(self, urls: List[str]) -> Dict[str, bool]:
+        """Validate many PDF URLs concurrently. Returns url -> is_pdf."""
+        return _run_coroutine(self._validate_pdf_urls_async(urls))
+    
+    async def _validate_pdf_urls_async(self, urls: List[str]) -> Dict[str, bool]:
         """
-        Validate that a URL actually points to a PDF file.
-        Uses HEAD request to check content type without downloading.
+        Validate that each URL actually points to a PDF file.
+        
+        Tries HEAD first. If the server rejects HEAD (one of
+        HEAD_UNSUPPORTED_STATUSES, logged at debug level) or the
+        Content-Type is inconclusive, fetches only the first KB with a
+        ranged GET on the same pooled connection and checks the %PDF- magic
+        bytes, so HTML soft-404s served under a .pdf URL are rejected.
+        Requests share one client and run at most PDF_VALIDATION_CONCURRENCY
+        at a time.
         """
-        try:
-            response = self.session.head(url, timeout=5, allow_redirects=True)
-            content_type = response.headers.get('Content-Type', '').lower()
-            
-            # Check if content type indicates PDF
-            if 'application/pdf' in content_type:
-                return True
+        unique_urls = list(dict.fromkeys(urls))
+        semaphore = asyncio.Semaphore(PDF_VALIDATION_CONCURRENCY)
+        
+        async with httpx.AsyncClient(
+            headers=dict(self.session.headers),
+            timeout=5,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=50, keepalive_expiry=30),
+        ) as client:
             
-            # Some servers don't set proper content type, check URL
-            if response.status_code == 200 and '.pdf' in url.lower():
-                return True
+            async def validate(url: str) -> bool:
+                try:
+                    async with semaphore:
+                        response = await client.head(url)
+                        verdict = _head_verdict(
+                            response.status_code,
+                            response.headers.get('Content-Type', ''),
+                        )
+                        if verdict is not None:
+                            return verdict
+                        if response.status_code in HEAD_UNSUPPORTED_STATUSES:
+                            logger.debug(
+                                f"HEAD returned {response.status_code}, retrying with GET: {url}"
+                            )
+                        
+                        async with client.stream(
+                            'GET', url, headers={'Range': 'bytes=0-1023'}
+                        ) as response:
+                            head = await _read_prefix(response, 1024)
+                    return _is_pdf_response(response.headers.get('Content-Type', ''), head)
+                except Exception:
+                    return '.pdf' in url.lower()
             
-            return False
-        except Exception:
-            # If we can't validate, assume it's valid if URL looks like PDF
-            return '.pdf' in url.lower()
+            results = await asyncio.gather(*[validate(url) for url in unique_urls])
+        
+        return dict(zip(unique_urls, results))
     
     def _find_document_subpages(
         self,
-        soup: BeautifulSoup,
+        links: List[PageLink],
         base_url: str,
     ) -> List[str]:
         """Find links to pages that likely contain documents."""
         subpages = []
+        seen = set()
+        base_netloc = urlparse(base_url).netloc
         
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            link_text = link.get_text(strip=True).lower()
+        for link in links:
+            href = link.href
+            link_text = link.text.lower()
             
             # Skip PDFs and external links
             if href.endswith('.pdf'):
@@ -1050,36 +1711,34 @@ class FinancialDocumentDiscoveryAgent:
             if href.startswith('mailto:') or href.startswith('javascript:'):
                 continue
             
-            # Build absolute URL
-            abs_url = urljoin(base_url, href)
+            # Build absolute URL. Plain relative paths (no scheme, not
+            # protocol-relative) always stay on the base host.
+            if href.startswith(('http://', 'https://')):
+                abs_url = href
+                same_domain = None
+            else:
+                abs_url = urljoin(base_url, href)
+                is_relative = not href.startswith('//') and ':' not in href.partition('/')[0]
+                same_domain = True if is_relative else None
             
             # Check if link text suggests document page
-            text_match = any(
-                kw in link_text for kw in IR_SUBPAGE_KEYWORDS
-            )
+            text_match = _IR_SUBPAGE_KEYWORD_RE.search(link_text) is not None
             
             # Check if URL pattern suggests document page
-            url_match = any(
-                re.search(pattern, abs_url.lower()) 
-                for pattern in DOCUMENT_PAGE_URL_PATTERNS
-            )
+            url_match = _DOC_URL_RE.search(abs_url) is not None
             
             if text_match or url_match:
                 # Must be same domain
-                if urlparse(abs_url).netloc == urlparse(base_url).netloc:
-                    if abs_url not in self._visited_urls:
+                if same_domain is None:
+                    same_domain = urlparse(abs_url).netloc == base_netloc
+                if same_domain:
+                    # One key for both the visited check and de-duplication
+                    url_key = _canonical_url_key(abs_url)
+                    if url_key not in self._visited_urls and url_key not in seen:
+                        seen.add(url_key)
                         subpages.append(abs_url)
         
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_subpages = []
-        for url in subpages:
-            normalized = url.rstrip('/').lower()
-            if normalized not in seen:
-                seen.add(normalized)
-                unique_subpages.append(url)
-        
-        return unique_subpages
+        return subpages
     
     def _search_regulatory_sources(
         self,
@@ -1101,33 +1760,42 @@ class FinancialDocumentDiscoveryAgent:
             f'"{company}" annual report {end_year} filetype:pdf official',
         ]
         
-        for query in queries:
+        def run_search(query: str) -> Optional[Dict]:
             try:
-                results = self._execute_serper_search(query)
-                for result in results.get('organic', []):
-                    url = result.get('link', '')
-                    title = result.get('title', '')
-                    
-                    if '.pdf' not in url.lower():
-                        continue
-                    
-                    detected_year = extract_year_from_text(f"{title} {url}")
-                    if detected_year and not (start_year <= detected_year <= end_year):
-                        continue
-                    
-                    doc = self._create_document(
-                        company=company,
-                        title=title,
-                        pdf_url=url,
-                        source_page=url,
-                        combined_text=f"{title} {url}",
-                        detected_year=detected_year,
-                    )
-                    documents.append(doc)
-                
-                time.sleep(self.request_delay / 2)
+                return self._execute_serper_search(query)
             except Exception as e:
                 logger.warning(f"Regulatory search failed: {e}")
+                return None
+        
+        # Independent queries - run them together; the Serper rate limiter
+        # replaces the old inter-query sleep. Results are consumed in query
+        # order so deduplication stays deterministic.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            all_results = list(executor.map(run_search, queries))
+        
+        for results in all_results:
+            if results is None:
+                continue
+            for result in results.get('organic', []):
+                url = result.get('link', '')
+                title = result.get('title', '')
+                
+                if '.pdf' not in url.lower():
+                    continue
+                
+                detected_year = extract_year_from_text(f"{title} {url}")
+                if detected_year and not (start_year <= detected_year <= end_year):
+                    continue
+                
+                doc = self._create_document(
+                    company=company,
+                    title=title,
+                    pdf_url=url,
+                    source_page=url,
+                    combined_text=f"{title} {url}",
+                    detected_year=detected_year,
+                )
+                documents.append(doc)
         
         return documents
     
@@ -1146,15 +1814,18 @@ class FinancialDocumentDiscoveryAgent:
         documents = []
         
         try:
-            from .openrouter_fallback import OpenRouterFallbackRetriever
-            
             # Check if OpenRouter is configured
             openrouter_key = os.getenv("OPENROUTER_API_KEY") or os.getenv("OPENAI_API_KEY")
             if not openrouter_key:
                 logger.warning("OpenRouter fallback skipped: No API key configured")
                 return documents
             
-            retriever = OpenRouterFallbackRetriever(api_key=openrouter_key)
+            retriever = self._openrouter_retriever
+            if retriever is None or retriever.api_key != openrouter_key:
+                from openrouter_fallback import OpenRouterFallbackRetriever
+                retriever = OpenRouterFallbackRetriever(api_key=openrouter_key)
+                self._openrouter_retriever = retriever
+            
             result = retriever.retrieve_documents(
                 company=company,
                 doc_types=doc_types,
@@ -1208,10 +1879,11 @@ class FinancialDocumentDiscoveryAgent:
         detected_year: Optional[int],
     ) -> DiscoveredDocument:
         """Create a DiscoveredDocument with all metadata."""
-        tier_matches = self._count_tier_matches(combined_text)
+        # Tier counts and document type from one scan of the text
+        tier_counts, doc_type, _ = match_all_tiers(combined_text)
+        tier_matches = {tier: tier_counts[tier] for tier, _ in TIER_KEYWORDS_LOWER}
         
-        doc_type = detect_document_type(combined_text)
-        language = detect_language(title)
+        language = _detect_language(title)
         quarter = self._extract_quarter(title)
         
         confidence = calculate_confidence_score(
@@ -1238,41 +1910,13 @@ class FinancialDocumentDiscoveryAgent:
         )
     
     def _count_tier_matches(self, text: str) -> Dict[int, int]:
-        """Count keyword matches per tier."""
-        text_lower = text.lower()
-        matches = {}
-        
-        for tier, keywords in TIER_KEYWORDS.items():
-            count = 0
-            if tier == 8:  # Multilingual tier is a dict
-                for lang_keywords in keywords.values():
-                    for kw in lang_keywords:
-                        if kw.lower() in text_lower:
-                            count += 1
-            else:
-                for kw in keywords:
-                    if kw.lower() in text_lower:
-                        count += 1
-            matches[tier] = count
-        
-        return matches
+        """Count keyword matches per tier (each distinct keyword counts once)."""
+        counts = count_tier_matches(text)
+        return {tier: counts[tier] for tier, _ in TIER_KEYWORDS_LOWER}
     
     def _extract_quarter(self, text: str) -> Optional[str]:
         """Extract quarter from text."""
-        text_lower = text.lower()
-        if 'q1' in text_lower or 'first quarter' in text_lower:
-            return 'Q1'
-        elif 'q2' in text_lower or 'second quarter' in text_lower:
-            return 'Q2'
-        elif 'q3' in text_lower or 'third quarter' in text_lower:
-            return 'Q3'
-        elif 'q4' in text_lower or 'fourth quarter' in text_lower:
-            return 'Q4'
-        elif 'h1' in text_lower or 'half year' in text_lower or 'first half' in text_lower:
-            return 'H1'
-        elif 'h2' in text_lower or 'second half' in text_lower:
-            return 'H2'
-        return None
+        return _extract_quarter(text)
     
     def _build_reporting_period(self, text: str, year: Optional[int]) -> str:
         """Build reporting period string."""
@@ -1310,19 +1954,19 @@ class FinancialDocumentDiscoveryAgent:
         """
         from collections import defaultdict
         
-        # Group documents by year and type
-        grouped: Dict[tuple, List[DiscoveredDocument]] = defaultdict(list)
+        # Group documents by year and type, classifying each one once
+        grouped: Dict[tuple, List[Tuple[bool, DiscoveredDocument]]] = defaultdict(list)
         
         for doc in documents:
             key = (doc.year, doc.document_type)
-            grouped[key].append(doc)
+            grouped[key].append((_is_english_version(doc.pdf_url, doc.document_title), doc))
         
         result = []
         
         for key, docs in grouped.items():
             # Check if any English version exists for this year/type
-            english_docs = [d for d in docs if is_english_version(d.pdf_url, d.document_title)]
-            non_english_docs = [d for d in docs if not is_english_version(d.pdf_url, d.document_title)]
+            english_docs = [d for is_english, d in docs if is_english]
+            non_english_docs = [d for is_english, d in docs if not is_english]
             
             if english_docs:
                 # Prefer English version(s)
@@ -1339,28 +1983,12 @@ class FinancialDocumentDiscoveryAgent:
         
         logger.info(f"English preference: {len(documents)} -> {len(result)} documents after filtering")
         return result
-    
-    def _deduplicate_documents(
-        self,
-        documents: List[DiscoveredDocument],
-    ) -> List[DiscoveredDocument]:
-        """Remove duplicate documents by URL."""
-        seen_urls = set()
-        unique = []
-        
-        for doc in documents:
-            normalized_url = doc.pdf_url.lower().rstrip('/')
-            
-            if normalized_url not in seen_urls:
-                seen_urls.add(normalized_url)
-                unique.append(doc)
-        
-        return unique
 
 
 def discover_investor_documents(
     query: str,
     serper_api_key: Optional[str] = None,
+    progress: Optional[Callable[[str, int], None]] = None,
 ) -> Dict:
     """
     High-level function to discover documents from a natural language query.
@@ -1374,14 +2002,24 @@ def discover_investor_documents(
         "documents": [...],
         "notes": "string"
     }
+    
+    `progress` is passed to FinancialDocumentDiscoveryAgent.discover_documents.
     """
     # Parse query
     company, doc_types, start_year, end_year = _parse_query(query)
+    serper_api_key = serper_api_key or os.getenv("SERPER_API_KEY")
     
-    # Initialize agent
-    agent = FinancialDocumentDiscoveryAgent(
-        serper_api_key=serper_api_key or os.getenv("SERPER_API_KEY")
+    # Differently worded queries often parse to the same request
+    cache_key = (
+        normalize_query(company), tuple(doc_types), start_year, end_year, serper_api_key
     )
+    cached = _query_result_cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"Reusing discovery results for {company} {start_year}-{end_year}")
+        return cached
+    
+    # Initialize agent
+    agent = FinancialDocumentDiscoveryAgent(serper_api_key=serper_api_key)
     
     # Discover documents
     result = agent.discover_documents(
@@ -1389,9 +2027,24 @@ def discover_investor_documents(
         doc_types=doc_types,
         start_year=start_year,
         end_year=end_year,
+        progress=progress,
     )
     
-    return result.to_dict()
+    output = result.to_dict()
+    if output['documents']:
+        _query_result_cache.set(cache_key, output)
+    return output
+
+
+async def discover_investor_documents_async(
+    query: str,
+    serper_api_key: Optional[str] = None,
+    progress: Optional[Callable[[str, int], None]] = None,
+) -> Dict:
+    """Awaitable discover_investor_documents, run in a worker thread."""
+    return await asyncio.to_thread(
+        discover_investor_documents, query, serper_api_key=serper_api_key, progress=progress
+    )
 
 
 def _parse_query(query: str) -> Tuple[str, List[str], int, int]:
@@ -1399,13 +2052,13 @@ def _parse_query(query: str) -> Tuple[str, List[str], int, int]:
     query_lower = query.lower()
     
     # Extract year range
-    year_match = re.search(r'(\d{4})\s*(?:to|-)\s*(\d{4})', query)
+    year_match = _YEAR_RANGE_RE.search(query)
     if year_match:
         start_year = int(year_match.group(1))
         end_year = int(year_match.group(2))
     else:
         # Try single year
-        single_year = re.search(r'\b(20\d{2})\b', query)
+        single_year = _SINGLE_YEAR_RE.search(query)
         if single_year:
             end_year = int(single_year.group(1))
             start_year = end_year
@@ -1414,38 +2067,32 @@ def _parse_query(query: str) -> Tuple[str, List[str], int, int]:
             start_year = end_year - 5
     
     # Extract document types
-    doc_types = []
-    type_patterns = [
-        (r'annual\s*report', 'annual report'),
-        (r'quarterly\s*report', 'quarterly report'),
-        (r'quarterly\s*earnings', 'quarterly earnings'),
-        (r'financial\s*statements?', 'financial statements'),
-        (r'investor\s*presentation', 'investor presentation'),
-        (r'earnings\s*release', 'earnings release'),
-        (r'10-k', '10-K'),
-        (r'10-q', '10-Q'),
-        (r'20-f', '20-F'),
+    doc_types = [
+        doc_type for pattern, doc_type in QUERY_DOC_TYPE_PATTERNS
+        if pattern.search(query_lower)
     ]
     
-    for pattern, doc_type in type_patterns:
-        if re.search(pattern, query_lower):
-            doc_types.append(doc_type)
-    
     if not doc_types:
         doc_types = ['annual report']  # Default
     
-    # Extract company name
-    # Remove common phrases to find company name
-    company = query
-    for phrase in ['annual reports for', 'annual report for', 'reports for', 
-                   'from', 'to', 'between', str(start_year), str(end_year)]:
-        company = re.sub(phrase, '', company, flags=re.IGNORECASE)
+    # Extract company name: drop stop phrases and the requested years
+    # ("2020", "2020-2024") in one pass over the tokens
+    tokens = [t.strip(_QUERY_TOKEN_PUNCTUATION) for t in query.split()]
+    lowered = [t.lower() for t in tokens]
+    years = {str(start_year), str(end_year)}
     
-    # Also remove doc type phrases
-    for _, doc_type in type_patterns:
-        company = re.sub(doc_type, '', company, flags=re.IGNORECASE)
+    kept = []
+    i = 0
+    while i < len(tokens):
+        if tuple(lowered[i:i + 2]) in _QUERY_STOP_PHRASES:
+            i += 2
+            continue
+        token = lowered[i]
+        if (token,) not in _QUERY_STOP_PHRASES and not years.issuperset(token.split('-')):
+            kept.append(tokens[i])
+        i += 1
     
-    company = ' '.join(company.split()).strip()
+    company = ' '.join(t for t in kept if t)
     
     return company, doc_types, start_year, end_year
 
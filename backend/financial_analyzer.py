@@ -9,22 +9,196 @@ from typing import Dict, List, Optional
 import logging
 
 try:
-    import pandas as pd
     import numpy as np
-    HAS_PANDAS = True
+    HAS_NUMPY = True
 except ImportError:
-    HAS_PANDAS = False
+    HAS_NUMPY = False
+
+# Optional extra, not in requirements: only batches of _NUMBA_MIN_PERIODS
+# or more use it
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
 logger = logging.getLogger(__name__)
 
 
+# Input fields packed into a fixed-order vector per period
+_FIELDS = (
+    'revenue', 'net_income', 'total_assets', 'shareholders_equity',
+    'operating_income', 'gross_profit', 'nopat', 'invested_capital',
+    'current_assets', 'current_liabilities', 'inventory', 'cash_and_equivalents',
+    'total_debt', 'total_equity', 'ebit', 'interest_expense', 'ebitda',
+    'cogs', 'average_inventory', 'average_receivables',
+)
+
+# (category, ratio, numerator, denominator, scale, zero_numerator_allowed)
+# Ratios with zero_numerator_allowed=False are only reported when both inputs
+# are non-zero; the others only need both inputs present.
+_RATIO_SPECS = (
+    ('profitability', 'ROE', 'net_income', 'shareholders_equity', 100.0, False),
+    ('profitability', 'ROA', 'net_income', 'total_assets', 100.0, False),
+    ('profitability', 'gross_margin', 'gross_profit', 'revenue', 100.0, False),
+    ('profitability', 'operating_margin', 'operating_income', 'revenue', 100.0, False),
+    ('profitability', 'net_margin', 'net_income', 'revenue', 100.0, False),
+    ('profitability', 'ROIC', 'nopat', 'invested_capital', 100.0, True),
+    ('liquidity', 'current_ratio', 'current_assets', 'current_liabilities', 1.0, False),
+    ('liquidity', 'quick_ratio', 'quick_assets', 'current_liabilities', 1.0, True),
+    ('liquidity', 'cash_ratio', 'cash_and_equivalents', 'current_liabilities', 1.0, False),
+    ('leverage', 'debt_to_equity', 'total_debt', 'total_equity', 1.0, False),
+    ('leverage', 'interest_coverage', 'ebit', 'interest_expense', 1.0, False),
+    ('leverage', 'debt_to_ebitda', 'total_debt', 'ebitda', 1.0, False),
+    ('leverage', 'debt_ratio', 'total_debt', 'total_assets', 1.0, False),
+    ('efficiency', 'asset_turnover', 'revenue', 'total_assets', 1.0, False),
+    ('efficiency', 'inventory_turnover', 'cogs', 'average_inventory', 1.0, False),
+    ('efficiency', 'receivables_turnover', 'revenue', 'average_receivables', 1.0, False),
+)
+
+# Ratio names per category, in output order
+_CATEGORY_RATIOS: Dict[str, List[str]] = {}
+for _category, _name, *_ in _RATIO_SPECS:
+    _CATEGORY_RATIOS.setdefault(_category, []).append(_name)
+_CATEGORY_RATIOS['efficiency'].append('days_sales_outstanding')
+
+
+# Batches at least this large use the parallel numba kernel; smaller ones
+# (every real request) stay on numpy and never trigger a JIT compile
+_NUMBA_MIN_PERIODS = 4096
+
+if HAS_NUMBA:
+    # Kernel inputs: _FIELDS columns plus the derived quick_assets column,
+    # and per-ratio column indices / scale / zero_numerator_allowed.
+    _KERNEL_COLUMNS = _FIELDS + ('quick_assets',)
+    _KERNEL_NUMERATORS = np.array(
+        [_KERNEL_COLUMNS.index(spec[2]) for spec in _RATIO_SPECS], dtype=np.int64
+    )
+    _KERNEL_DENOMINATORS = np.array(
+        [_KERNEL_COLUMNS.index(spec[3]) for spec in _RATIO_SPECS], dtype=np.int64
+    )
+    _KERNEL_SCALES = np.array([spec[4] for spec in _RATIO_SPECS], dtype=np.float64)
+    _KERNEL_ZERO_OK = np.array([spec[5] for spec in _RATIO_SPECS], dtype=np.bool_)
+    
+    def _ratio_kernel_impl(columns, numerators, denominators, scales, zero_ok):
+        periods = columns.shape[0]
+        out = np.full((periods, numerators.shape[0]), np.nan)
+        for t in prange(periods):
+            for r in range(numerators.shape[0]):
+                numerator = columns[t, numerators[r]]
+                denominator = columns[t, denominators[r]]
+                if denominator != 0 and (zero_ok[r] or numerator != 0):
+                    value = (numerator / denominator) * scales[r]
+                    if np.isfinite(value):
+                        out[t, r] = value
+        return out
+    
+    # Compiled lazily on the first large batch (and cached on disk)
+    _ratio_kernel = njit(cache=True, parallel=True)(_ratio_kernel_impl)
+
+
+def _as_float(value) -> float:
+    """Numeric input as float; missing or non-numeric values become NaN."""
+    try:
+        return float('nan') if value is None else float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+def _pack(periods: List[Dict]) -> "np.ndarray":
+    """Stack per-period dicts into a (T, len(_FIELDS)) float64 matrix."""
+    return np.array(
+        [[_as_float(period.get(f)) for f in _FIELDS] for period in periods],
+        dtype=np.float64,
+    ).reshape(len(periods), len(_FIELDS))
+
+
+def _ratio_vectors(matrix: "np.ndarray") -> Dict[str, "np.ndarray"]:
+    """Compute every ratio as one (T,) vector; undefined entries are NaN."""
+    columns = {f: matrix[:, i] for i, f in enumerate(_FIELDS)}
+    columns['quick_assets'] = columns['current_assets'] - columns['inventory']
+    
+    ratios = {}
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if HAS_NUMBA and len(matrix) >= _NUMBA_MIN_PERIODS:
+            table = _ratio_kernel(
+                np.column_stack((matrix, columns['quick_assets'])),
+                _KERNEL_NUMERATORS, _KERNEL_DENOMINATORS,
+                _KERNEL_SCALES, _KERNEL_ZERO_OK,
+            )
+            for r, spec in enumerate(_RATIO_SPECS):
+                ratios[spec[1]] = table[:, r]
+        else:
+            for _, name, num, den, scale, zero_ok in _RATIO_SPECS:
+                numerator, denominator = columns[num], columns[den]
+                value = (numerator / denominator) * scale
+                valid = np.isfinite(value) & (denominator != 0)
+                if not zero_ok:
+                    valid &= numerator != 0
+                ratios[name] = np.where(valid, value, np.nan)
+        
+        # Days Sales Outstanding (DSO)
+        turnover = ratios['receivables_turnover']
+        ratios['days_sales_outstanding'] = np.where(turnover != 0, 365 / turnover, np.nan)
+    
+    return ratios
+
+
+def _ratio_values(financial_data: Dict) -> Dict[str, float]:
+    """Pure-Python evaluation of _RATIO_SPECS for a single period."""
+    values = {f: _as_float(financial_data.get(f)) for f in _FIELDS}
+    values['quick_assets'] = values['current_assets'] - values['inventory']
+    
+    ratios = {}
+    for _, name, num, den, scale, zero_ok in _RATIO_SPECS:
+        numerator, denominator = values[num], values[den]
+        if denominator != denominator or numerator != numerator:  # NaN
+            continue
+        if denominator == 0 or (not zero_ok and numerator == 0):
+            continue
+        ratios[name] = (numerator / denominator) * scale
+    
+    if ratios.get('receivables_turnover'):
+        ratios['days_sales_outstanding'] = 365 / ratios['receivables_turnover']
+    
+    return ratios
+
+
 class FinancialAnalyzer:
     """Calculate financial metrics from extracted data."""
     
     def __init__(self):
         """Initialize financial analyzer."""
-        if not HAS_PANDAS:
-            logger.warning("pandas not available - some calculations may be limited")
+        if not HAS_NUMPY:
+            logger.warning("numpy not available - some calculations may be limited")
+    
+    def _compute_ratios(self, periods: List[Dict]) -> List[Dict[str, float]]:
+        """All ratios for each period, skipping undefined ones."""
+        if not HAS_NUMPY:
+            return [_ratio_values(period) for period in periods]
+        
+        vectors = _ratio_vectors(_pack(periods))
+        return [
+            {
+                name: float(vector[t])
+                for name, vector in vectors.items()
+                if not np.isnan(vector[t])
+            }
+            for t in range(len(periods))
+        ]
+    
+    def _category_ratios(self, financial_data: Dict, category: str) -> Dict[str, float]:
+        ratios = {}
+        try:
+            computed = self._compute_ratios([financial_data])[0]
+            ratios = {
+                name: computed[name]
+                for name in _CATEGORY_RATIOS[category]
+                if name in computed
+            }
+        except Exception as e:
+            logger.error(f"Error calculating {category} ratios: {e}")
+        return ratios
     
     def calculate_profitability_ratios(self, financial_data: Dict) -> Dict[str, float]:
         """
@@ -35,39 +209,9 @@ class FinancialAnalyzer:
                            shareholders_equity, operating_income, gross_profit, etc.
         
         Returns:
-            Dict with calculated ratios
+            Dict with calculated ratios (ROE, ROA, gross/operating/net margin, ROIC)
         """
-        ratios = {}
-        
-        try:
-            # Return on Equity (ROE)
-            if financial_data.get('net_income') and financial_data.get('shareholders_equity'):
-                ratios['ROE'] = (financial_data['net_income'] / financial_data['shareholders_equity']) * 100
-            
-            # Return on Assets (ROA)
-            if financial_data.get('net_income') and financial_data.get('total_assets'):
-                ratios['ROA'] = (financial_data['net_income'] / financial_data['total_assets']) * 100
-            
-            # Gross Profit Margin
-            if financial_data.get('gross_profit') and financial_data.get('revenue'):
-                ratios['gross_margin'] = (financial_data['gross_profit'] / financial_data['revenue']) * 100
-            
-            # Operating Profit Margin
-            if financial_data.get('operating_income') and financial_data.get('revenue'):
-                ratios['operating_margin'] = (financial_data['operating_income'] / financial_data['revenue']) * 100
-            
-            # Net Profit Margin
-            if financial_data.get('net_income') and financial_data.get('revenue'):
-                ratios['net_margin'] = (financial_data['net_income'] / financial_data['revenue']) * 100
-            
-            # Return on Invested Capital (ROIC)
-            if all(k in financial_data for k in ['nopat', 'invested_capital']):
-                ratios['ROIC'] = (financial_data['nopat'] / financial_data['invested_capital']) * 100
-        
-        except Exception as e:
-            logger.error(f"Error calculating profitability ratios: {e}")
-        
-        return ratios
+        return self._category_ratios(financial_data, 'profitability')
     
     def calculate_liquidity_ratios(self, balance_sheet: Dict) -> Dict[str, float]:
         """
@@ -77,28 +221,9 @@ class FinancialAnalyzer:
             balance_sheet: Dict with current_assets, current_liabilities, cash, etc.
         
         Returns:
-            Dict with calculated ratios
+            Dict with calculated ratios (current, quick and cash ratio)
         """
-        ratios = {}
-        
-        try:
-            # Current Ratio
-            if balance_sheet.get('current_assets') and balance_sheet.get('current_liabilities'):
-                ratios['current_ratio'] = balance_sheet['current_assets'] / balance_sheet['current_liabilities']
-            
-            # Quick Ratio (Acid Test)
-            if all(k in balance_sheet for k in ['current_assets', 'inventory', 'current_liabilities']):
-                quick_assets = balance_sheet['current_assets'] - balance_sheet['inventory']
-                ratios['quick_ratio'] = quick_assets / balance_sheet['current_liabilities']
-            
-            # Cash Ratio
-            if balance_sheet.get('cash_and_equivalents') and balance_sheet.get('current_liabilities'):
-                ratios['cash_ratio'] = balance_sheet['cash_and_equivalents'] / balance_sheet['current_liabilities']
-        
-        except Exception as e:
-            logger.error(f"Error calculating liquidity ratios: {e}")
-        
-        return ratios
+        return self._category_ratios(balance_sheet, 'liquidity')
     
     def calculate_leverage_ratios(self, financial_data: Dict) -> Dict[str, float]:
         """
@@ -110,30 +235,7 @@ class FinancialAnalyzer:
         Returns:
             Dict with calculated ratios
         """
-        ratios = {}
-        
-        try:
-            # Debt-to-Equity Ratio
-            if financial_data.get('total_debt') and financial_data.get('total_equity'):
-                ratios['debt_to_equity'] = financial_data['total_debt'] / financial_data['total_equity']
-            
-            # Interest Coverage Ratio
-            if financial_data.get('ebit') and financial_data.get('interest_expense'):
-                if financial_data['interest_expense'] != 0:
-                    ratios['interest_coverage'] = financial_data['ebit'] / financial_data['interest_expense']
-            
-            # Debt-to-EBITDA
-            if financial_data.get('total_debt') and financial_data.get('ebitda'):
-                ratios['debt_to_ebitda'] = financial_data['total_debt'] / financial_data['ebitda']
-            
-            # Debt Ratio
-            if financial_data.get('total_debt') and financial_data.get('total_assets'):
-                ratios['debt_ratio'] = financial_data['total_debt'] / financial_data['total_assets']
-        
-        except Exception as e:
-            logger.error(f"Error calculating leverage ratios: {e}")
-        
-        return ratios
+        return self._category_ratios(financial_data, 'leverage')
     
     def calculate_efficiency_ratios(self, financial_data: Dict) -> Dict[str, float]:
         """
@@ -145,29 +247,7 @@ class FinancialAnalyzer:
         Returns:
             Dict with calculated ratios
         """
-        ratios = {}
-        
-        try:
-            # Asset Turnover
-            if financial_data.get('revenue') and financial_data.get('total_assets'):
-                ratios['asset_turnover'] = financial_data['revenue'] / financial_data['total_assets']
-            
-            # Inventory Turnover
-            if financial_data.get('cogs') and financial_data.get('average_inventory'):
-                ratios['inventory_turnover'] = financial_data['cogs'] / financial_data['average_inventory']
-            
-            # Receivables Turnover
-            if financial_data.get('revenue') and financial_data.get('average_receivables'):
-                ratios['receivables_turnover'] = financial_data['revenue'] / financial_data['average_receivables']
-            
-            # Days Sales Outstanding (DSO)
-            if 'receivables_turnover' in ratios and ratios['receivables_turnover'] != 0:
-                ratios['days_sales_outstanding'] = 365 / ratios['receivables_turnover']
-        
-        except Exception as e:
-            logger.error(f"Error calculating efficiency ratios: {e}")
-        
-        return ratios
+        return self._category_ratios(financial_data, 'efficiency')
     
     def calculate_all_metrics(self, financial_data: Dict) -> Dict[str, Dict[str, float]]:
         """
@@ -179,12 +259,33 @@ class FinancialAnalyzer:
         Returns:
             Dict organized by metric category
         """
-        return {
-            'profitability': self.calculate_profitability_ratios(financial_data),
-            'liquidity': self.calculate_liquidity_ratios(financial_data),
-            'leverage': self.calculate_leverage_ratios(financial_data),
-            'efficiency': self.calculate_efficiency_ratios(financial_data)
-        }
+        return self.calculate_all_metrics_batch([financial_data])[0]
+    
+    def calculate_all_metrics_batch(
+        self, periods: List[Dict]
+    ) -> List[Dict[str, Dict[str, float]]]:
+        """
+        Calculate all financial metrics for several periods at once.
+        
+        Args:
+            periods: List of financial_data dicts, one per period
+        
+        Returns:
+            List (one entry per period) of dicts organized by metric category
+        """
+        try:
+            computed = self._compute_ratios(periods)
+        except Exception as e:
+            logger.error(f"Error calculating financial metrics: {e}")
+            computed = [{} for _ in periods]
+        
+        return [
+            {
+                category: {name: ratios[name] for name in names if name in ratios}
+                for category, names in _CATEGORY_RATIOS.items()
+            }
+            for ratios in computed
+        ]
     
     def perform_trend_analysis(self, multi_year_data: List[Dict]) -> Dict:
         """
@@ -194,30 +295,32 @@ class FinancialAnalyzer:
             multi_year_data: List of financial_data dicts for different periods
         
         Returns:
-            Dict with trend analysis
+            Dict with trend analysis. Growth series are lists aligned with the
+            input periods (first entry None); undefined values are None.
         """
-        if not HAS_PANDAS:
-            logger.error("pandas required for trend analysis")
+        if not HAS_NUMPY:
+            logger.error("numpy required for trend analysis")
             return {}
         
         trends = {}
         
         try:
-            # Convert to DataFrame for easier analysis
-            df = pd.DataFrame(multi_year_data)
-            
-            # Year-over-Year growth rates
-            if 'revenue' in df.columns:
-                trends['revenue_yoy_growth'] = df['revenue'].pct_change() * 100
+            revenue = _period_column(multi_year_data, 'revenue')
+            net_income = _period_column(multi_year_data, 'net_income')
             
-            if 'net_income' in df.columns:
-                trends['net_income_yoy_growth'] = df['net_income'].pct_change() * 100
-            
-            # Compound Annual Growth Rate (CAGR)
-            if len(df) > 1 and 'revenue' in df.columns:
-                years = len(df) - 1
-                cagr = (((df['revenue'].iloc[-1] / df['revenue'].iloc[0]) ** (1/years)) - 1) * 100
-                trends['revenue_cagr'] = cagr
+            with np.errstate(divide='ignore', invalid='ignore'):
+                # Year-over-Year growth rates
+                if revenue is not None:
+                    trends['revenue_yoy_growth'] = _growth_series(revenue)
+                
+                if net_income is not None:
+                    trends['net_income_yoy_growth'] = _growth_series(net_income)
+                
+                # Compound Annual Growth Rate (CAGR)
+                if revenue is not None and len(revenue) > 1:
+                    years = len(revenue) - 1
+                    cagr = (((revenue[-1] / revenue[0]) ** (1 / years)) - 1) * 100
+                    trends['revenue_cagr'] = float(cagr) if np.isfinite(cagr) else None
         
         except Exception as e:
             logger.error(f"Error performing trend analysis: {e}")
@@ -225,6 +328,28 @@ class FinancialAnalyzer:
         return trends
 
 
+def _period_column(multi_year_data: List[Dict], key: str) -> Optional["np.ndarray"]:
+    """Extract one metric across periods as float64; None if no period has it."""
+    if not any(key in period for period in multi_year_data):
+        return None
+    return np.fromiter(
+        (
+            np.nan if period.get(key) is None else period[key]
+            for period in multi_year_data
+        ),
+        dtype=np.float64,
+        count=len(multi_year_data),
+    )
+
+
+def _growth_series(values: "np.ndarray") -> List[Optional[float]]:
+    """Period-over-period percent change, JSON-safe (NaN/inf -> None)."""
+    growth = np.empty_like(values)
+    growth[0] = np.nan
+    growth[1:] = np.diff(values) / values[:-1] * 100
+    return [float(g) if np.isfinite(g) else None for g in growth]
+
+
 def main():
     """Test the financial analyzer."""
     analyzer = FinancialAnalyzer()
@@ -240,7 +365,8 @@ def main():
     }
     
     print("Financial Analyzer initialized")
-    print(f"pandas available: {HAS_PANDAS}")
+    print(f"numpy available: {HAS_NUMPY}")
+    print(f"numba available: {HAS_NUMBA}")
     print("\nSample profitability ratios:")
     ratios = analyzer.calculate_profitability_ratios(sample_data)
     for metric, value in ratios.items():
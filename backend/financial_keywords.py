@@ -7,8 +7,23 @@ financial documents, regulatory filings, and investor reports worldwide.
 Contains 8 tiers of search terms organized by priority and specificity.
 """
 
-from typing import Dict, List, Set
+from functools import cache
+from itertools import chain
+from typing import Dict, FrozenSet, List, Optional, Tuple
 import re
+import sys
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
 
 # ==========================================================================
 # TIER 1 — UNIVERSAL FINANCIAL REPORT TERMS (HIGHEST PRIORITY)
@@ -167,15 +182,26 @@ TIER_6_FILE_PATTERNS = [
 
 # Year pattern regex for matching financial years
 YEAR_PATTERNS = [
-    r'(19|20)[0-9]{2}',           # Basic year: 2023, 2024
-    r'FY(19|20)[0-9]{2}',         # Fiscal year: FY2023
-    r'Q[1-4][-_]?(19|20)[0-9]{2}', # Quarter: Q1_2023, Q1-2023
-    r'(19|20)[0-9]{2}[-_]Q[1-4]', # Year-Quarter: 2023-Q1
-    r'H[1-2][-_]?(19|20)[0-9]{2}', # Half year: H1_2023
+    r'(?:19|20)[0-9]{2}',           # Basic year: 2023, 2024
+    r'FY(?:19|20)[0-9]{2}',         # Fiscal year: FY2023
+    r'Q[1-4][-_]?(?:19|20)[0-9]{2}', # Quarter: Q1_2023, Q1-2023
+    r'(?:19|20)[0-9]{2}[-_]Q[1-4]', # Year-Quarter: 2023-Q1
+    r'H[1-2][-_]?(?:19|20)[0-9]{2}', # Half year: H1_2023
 ]
 
 YEAR_PATTERN_COMBINED = re.compile(r'|'.join(YEAR_PATTERNS), re.IGNORECASE)
 
+# Cheap prefilter: text without any digit cannot contain a year
+_HAS_DIGIT = re.compile(r'\d')
+
+# Patterns used by extract_year_from_text, compiled once
+_FY_YEAR_RE = re.compile(r'FY\s*((?:19|20)[0-9]{2})', re.IGNORECASE)
+# Same as \b(20[0-9]{2}|19[89][0-9])\b, but with the leading \b checked
+# as a lookbehind after the first digit: a pattern that opens with a
+# literal lets the regex engine skip ahead to candidate '1'/'2'
+# characters instead of testing \b at every position of long texts
+_PLAIN_YEAR_RE = re.compile(r'(2(?<!\w2)0[0-9]{2}|1(?<!\w1)9[89][0-9])\b')
+
 # ==========================================================================
 # TIER 7 — COMMON URL PATH & DIRECTORY INDICATORS
 # ==========================================================================
@@ -289,40 +315,69 @@ TIER_8_MULTILINGUAL = {
     ],
 }
 
+def _lower_interned(keyword: str) -> str:
+    """Lowercased keyword, shared with the source literal when already lowercase."""
+    return sys.intern(keyword.lower())
+
+def _deep_intern(container) -> None:
+    """Intern every str in nested lists / dict values, in place."""
+    items = container.items() if isinstance(container, dict) else enumerate(container)
+    for key, value in list(items):
+        if isinstance(value, str):
+            container[key] = sys.intern(value)
+        elif isinstance(value, (list, dict)):
+            _deep_intern(value)
+
+def _intern_longest_first(keywords: List[str]) -> None:
+    """Intern a keyword list in place, deduplicated and longest first."""
+    keywords[:] = sorted(dict.fromkeys(map(sys.intern, keywords)), key=len, reverse=True)
+
+for _keywords in (
+    TIER_1_UNIVERSAL,
+    TIER_2_PERIODIC,
+    TIER_3_REGULATORY,
+    TIER_4_INVESTOR_RELATIONS,
+    TIER_5_ACCOUNTING,
+    *TIER_8_MULTILINGUAL.values(),
+):
+    _intern_longest_first(_keywords)
+
 # ==========================================================================
 # AGGREGATED KEYWORD SETS FOR EASY ACCESS
 # ==========================================================================
 
-def get_all_english_keywords() -> Set[str]:
+# Built once at import; the getters below hand out these shared constants
+_ALL_ENGLISH_KEYWORDS = frozenset(chain(
+    TIER_1_UNIVERSAL,
+    TIER_2_PERIODIC,
+    TIER_3_REGULATORY,
+    TIER_4_INVESTOR_RELATIONS,
+    TIER_5_ACCOUNTING,
+))
+_ALL_MULTILINGUAL_KEYWORDS = frozenset(chain.from_iterable(TIER_8_MULTILINGUAL.values()))
+_ALL_KEYWORDS = _ALL_ENGLISH_KEYWORDS | _ALL_MULTILINGUAL_KEYWORDS
+_URL_PATH_PATTERNS = tuple(TIER_7_URL_PATHS)
+_FILE_PATTERNS = tuple(TIER_6_FILE_PATTERNS)
+
+def get_all_english_keywords() -> FrozenSet[str]:
     """Get all English keywords from tiers 1-5."""
-    keywords = set()
-    keywords.update(TIER_1_UNIVERSAL)
-    keywords.update(TIER_2_PERIODIC)
-    keywords.update(TIER_3_REGULATORY)
-    keywords.update(TIER_4_INVESTOR_RELATIONS)
-    keywords.update(TIER_5_ACCOUNTING)
-    return keywords
-
-def get_all_multilingual_keywords() -> Set[str]:
+    return _ALL_ENGLISH_KEYWORDS
+
+def get_all_multilingual_keywords() -> FrozenSet[str]:
     """Get all non-English keywords from tier 8."""
-    keywords = set()
-    for lang_keywords in TIER_8_MULTILINGUAL.values():
-        keywords.update(lang_keywords)
-    return keywords
+    return _ALL_MULTILINGUAL_KEYWORDS
 
-def get_all_keywords() -> Set[str]:
+def get_all_keywords() -> FrozenSet[str]:
     """Get all keywords across all tiers and languages."""
-    keywords = get_all_english_keywords()
-    keywords.update(get_all_multilingual_keywords())
-    return keywords
+    return _ALL_KEYWORDS
 
-def get_url_path_patterns() -> List[str]:
+def get_url_path_patterns() -> Tuple[str, ...]:
     """Get URL path patterns for investor relations pages."""
-    return TIER_7_URL_PATHS.copy()
+    return _URL_PATH_PATTERNS
 
-def get_file_patterns() -> List[str]:
+def get_file_patterns() -> Tuple[str, ...]:
     """Get common file name patterns."""
-    return TIER_6_FILE_PATTERNS.copy()
+    return _FILE_PATTERNS
 
 # ==========================================================================
 # DOCUMENT TYPE DETECTION
@@ -360,6 +415,58 @@ DOCUMENT_TYPE_KEYWORDS = {
     ],
 }
 
+# Matched against lowercased text: normalize once here so the matchers
+# never lowercase keywords per call
+DOCUMENT_TYPE_KEYWORDS = {
+    doc_type: [_lower_interned(kw) for kw in keywords]
+    for doc_type, keywords in DOCUMENT_TYPE_KEYWORDS.items()
+}
+
+def _priority_index(groups: Dict[str, List[str]]) -> Dict[str, Tuple[int, str]]:
+    """
+    Reverse index of `groups`: lowercased keyword -> (priority, label) of
+    the first group (in dict order) that lists it.
+    """
+    index: Dict[str, Tuple[int, str]] = {}
+    for priority, (label, keywords) in enumerate(groups.items()):
+        for keyword in keywords:
+            index.setdefault(_lower_interned(keyword), (priority, label))
+    return index
+
+
+def _build_priority_automaton(groups: Dict[str, List[str]]):
+    """
+    Build an Aho-Corasick automaton over every keyword in `groups`.
+    
+    Each match yields the keyword's (priority, label) from _priority_index,
+    so a single scan resolves the winning group without looping over
+    groups. Returns None without pyahocorasick.
+    """
+    if not HAS_AHOCORASICK:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword_lower, payload in _priority_index(groups).items():
+        automaton.add_word(keyword_lower, payload)
+    automaton.make_automaton()
+    return automaton
+
+
+def _first_group_match(automaton, text_lower: str) -> Optional[str]:
+    """Label of the highest-priority group with a keyword in text_lower."""
+    best = None
+    for _, (priority, label) in automaton.iter(text_lower):
+        if best is None or priority < best[0]:
+            best = (priority, label)
+            if priority == 0:
+                break
+    return best[1] if best else None
+
+
+@cache
+def _document_type_automaton():
+    return _build_priority_automaton(DOCUMENT_TYPE_KEYWORDS)
+
 def detect_document_type(text: str) -> str:
     """
     Detect document type from text (title, URL, or content).
@@ -372,10 +479,15 @@ def detect_document_type(text: str) -> str:
     """
     text_lower = text.lower()
     
+    automaton = _document_type_automaton()
+    if automaton is not None:
+        # Single pass over the text for all document types
+        return _first_group_match(automaton, text_lower) or "financial_document"
+    
     # Check each document type in priority order
     for doc_type, keywords in DOCUMENT_TYPE_KEYWORDS.items():
         for keyword in keywords:
-            if keyword.lower() in text_lower:
+            if keyword in text_lower:
                 return doc_type
     
     return "financial_document"  # Default fallback
@@ -402,6 +514,17 @@ ENGLISH_URL_INDICATORS = [
     'locale=en',
 ]
 
+# ENGLISH_URL_INDICATORS as one alternation, with shared prefixes factored
+# so the regex engine tests each URL position once (used without
+# pyahocorasick; keep in sync with the list above)
+_ENGLISH_URL_RE = re.compile(
+    r'/en[/_-]|/eng/|/english/|[-_]en[./]|-eng\.|-english\.'
+    r'|lang=en|language=en|locale=en'
+)
+
+# Title markers that indicate English version
+ENGLISH_TITLE_INDICATORS = ('english', '(en)', '[en]', 'en version')
+
 # URL patterns that indicate non-English versions
 NON_ENGLISH_URL_INDICATORS = {
     'russian': ['/ru/', '-ru.', '_ru.', '/russian/', 'lang=ru'],
@@ -430,6 +553,35 @@ LANGUAGE_INDICATORS = {
     "korean": ["사업보고서", "재무제표"],
 }
 
+# Lowercased once, as DOCUMENT_TYPE_KEYWORDS
+LANGUAGE_INDICATORS = {
+    language: [_lower_interned(ind) for ind in indicators]
+    for language, indicators in LANGUAGE_INDICATORS.items()
+}
+
+@cache
+def _language_automaton():
+    return _build_priority_automaton(LANGUAGE_INDICATORS)
+
+# (language, indicators) in priority order, and the subset of indicators
+# that can match pure-ASCII text
+_LANGUAGE_INDICATORS_LOWER = [
+    (language, tuple(indicators))
+    for language, indicators in LANGUAGE_INDICATORS.items()
+]
+_ASCII_LANGUAGE_INDICATORS = [
+    (language, ascii_indicators)
+    for language, indicators in _LANGUAGE_INDICATORS_LOWER
+    if (ascii_indicators := tuple(ind for ind in indicators if ind.isascii()))
+]
+
+@cache
+def _url_language_automaton():
+    # English URL indicators take priority over every non-English language
+    return _build_priority_automaton(
+        {"english": ENGLISH_URL_INDICATORS, **NON_ENGLISH_URL_INDICATORS}
+    )
+
 def detect_language_from_url(url: str) -> str:
     """
     Detect language from URL patterns.
@@ -442,10 +594,13 @@ def detect_language_from_url(url: str) -> str:
     """
     url_lower = url.lower()
     
+    automaton = _url_language_automaton()
+    if automaton is not None:
+        return _first_group_match(automaton, url_lower)
+    
     # Check for English indicators first
-    for indicator in ENGLISH_URL_INDICATORS:
-        if indicator in url_lower:
-            return "english"
+    if _ENGLISH_URL_RE.search(url_lower):
+        return "english"
     
     # Check for non-English indicators
     for language, indicators in NON_ENGLISH_URL_INDICATORS.items():
@@ -474,10 +629,20 @@ def detect_language(text: str, url: str = "") -> str:
     
     text_lower = text.lower()
     
-    # Check text content for language indicators
-    for language, indicators in LANGUAGE_INDICATORS.items():
+    automaton = _language_automaton()
+    if automaton is not None:
+        return _first_group_match(automaton, text_lower) or "english"
+    
+    # Check text content for language indicators. Pure-ASCII text
+    # (an O(1) check) cannot contain Cyrillic, CJK or accented indicators,
+    # so only the ASCII-only indicators need to be scanned.
+    if text_lower.isascii():
+        candidates = _ASCII_LANGUAGE_INDICATORS
+    else:
+        candidates = _LANGUAGE_INDICATORS_LOWER
+    for language, indicators in candidates:
         for indicator in indicators:
-            if indicator.lower() in text_lower:
+            if indicator in text_lower:
                 return language
     
     return "english"  # Default to English
@@ -494,26 +659,34 @@ def is_english_version(url: str, title: str = "") -> bool:
         True if likely English version
     """
     url_lower = url.lower()
-    title_lower = title.lower() if title else ""
+    
+    # One scan of the URL finds both English and non-English indicators
+    automaton = _url_language_automaton()
+    if automaton is not None:
+        url_language = _first_group_match(automaton, url_lower)
+        has_english_url = url_language == "english"
+        has_non_english_url = url_language is not None and not has_english_url
+    else:
+        has_english_url = _ENGLISH_URL_RE.search(url_lower) is not None
+        has_non_english_url = any(
+            ind in url_lower
+            for indicators in NON_ENGLISH_URL_INDICATORS.values()
+            for ind in indicators
+        )
     
     # Check for explicit English indicators
-    for indicator in ENGLISH_URL_INDICATORS:
-        if indicator in url_lower:
-            return True
+    if has_english_url:
+        return True
     
     # Check title for English keywords
-    english_title_indicators = ['english', '(en)', '[en]', 'en version']
-    for indicator in english_title_indicators:
-        if indicator in title_lower:
-            return True
+    if title:
+        title_lower = title.lower()
+        for indicator in ENGLISH_TITLE_INDICATORS:
+            if indicator in title_lower:
+                return True
     
     # If no non-English indicators found, assume English
-    for lang, indicators in NON_ENGLISH_URL_INDICATORS.items():
-        for indicator in indicators:
-            if indicator in url_lower:
-                return False
-    
-    return True  # Default: assume English if no indicators
+    return not has_non_english_url
 
 def get_language_preference_note(language: str, english_available: bool) -> str:
     """
@@ -538,6 +711,18 @@ def get_language_preference_note(language: str, english_available: bool) -> str:
 # CONFIDENCE SCORING
 # ==========================================================================
 
+# Tier-based scoring weights (higher tiers = higher priority)
+TIER_WEIGHTS = {
+    1: 0.25,  # Universal terms - highest weight
+    2: 0.20,  # Periodic terms
+    3: 0.18,  # Regulatory terms
+    4: 0.12,  # IR navigation
+    5: 0.10,  # Accounting terms
+    6: 0.05,  # File patterns
+    7: 0.05,  # URL paths
+    8: 0.15,  # Multilingual (important for global coverage)
+}
+
 def calculate_confidence_score(
     has_pdf: bool,
     has_year: bool,
@@ -575,28 +760,103 @@ def calculate_confidence_score(
     if has_url_path_match:
         score += 0.1
     
-    # Tier-based scoring (higher tiers = higher priority)
-    tier_weights = {
-        1: 0.25,  # Universal terms - highest weight
-        2: 0.20,  # Periodic terms
-        3: 0.18,  # Regulatory terms
-        4: 0.12,  # IR navigation
-        5: 0.10,  # Accounting terms
-        6: 0.05,  # File patterns
-        7: 0.05,  # URL paths
-        8: 0.15,  # Multilingual (important for global coverage)
-    }
-    
+    # Tier-based scoring
     for tier, count in tier_matches.items():
-        if tier in tier_weights and count > 0:
-            score += tier_weights[tier] * min(count, 3) / 3  # Cap at 3 matches
+        if count > 0:
+            weight = TIER_WEIGHTS.get(tier)
+            if weight is not None:
+                score += weight * min(count, 3) / 3  # Cap at 3 matches
     
     return min(score, 1.0)
 
+def calculate_confidence_scores_batch(
+    has_pdf,
+    has_year,
+    has_url_path_match,
+    tier_counts,
+):
+    """
+    Vectorized calculate_confidence_score for many candidates at once.
+    
+    Args:
+        has_pdf: (N,) booleans
+        has_year: (N,) booleans
+        has_url_path_match: (N,) booleans
+        tier_counts: (N, 9) match counts; column t holds tier t (column 0 unused)
+        
+    Returns:
+        (N,) float64 array of scores, identical to calling
+        calculate_confidence_score per candidate (a list without numpy)
+    """
+    if not HAS_NUMPY:
+        return [
+            calculate_confidence_score(
+                pdf, year, {tier: counts[tier] for tier in TIER_WEIGHTS}, url
+            )
+            for pdf, year, url, counts in zip(has_pdf, has_year, has_url_path_match, tier_counts)
+        ]
+    
+    capped = np.clip(np.asarray(tier_counts).reshape(-1, 9), 0, 3)
+    
+    # Same summation order as the scalar function, so scores match exactly
+    scores = np.zeros(len(capped))
+    scores += np.where(has_pdf, 0.3, 0.0)
+    scores += np.where(has_year, 0.2, 0.0)
+    scores += np.where(has_url_path_match, 0.1, 0.0)
+    for tier, weight in sorted(TIER_WEIGHTS.items()):
+        scores += weight * capped[:, tier] / 3
+    
+    return np.minimum(scores, 1.0)
+
 # ==========================================================================
 # SEARCH QUERY BUILDERS
 # ==========================================================================
 
+# Search terms per report type; None is the fallback for other types
+_QUERY_BASE_TERMS = {
+    "annual": ("annual report", "10-K", "financial statements", "annual filing"),
+    "quarterly": ("quarterly report", "10-Q", "quarterly results", "Q1 Q2 Q3 Q4"),
+    "interim": ("interim report", "half-year report", "semi-annual"),
+    None: ("financial statements", "investor relations", "financial report"),
+}
+_QUERY_BASE_TERMS["10-k"] = _QUERY_BASE_TERMS["annual"]
+_QUERY_BASE_TERMS["10-q"] = _QUERY_BASE_TERMS["quarterly"]
+
+
+def _build_query_templates(
+    report_type: Optional[str], with_year: bool
+) -> Tuple[Tuple[str, bool, str], ...]:
+    """
+    Query templates for one report type as (head, uses_year, tail) parts.
+    
+    A query is company + head [+ year] + tail, which is cheaper to fill in
+    than str.format on every call.
+    """
+    if with_year:
+        templates = [(f" {term} ", True, " filetype:pdf") for term in _QUERY_BASE_TERMS[report_type]]
+    else:
+        templates = [(f" {term}", False, " filetype:pdf") for term in _QUERY_BASE_TERMS[report_type]]
+    
+    # Add investor relations page query
+    templates.append((" investor relations reports", False, ""))
+    
+    # Add SEC-specific query for US companies
+    if report_type in ("annual", "10-k"):
+        templates.append((" SEC 10-K filing ", with_year, " site:sec.gov"))
+    
+    return tuple(templates)
+
+
+# has_year -> report_type -> query templates, specialized once at import
+_QUERY_TEMPLATES = {
+    with_year: {
+        report_type: _build_query_templates(report_type, with_year)
+        for report_type in _QUERY_BASE_TERMS
+    }
+    for with_year in (False, True)
+}
+
+
 def build_comprehensive_search_queries(
     company: str,
     year: int = None,
@@ -613,36 +873,13 @@ def build_comprehensive_search_queries(
     Returns:
         List of search query strings
     """
-    queries = []
     year_str = str(year) if year else ""
-    
-    # Query templates based on report type
-    if report_type in ["annual", "10-k"]:
-        base_terms = ["annual report", "10-K", "financial statements", "annual filing"]
-    elif report_type in ["quarterly", "10-q"]:
-        base_terms = ["quarterly report", "10-Q", "quarterly results", "Q1 Q2 Q3 Q4"]
-    elif report_type == "interim":
-        base_terms = ["interim report", "half-year report", "semi-annual"]
-    else:
-        base_terms = ["financial statements", "investor relations", "financial report"]
-    
-    # Build queries with different combinations
-    for term in base_terms:
-        # Basic query
-        query = f"{company} {term}"
-        if year_str:
-            query += f" {year_str}"
-        query += " filetype:pdf"
-        queries.append(query)
-    
-    # Add investor relations page query
-    queries.append(f"{company} investor relations reports")
-    
-    # Add SEC-specific query for US companies
-    if report_type in ["annual", "10-k"]:
-        queries.append(f"{company} SEC 10-K filing {year_str} site:sec.gov")
-    
-    return queries
+    templates_by_type = _QUERY_TEMPLATES[bool(year_str)]
+    templates = templates_by_type.get(report_type) or templates_by_type[None]
+    return [
+        f"{company}{head}{year_str}{tail}" if uses_year else f"{company}{head}{tail}"
+        for head, uses_year, tail in templates
+    ]
 
 def extract_year_from_text(text: str) -> int:
     """
@@ -654,13 +891,17 @@ def extract_year_from_text(text: str) -> int:
     Returns:
         Year as integer, or None if not found
     """
+    # Most link texts carry no digits at all - skip the year regexes
+    if not _HAS_DIGIT.search(text):
+        return None
+    
     # Try to find FY pattern first (more specific)
-    fy_match = re.search(r'FY\s*(20[0-9]{2}|19[0-9]{2})', text, re.IGNORECASE)
+    fy_match = _FY_YEAR_RE.search(text)
     if fy_match:
         return int(fy_match.group(1))
     
     # Try basic year pattern
-    year_match = re.search(r'\b(20[0-9]{2}|19[8-9][0-9])\b', text)
+    year_match = _PLAIN_YEAR_RE.search(text)
     if year_match:
         return int(year_match.group(1))
     
@@ -679,6 +920,158 @@ TIER_KEYWORDS = {
     8: TIER_8_MULTILINGUAL,
 }
 
+# Tier keywords lowercased once: (tier, keywords) in TIER_KEYWORDS order,
+# with tier 8's per-language lists flattened
+TIER_KEYWORDS_LOWER: List[Tuple[int, Tuple[str, ...]]] = [
+    (
+        tier,
+        tuple(
+            _lower_interned(kw)
+            for kw in (
+                chain.from_iterable(keywords.values())
+                if isinstance(keywords, dict) else keywords
+            )
+        ),
+    )
+    for tier, keywords in TIER_KEYWORDS.items()
+]
+
+
+# Flat keyword -> tier lookup (no keyword is listed in more than one tier)
+KEYWORD_TO_TIER: Dict[str, int] = {}
+for _tier, _keywords in TIER_KEYWORDS_LOWER:
+    for _keyword in _keywords:
+        KEYWORD_TO_TIER.setdefault(_keyword, _tier)
+
+
+@cache
+def _tier_keyword_automaton():
+    """
+    Aho-Corasick automaton over every tier keyword (value: the keyword).
+    
+    One shared keyword trie for scanning text against every tier at once;
+    None without pyahocorasick.
+    """
+    if not HAS_AHOCORASICK:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for kw in KEYWORD_TO_TIER:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+def count_tier_matches(text: str) -> List[int]:
+    """
+    Count distinct keyword matches per tier in one scan of the text.
+    
+    Args:
+        text: Text to analyze (title, snippet, URL)
+        
+    Returns:
+        List of 9 counts indexed by tier number (index 0 unused)
+    """
+    text_lower = text.lower()
+    counts = [0] * 9
+    
+    automaton = _tier_keyword_automaton()
+    if automaton is not None:
+        for kw in {kw for _, kw in automaton.iter(text_lower)}:
+            counts[KEYWORD_TO_TIER[kw]] += 1
+        return counts
+    
+    for tier, keywords in TIER_KEYWORDS_LOWER:
+        counts[tier] += sum(1 for kw in keywords if kw in text_lower)
+    return counts
+
+
+@cache
+def _combined_keyword_automaton():
+    """
+    Aho-Corasick automaton over tier, document type and language keywords.
+
+    Each value is (keyword, tier or 0, document type (priority, label) or
+    None, language (priority, label) or None), so one scan feeds
+    match_all_tiers. None without pyahocorasick.
+    """
+    if not HAS_AHOCORASICK:
+        return None
+
+    doc_types = _priority_index(DOCUMENT_TYPE_KEYWORDS)
+    languages = _priority_index(LANGUAGE_INDICATORS)
+    automaton = ahocorasick.Automaton()
+    for kw in KEYWORD_TO_TIER.keys() | doc_types.keys() | languages.keys():
+        automaton.add_word(
+            kw,
+            (kw, KEYWORD_TO_TIER.get(kw, 0), doc_types.get(kw), languages.get(kw)),
+        )
+    automaton.make_automaton()
+    return automaton
+
+
+def match_all_tiers(text: str) -> Tuple[List[int], str, str]:
+    """
+    Tier counts, document type and language of a text in a single scan.
+
+    Equivalent to (count_tier_matches(text), detect_document_type(text),
+    detect_language(text)).
+
+    Args:
+        text: Text to analyze (title, snippet, URL)
+
+    Returns:
+        Tuple of (9 tier counts indexed by tier number, document type,
+        language)
+    """
+    automaton = _combined_keyword_automaton()
+    if automaton is None:
+        return count_tier_matches(text), detect_document_type(text), detect_language(text)
+
+    # Each distinct keyword counts once
+    matched = {payload[0]: payload for _, payload in automaton.iter(text.lower())}
+    
+    counts = [0] * 9
+    doc_type = language = None
+    for _, tier, doc_payload, lang_payload in matched.values():
+        if tier:
+            counts[tier] += 1
+        if doc_payload is not None and (doc_type is None or doc_payload < doc_type):
+            doc_type = doc_payload
+        if lang_payload is not None and (language is None or lang_payload < language):
+            language = lang_payload
+
+    return (
+        counts,
+        doc_type[1] if doc_type else "financial_document",
+        language[1] if language else "english",
+    )
+
+# Register every keyword literal in the interpreter's intern table so the
+# lowercased lookup tables above and callers in other modules share one
+# object per keyword
+for _container in (
+    TIER_6_FILE_PATTERNS,
+    TIER_7_URL_PATHS,
+    ENGLISH_URL_INDICATORS,
+    NON_ENGLISH_URL_INDICATORS,
+):
+    _deep_intern(_container)
+
+
+def warmup() -> None:
+    """
+    Build the keyword automatons ahead of the first request.
+    
+    They are otherwise built lazily on first use so importing this module
+    stays cheap; call this from a startup hook or background thread.
+    """
+    _document_type_automaton()
+    _language_automaton()
+    _url_language_automaton()
+    _tier_keyword_automaton()
+    _combined_keyword_automaton()
+
 
 if __name__ == "__main__":
     # Test the module
@@ -14,29 +14,152 @@ BACKEND_DIR = Path(__file__).parent.absolute()
 if str(BACKEND_DIR) not in sys.path:
     sys.path.insert(0, str(BACKEND_DIR))
 
-from typing import Optional, List, Dict
+import asyncio
+import concurrent.futures
+import json
+import logging
+import logging.handlers
+import queue
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional, List, Dict
 from datetime import datetime
 from fastapi.encoders import jsonable_encoder
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Header
+from fastapi.datastructures import Default
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Import OpenAI + Serper hybrid report finder
 from openai_report_finder import OpenAISerperReportFinder
 
+# Import document discovery agent
+from document_discovery_agent import (
+    FinancialDocumentDiscoveryAgent,
+    discover_investor_documents,
+    discover_investor_documents_async,
+)
+from financial_keywords import warmup as warmup_keyword_matchers
+
+# Import company resolution and financial analysis helpers
+from company_resolver import get_resolver
+from ticker_parser import TickerParser
+from report_generator import FinancialReportGenerator
+from accounting_standards import AccountingStandardMapper
+
 # Import Clerk authentication
 from auth import get_current_user, get_optional_user
 
+# Process-local cache for discovery/search results
+from response_cache import TTLCache, make_cache_key, normalize_query
+
 # Load environment variables
 load_dotenv()
 
+# Configure logging (LOG_LEVEL=WARNING in production)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logging.getLogger().setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Settings:
+    """API keys and provider settings, read from the environment once."""
+    openai_api_key: Optional[str] = None
+    serper_api_key: Optional[str] = None
+    tavily_api_key: Optional[str] = None
+    openai_provider: str = "openai"
+    openai_base_url: str = ""
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls(
+            openai_api_key=os.getenv("OPENAI_API_KEY"),
+            serper_api_key=os.getenv("SERPER_API_KEY"),
+            tavily_api_key=os.getenv("TAVILY_API_KEY"),
+            openai_provider=os.getenv("OPENAI_PROVIDER", "openai"),
+            openai_base_url=os.getenv("OPENAI_BASE_URL", ""),
+        )
+
+
+# Replaced (not mutated) by POST /settings after it rewrites .env
+settings = Settings.from_env()
+
+def _start_queued_logging() -> logging.handlers.QueueListener:
+    """
+    Route root log records through a queue to the configured handlers.
+    
+    Request handlers then only enqueue records; formatting and the
+    stdout/stderr writes (which can block on a full pipe) happen on the
+    listener's thread.
+    """
+    root = logging.getLogger()
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, *root.handlers, respect_handler_level=True
+    )
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+
+def _stop_queued_logging(listener: logging.handlers.QueueListener) -> None:
+    """Flush queued records and hand the handlers back to the root logger."""
+    listener.stop()
+    logging.getLogger().handlers = list(listener.handlers)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared resources on startup and release them on shutdown."""
+    log_listener = _start_queued_logging()
+    # Discovery and search make blocking HTTP calls (Serper, Tavily, OpenAI,
+    # crawled pages); their *_async entry points run them on this pool (the
+    # loop's default executor) so the event loop stays free
+    app.state.discovery_pool = concurrent.futures.ThreadPoolExecutor(
+        max_workers=32, thread_name_prefix="discover"
+    )
+    asyncio.get_running_loop().set_default_executor(app.state.discovery_pool)
+    # Build the keyword automatons in the background so the first discovery
+    # request doesn't pay for it, without delaying startup
+    app.state.discovery_pool.submit(warmup_keyword_matchers)
+    yield
+    app.state.discovery_pool.shutdown(wait=False, cancel_futures=True)
+    await close_async_supabase_client()
+    _stop_queued_logging(log_listener)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (C-accelerated, compact output)."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Investor-Report-Finder API",
     description="Search for investor relations reports using ticker symbols or natural language",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan,
+    # Wrapped in Default() so routes with a response_model keep FastAPI's
+    # own Pydantic-to-bytes serialization where available; everything
+    # else is rendered by orjson instead of json.dumps
+    default_response_class=Default(ORJSONResponse if HAS_ORJSON else JSONResponse),
 )
 
 # Configure CORS - Allow all origins for production
@@ -48,6 +171,187 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON responses (document lists with long URLs/titles shrink
+# ~70-85%); event streams are excluded by GZipMiddleware itself
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+# Stateless helpers shared by all requests
+company_resolver = get_resolver()
+ticker_parser = TickerParser()
+report_generator = FinancialReportGenerator()
+standards_mapper = AccountingStandardMapper()
+
+
+# Repeated prompts are answered from this cache instead of re-running the
+# Serper/OpenAI pipeline. Only non-empty results are stored, so transient
+# upstream failures are retried on the next request.
+RESPONSE_CACHE_TTL_SECONDS = 3600
+response_cache = TTLCache(maxsize=10_000, ttl=RESPONSE_CACHE_TTL_SECONDS)
+
+
+def _cache_lookup(cache_key: str, cache_control: Optional[str]):
+    """Cached result for cache_key, unless the client sent no-cache/no-store."""
+    directives = (cache_control or "").lower()
+    if "no-cache" in directives or "no-store" in directives:
+        return None
+    return response_cache.get(cache_key)
+
+
+def _cache_store(cache_key: str, result, cache_control: Optional[str]) -> None:
+    """Cache a result, unless the client sent no-store."""
+    if "no-store" not in (cache_control or "").lower():
+        response_cache.set(cache_key, result)
+
+
+@lru_cache(maxsize=50_000)
+def _resolve_company_cached(query_key: str, max_results: int):
+    """
+    Autocomplete matches and ambiguity for a normalized query.
+    
+    The frontend calls /api/resolve-company on every keystroke, so the
+    same prefixes repeat constantly; the mapping is static per process.
+    """
+    matches, is_ambiguous = company_resolver.resolve_with_ambiguity(
+        query_key,
+        max_results=max_results,
+        min_score=0.5  # Lower threshold for autocomplete
+    )
+    return tuple(matches), is_ambiguous
+
+
+# Discovery/search runs in progress, by cache key. Identical requests that
+# arrive while one is running await the same task instead of starting
+# their own Serper/OpenAI pipeline.
+_inflight: Dict[str, asyncio.Task] = {}
+
+
+async def _single_flight(cache_key: str, run):
+    """
+    Await run() once per cache key across concurrent requests.
+    
+    The shared task is shielded, so one client disconnecting doesn't
+    cancel it for the others.
+    """
+    task = _inflight.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(run())
+        _inflight[cache_key] = task
+        
+        def forget(done):
+            if _inflight.get(cache_key) is done:
+                del _inflight[cache_key]
+        
+        task.add_done_callback(forget)
+    return await asyncio.shield(task)
+
+
+# /api/verify-company results per (ticker, company name); the mapping only
+# changes on redeploy, so a day-long TTL just bounds memory
+VERIFY_CACHE_TTL_SECONDS = 24 * 3600
+verify_cache = TTLCache(maxsize=100_000, ttl=VERIFY_CACHE_TTL_SECONDS)
+
+
+@lru_cache(maxsize=32)
+def get_report_finder(
+    openai_key: Optional[str],
+    serper_key: Optional[str],
+    base_url: Optional[str],
+) -> OpenAISerperReportFinder:
+    """
+    Report finder for a set of credentials, reused across requests.
+    
+    The finder keeps no per-request state, so sharing it keeps its OpenAI
+    and OpenRouter clients (and their connection pools) warm.
+    """
+    return OpenAISerperReportFinder(
+        openai_key=openai_key,
+        serper_key=serper_key,
+        base_url=base_url
+    )
+
+
+def _wants_event_stream(accept: Optional[str]) -> bool:
+    """True if the client asked for Server-Sent Events."""
+    return "text/event-stream" in (accept or "")
+
+
+def _sse(event: str, data) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(jsonable_encoder(data))}\n\n"
+
+
+def _stream_discovery(run, finish) -> StreamingResponse:
+    """
+    Stream a discovery run as Server-Sent Events.
+    
+    Emits `progress` events ({"phase", "found"}) while discovery runs,
+    then one `document` event per result and a final `notes` event (or an
+    `error` event). `run(progress)` performs the blocking discovery in a
+    worker thread and returns its result; `finish(result)` returns the
+    (documents, notes) to emit.
+    """
+    async def events():
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        
+        def progress(phase: str, found: int) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, {"phase": phase, "found": found})
+        
+        def work():
+            try:
+                return run(progress)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, None)
+        
+        task = asyncio.create_task(asyncio.to_thread(work))
+        yield _sse("progress", {"phase": "started", "found": 0})
+        while (update := await queue.get()) is not None:
+            yield _sse("progress", update)
+        
+        try:
+            result = await task
+        except Exception as e:
+            logger.exception(f"Discovery error: {str(e)}")
+            yield _sse("error", {"detail": str(e)})
+            return
+        
+        documents, notes = finish(result)
+        for document in documents:
+            yield _sse("document", document)
+        yield _sse("notes", {"notes": notes})
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+def _stream_events(produce) -> StreamingResponse:
+    """
+    Stream events from a blocking generator as Server-Sent Events.
+    
+    `produce()` runs in a worker thread and yields {"event", "data"}
+    dicts, each forwarded as soon as it is produced; a failure ends the
+    stream with an `error` event.
+    """
+    async def events():
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        
+        def work():
+            try:
+                for event in produce():
+                    loop.call_soon_threadsafe(queue.put_nowait, event)
+            except Exception as e:
+                logger.exception(f"Stream error: {str(e)}")
+                loop.call_soon_threadsafe(queue.put_nowait, {"event": "error", "data": {"detail": str(e)}})
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, None)
+        
+        task = asyncio.create_task(asyncio.to_thread(work))
+        while (event := await queue.get()) is not None:
+            yield _sse(event["event"], event["data"])
+        await task
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
 
 
 # Request/Response Models
@@ -242,7 +546,11 @@ class DiscoverQueryResponse(BaseModel):
 
 
 @app.post("/discover/query", response_model=DiscoverQueryResponse)
-async def discover_documents_from_query(request: DiscoverQueryRequest):
+async def discover_documents_from_query(
+    request: DiscoverQueryRequest,
+    cache_control: Optional[str] = Header(None),
+    accept: Optional[str] = Header(None),
+):
     """
     Discover financial documents from a natural language query.
     
@@ -261,13 +569,15 @@ async def discover_documents_from_query(request: DiscoverQueryRequest):
         "documents": [...],
         "notes": "string"
     }
+    
+    With `Accept: text/event-stream` the result is streamed as
+    Server-Sent Events: `progress` per discovery phase, then one
+    `document` per PDF and a final `notes` event.
     """
     try:
-        print(f"\n{'='*60}")
-        print(f"Document Discovery Query: {request.query}")
-        print(f"{'='*60}")
+        logger.info(f"Document Discovery Query: {request.query}")
         
-        serper_key = request.serper_api_key or os.getenv("SERPER_API_KEY")
+        serper_key = request.serper_api_key or settings.serper_api_key
         
         if not serper_key:
             raise HTTPException(
@@ -276,26 +586,57 @@ async def discover_documents_from_query(request: DiscoverQueryRequest):
             )
         
         # Use the natural language discovery function
-        from document_discovery_agent import discover_investor_documents
+        cache_key = make_cache_key("/discover/query", {
+            "query": normalize_query(request.query),
+            "serper_key": serper_key,
+        })
+        result = _cache_lookup(cache_key, cache_control)
         
-        result = discover_investor_documents(
-            query=request.query,
-            serper_api_key=serper_key
-        )
+        if _wants_event_stream(accept):
+            cached = result
+            
+            def run(progress):
+                if cached is not None:
+                    return cached
+                output = discover_investor_documents(
+                    query=request.query,
+                    serper_api_key=serper_key,
+                    progress=progress,
+                )
+                if output.get('documents'):
+                    _cache_store(cache_key, output, cache_control)
+                return output
+            
+            return _stream_discovery(run, lambda r: (r['documents'], r['notes']))
+        
+        if result is not None:
+            logger.info("Served from response cache")
+            return result
+        
+        async def run():
+            output = await discover_investor_documents_async(
+                query=request.query,
+                serper_api_key=serper_key
+            )
+            if output.get('documents'):
+                _cache_store(cache_key, output, cache_control)
+            return output
         
-        return result
+        return await _single_flight(cache_key, run)
         
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Discovery error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Discovery error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/discover", response_model=DiscoveryResponse)
-async def discover_financial_documents(request: DiscoveryRequest):
+async def discover_financial_documents(
+    request: DiscoveryRequest,
+    cache_control: Optional[str] = Header(None),
+    accept: Optional[str] = Header(None),
+):
     """
     Comprehensive financial document discovery with DEEP CRAWLING.
     
@@ -306,17 +647,19 @@ async def discover_financial_documents(request: DiscoveryRequest):
     - Implements fallback strategies (SEC, regulators)
     
     Returns detailed document information including confidence scores.
+    With `Accept: text/event-stream` the documents are streamed as
+    Server-Sent Events, as in /discover/query.
     """
     try:
-        print(f"\n{'='*60}")
-        print(f"Document Discovery Request: {request.company}")
-        print(f"Years: {request.start_year or 'auto'} - {request.end_year or 'auto'}")
-        print(f"{'='*60}")
+        logger.info(
+            f"Document Discovery Request: {request.company} "
+            f"(years: {request.start_year or 'auto'} - {request.end_year or 'auto'})"
+        )
         
         # Get API keys
-        serper_key = request.serper_api_key or os.getenv("SERPER_API_KEY")
-        tavily_key = request.tavily_api_key or os.getenv("TAVILY_API_KEY")
-        openai_key = os.getenv("OPENAI_API_KEY")
+        serper_key = request.serper_api_key or settings.serper_api_key
+        tavily_key = request.tavily_api_key or settings.tavily_api_key
+        openai_key = settings.openai_api_key
         
         if not serper_key and not tavily_key:
             raise HTTPException(
@@ -324,41 +667,80 @@ async def discover_financial_documents(request: DiscoveryRequest):
                 detail="Either Serper or Tavily API key is required for document discovery."
             )
         
-        # Import and initialize discovery agent
-        from document_discovery_agent import FinancialDocumentDiscoveryAgent
+        cache_key = make_cache_key("/discover", {
+            "company": normalize_query(request.company),
+            "start_year": request.start_year,
+            "end_year": request.end_year,
+            "report_types": request.report_types,
+            "max_results": request.max_results,
+            "serper_key": serper_key,
+            "tavily_key": tavily_key,
+        })
+        result = _cache_lookup(cache_key, cache_control)
         
-        agent = FinancialDocumentDiscoveryAgent(
-            serper_api_key=serper_key,
-            tavily_api_key=tavily_key,
-            openai_api_key=openai_key,
-        )
+        def to_responses(result) -> List[DiscoveredDocumentResponse]:
+            # Convert to response format with detailed info. The agent's
+            # output is trusted, so skip per-document validation; FastAPI
+            # still checks the whole response against response_model
+            return [
+                DiscoveredDocumentResponse.model_construct(
+                    company_name=request.company,
+                    document_title=doc_dict.get('title', ''),
+                    reporting_period=doc_dict.get('period', ''),
+                    document_type=doc_dict.get('doc_type', ''),
+                    pdf_url=doc_dict.get('pdf_url', ''),
+                    source_page_url=doc_dict.get('source_page', ''),
+                    language='english',  # Default
+                    confidence_score=0.8,  # Default for results
+                    year=None,
+                    quarter=None,
+                )
+                for doc_dict in result.documents
+            ]
         
-        # Discover documents (returns DiscoveryResult now)
-        result = agent.discover_documents(
+        discover_kwargs = dict(
             company=request.company,
             doc_types=request.report_types,
             start_year=request.start_year,
             end_year=request.end_year,
             max_results=request.max_results,
         )
+        if result is None:
+            # Initialize discovery agent
+            agent = FinancialDocumentDiscoveryAgent(
+                serper_api_key=serper_key,
+                tavily_api_key=tavily_key,
+                openai_api_key=openai_key,
+            )
+        
+        if _wants_event_stream(accept):
+            cached = result
+            
+            def run(progress):
+                if cached is not None:
+                    return cached
+                output = agent.discover_documents(**discover_kwargs, progress=progress)
+                if output.documents:
+                    _cache_store(cache_key, output, cache_control)
+                return output
+            
+            return _stream_discovery(run, lambda r: (to_responses(r), r.notes))
+        
+        if result is None:
+            async def run():
+                # Discover documents (returns DiscoveryResult now)
+                output = await agent.discover_documents_async(**discover_kwargs)
+                if output.documents:
+                    _cache_store(cache_key, output, cache_control)
+                return output
+            
+            result = await _single_flight(cache_key, run)
+        else:
+            logger.info("Served from response cache")
+        
+        doc_responses = to_responses(result)
         
-        # Convert to response format with detailed info
-        doc_responses = []
-        for doc_dict in result.documents:
-            doc_responses.append(DiscoveredDocumentResponse(
-                company_name=request.company,
-                document_title=doc_dict.get('title', ''),
-                reporting_period=doc_dict.get('period', ''),
-                document_type=doc_dict.get('doc_type', ''),
-                pdf_url=doc_dict.get('pdf_url', ''),
-                source_page_url=doc_dict.get('source_page', ''),
-                language='english',  # Default
-                confidence_score=0.8,  # Default for results
-                year=None,
-                quarter=None,
-            ))
-        
-        return DiscoveryResponse(
+        return DiscoveryResponse.model_construct(
             success=True,
             company=request.company,
             documents=doc_responses,
@@ -375,14 +757,53 @@ async def discover_financial_documents(request: DiscoveryRequest):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Discovery error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Discovery error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _search_response(prompt: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a find_reports result as a SearchResponse body."""
+    reports = result.get('reports', [])
+    missing_years = result.get('missing_years', [])
+    requested_years = result.get('requested_years', [])
+    reports_pages = result.get('reports_pages', [])
+    notes = result.get('notes', '')
+    
+    # Build message with missing years info
+    if reports:
+        message = f"Found {len(reports)} report(s) using OpenAI + Serper (web search)"
+        if missing_years:
+            message += f". Missing years: {', '.join(map(str, missing_years))}"
+    else:
+        message = "No PDFs found after full retrieval ladder. "
+        if reports_pages:
+            message += f"Found {len(reports_pages)} reports page(s) - check manually."
+        else:
+            message += "Try refining your search."
+    
+    return {
+        "success": True,
+        "query": prompt,
+        "company": result.get('company'),
+        "official_website": result.get('official_website'),
+        "official_investor_relations": result.get('official_investor_relations'),
+        "reports_pages": reports_pages,
+        # Validated and serialized once, by the SearchResponse response_model
+        "reports": reports,
+        "count": len(reports),
+        "message": message,
+        "notes": notes,
+        "missing_years": missing_years,
+        "requested_years": requested_years
+    }
+
+
 @app.post("/search", response_model=SearchResponse)
-async def search_reports(request: SearchRequest):
+async def search_reports(
+    request: SearchRequest,
+    cache_control: Optional[str] = Header(None),
+    accept: Optional[str] = Header(None),
+):
     """
     Search for investor reports using OpenAI + Serper (hybrid approach).
     
@@ -390,15 +811,17 @@ async def search_reports(request: SearchRequest):
     1. OpenAI parses the query
     2. Serper searches Google for PDF URLs
     3. Returns actual PDF links
+    
+    With `Accept: text/event-stream` the finder's progress is streamed as
+    Server-Sent Events (`parsed`, `official_website`, then `reports` per
+    search step) ending with a `result` event carrying the usual body.
     """
     try:
-        print(f"\n{'='*60}")
-        print(f"Received search request: {request.prompt}")
-        print(f"{'='*60}")
+        logger.info(f"Received search request: {request.prompt}")
         
         # Get API keys (user-provided or from environment)
-        openai_key = request.openai_api_key or os.getenv("OPENAI_API_KEY")
-        serper_key = request.serper_api_key or os.getenv("SERPER_API_KEY")
+        openai_key = request.openai_api_key or settings.openai_api_key
+        serper_key = request.serper_api_key or settings.serper_api_key
         
         if not serper_key:
             raise HTTPException(
@@ -413,58 +836,55 @@ async def search_reports(request: SearchRequest):
         elif not base_url and request.openai_provider == "openai":
             base_url = "https://api.openai.com/v1"
             
-        # Initialize hybrid finder (OpenAI + Serper)
-        finder = OpenAISerperReportFinder(
-            openai_key=openai_key,
-            serper_key=serper_key,
-            base_url=base_url
-        )
+        cache_key = make_cache_key("/search", {
+            "prompt": normalize_query(request.prompt),
+            "openai_key": openai_key,
+            "serper_key": serper_key,
+            "base_url": base_url,
+        })
+        result = _cache_lookup(cache_key, cache_control)
         
-        # Find reports using hybrid approach (now returns dict)
-        result = finder.find_reports(request.prompt)
-        reports = result.get('reports', [])
-        missing_years = result.get('missing_years', [])
-        requested_years = result.get('requested_years', [])
-        reports_pages = result.get('reports_pages', [])
-        notes = result.get('notes', '')
-        
-        # Convert to response format
-        report_objs = [ReportResponse(**r) for r in reports]
-        
-        # Build message with missing years info
-        if report_objs:
-            message = f"Found {len(report_objs)} report(s) using OpenAI + Serper (web search)"
-            if missing_years:
-                message += f". Missing years: {', '.join(map(str, missing_years))}"
+        if _wants_event_stream(accept):
+            cached = result
+            finder = get_report_finder(openai_key, serper_key, base_url) if cached is None else None
+            
+            def produce():
+                if cached is not None:
+                    yield {"event": "result", "data": _search_response(request.prompt, cached)}
+                    return
+                for event in finder.find_reports_stream(request.prompt):
+                    if event["event"] != "result":
+                        yield event
+                        continue
+                    output = event["data"]
+                    if output.get('reports') or output.get('reports_pages'):
+                        _cache_store(cache_key, output, cache_control)
+                    yield {"event": "result", "data": _search_response(request.prompt, output)}
+            
+            return _stream_events(produce)
+        
+        if result is None:
+            # Hybrid finder (OpenAI + Serper) for these credentials
+            finder = get_report_finder(openai_key, serper_key, base_url)
+            
+            async def run():
+                # Find reports using hybrid approach (now returns dict)
+                output = await finder.find_reports_async(request.prompt)
+                if output.get('reports') or output.get('reports_pages'):
+                    _cache_store(cache_key, output, cache_control)
+                return output
+            
+            result = await _single_flight(cache_key, run)
         else:
-            message = "No PDFs found after full retrieval ladder. "
-            if reports_pages:
-                message += f"Found {len(reports_pages)} reports page(s) - check manually."
-            else:
-                message += "Try refining your search."
+            logger.info("Served from response cache")
         
-        return {
-            "success": True,
-            "query": request.prompt,
-            "company": result.get('company'),
-            "official_website": result.get('official_website'),
-            "official_investor_relations": result.get('official_investor_relations'),
-            "reports_pages": reports_pages,
-            "reports": jsonable_encoder(report_objs),
-            "count": len(report_objs),
-            "message": message,
-            "notes": notes,
-            "missing_years": missing_years,
-            "requested_years": requested_years
-        }
+        return _search_response(request.prompt, result)
         
     except ValueError as e:
         # Handle validation errors
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        print(f"Search error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Search error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/resolve-company", response_model=CompanyResolveResponse)
@@ -485,15 +905,10 @@ async def resolve_company(request: CompanyResolveRequest):
                 "is_ambiguous": False
             }
         
-        matches = company_resolver.resolve(
-            query=request.query,
-            max_results=request.max_results,
-            min_score=0.5  # Lower threshold for autocomplete
+        matches, is_ambiguous = _resolve_company_cached(
+            normalize_query(request.query), request.max_results
         )
         
-        # Detect ambiguity
-        is_ambiguous = company_resolver.detect_ambiguity(request.query)
-        
         match_objs = [CompanyMatch(**match) for match in matches]
         
         return {
@@ -505,7 +920,7 @@ async def resolve_company(request: CompanyResolveRequest):
         }
     
     except Exception as e:
-        print(f"Company resolution error: {str(e)}")
+        logger.exception(f"Company resolution error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/verify-company", response_model=CompanyVerifyResponse)
@@ -517,18 +932,52 @@ async def verify_company(request: CompanyVerifyRequest):
     Returns validation result with confidence score.
     """
     try:
-        result = company_resolver.verify_match(
-            ticker=request.ticker,
-            company_name=request.company_name
-        )
+        # The name is kept verbatim: mismatch messages quote it back
+        cache_key = (request.ticker.strip().upper(), request.company_name)
+        result = verify_cache.get(cache_key)
+        if result is None:
+            result = company_resolver.verify_match(
+                ticker=request.ticker,
+                company_name=request.company_name
+            )
+            verify_cache.set(cache_key, result)
         
         return CompanyVerifyResponse(**result)
     
     except Exception as e:
-        print(f"Company verification error: {str(e)}")
+        logger.exception(f"Company verification error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+ENV_PATH = Path(__file__).parent.parent / ".env"
+
+# Parsed .env contents, loaded on the first POST /settings and kept in sync
+# by it afterwards; the lock serializes concurrent updates
+_env_file_values: Optional[Dict[str, str]] = None
+_env_file_lock = asyncio.Lock()
+
+
+def _read_env_file(env_path: Path) -> Dict[str, str]:
+    """Parse KEY=VALUE lines from a .env file."""
+    env_content = {}
+    if env_path.exists():
+        with open(env_path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#') and '=' in line:
+                    key, value = line.split('=', 1)
+                    env_content[key.strip()] = value.strip()
+    return env_content
+
+
+def _write_env_file(env_path: Path, env_content: Dict[str, str]) -> None:
+    """Write a .env file and reload it into the environment."""
+    with open(env_path, 'w') as f:
+        for key, value in env_content.items():
+            f.write(f"{key}={value}\n")
+    load_dotenv(override=True)
+
+
 @app.get("/settings", response_model=SettingsResponse)
 async def get_settings():
     """Get current API keys (masked)."""
@@ -538,8 +987,8 @@ async def get_settings():
         return f"****{key[-4:]}"
     
     # Get provider settings with defaults
-    provider = os.getenv("OPENAI_PROVIDER", "openai")
-    base_url = os.getenv("OPENAI_BASE_URL", "")
+    provider = settings.openai_provider
+    base_url = settings.openai_base_url
     
     # Auto-detect provider from base URL if not explicitly set
     if not base_url and provider == "openai":
@@ -548,57 +997,51 @@ async def get_settings():
         base_url = "https://openrouter.ai/api/v1"
     
     return {
-        "openai_api_key": mask_key(os.getenv("OPENAI_API_KEY")),
-        "serper_api_key": mask_key(os.getenv("SERPER_API_KEY")),
+        "openai_api_key": mask_key(settings.openai_api_key),
+        "serper_api_key": mask_key(settings.serper_api_key),
         "openai_provider": provider,
         "openai_base_url": base_url
     }
 
 @app.post("/settings")
-async def update_settings(settings: SettingsRequest):
+async def update_settings(request: SettingsRequest):
     """Update API keys in .env file."""
+    global settings, _env_file_values
     try:
-        env_path = Path(__file__).parent.parent / ".env"
-        
-        # Read existing .env content
-        env_content = {}
-        if env_path.exists():
-            with open(env_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        env_content[key.strip()] = value.strip()
-        
-        # Update with new values (only if provided)
-        if settings.openai_api_key:
-            env_content['OPENAI_API_KEY'] = settings.openai_api_key
-        if settings.serper_api_key:
-            env_content['SERPER_API_KEY'] = settings.serper_api_key
-        
-        # Handle OpenAI provider settings
-        if settings.openai_provider:
-            env_content['OPENAI_PROVIDER'] = settings.openai_provider
-            # Auto-set base URL based on provider if not explicitly provided
-            if not settings.openai_base_url:
-                if settings.openai_provider == "openrouter":
-                    env_content['OPENAI_BASE_URL'] = "https://openrouter.ai/api/v1"
-                elif settings.openai_provider == "openai":
-                    env_content['OPENAI_BASE_URL'] = "https://api.openai.com/v1"
-        
-        # Allow manual base URL override
-        if settings.openai_base_url:
-            env_content['OPENAI_BASE_URL'] = settings.openai_base_url
-        
-        # Write back to .env
-        with open(env_path, 'w') as f:
-            for key, value in env_content.items():
-                f.write(f"{key}={value}\n")
-        
-        # Reload environment variables
-        load_dotenv(override=True)
-        
-        return {" success": True, "message": "Settings updated successfully. Please restart the server for changes to take effect."}
+        async with _env_file_lock:
+            # File I/O runs off the event loop
+            if _env_file_values is None:
+                _env_file_values = await asyncio.to_thread(_read_env_file, ENV_PATH)
+            env_content = dict(_env_file_values)
+            
+            # Update with new values (only if provided)
+            if request.openai_api_key:
+                env_content['OPENAI_API_KEY'] = request.openai_api_key
+            if request.serper_api_key:
+                env_content['SERPER_API_KEY'] = request.serper_api_key
+            
+            # Handle OpenAI provider settings
+            if request.openai_provider:
+                env_content['OPENAI_PROVIDER'] = request.openai_provider
+                # Auto-set base URL based on provider if not explicitly provided
+                if not request.openai_base_url:
+                    if request.openai_provider == "openrouter":
+                        env_content['OPENAI_BASE_URL'] = "https://openrouter.ai/api/v1"
+                    elif request.openai_provider == "openai":
+                        env_content['OPENAI_BASE_URL'] = "https://api.openai.com/v1"
+            
+            # Allow manual base URL override
+            if request.openai_base_url:
+                env_content['OPENAI_BASE_URL'] = request.openai_base_url
+            
+            # Write back to .env and reload environment variables
+            await asyncio.to_thread(_write_env_file, ENV_PATH, env_content)
+            _env_file_values = env_content
+            
+            # Reload the cached settings
+            settings = Settings.from_env()
+        
+        return {" success": True, "message": "Settings updated successfully."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to update settings: {str(e)}")
 
@@ -630,12 +1073,6 @@ async def analyze_financials(request: AnalysisRequest):
     This endpoint provides structure for future full implementation.
     """
     try:
-        from ticker_parser import TickerParser
-        from financial_analyzer import FinancialAnalyzer
-        
-        ticker_parser = TickerParser()
-        analyzer = FinancialAnalyzer()
-        
         # Parse ticker to get country info
         ticker_info = ticker_parser.parse_ticker(request.ticker)
         
@@ -660,16 +1097,22 @@ async def analyze_financials(request: AnalysisRequest):
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
+# Generated reports keyed by a digest of the report data, so a duplicate
+# request returns immediately. Per-worker: a miss on another worker only
+# regenerates the report.
+REPORT_CACHE_TTL_SECONDS = 3600
+generated_reports = TTLCache(maxsize=1000, ttl=REPORT_CACHE_TTL_SECONDS)
+
+
 @app.post("/api/generate-report")
 async def generate_report(request: ReportGenerationRequest):
-    """Generate comprehensive financial analysis report."""
+    """
+    Generate comprehensive financial analysis report.
+    
+    Generation runs in a worker thread so the event loop keeps serving
+    other requests meanwhile.
+    """
     try:
-        from report_generator import FinancialReportGenerator
-        from accounting_standards import AccountingStandardMapper
-        
-        generator = FinancialReportGenerator()
-        standards_mapper = AccountingStandardMapper()
-        
         # Prepare data for report
         report_data = {
             'ticker': request.ticker,
@@ -682,14 +1125,20 @@ async def generate_report(request: ReportGenerationRequest):
             'accounting_standard': 'To be detected from PDFs'
         }
         
-        # Generate report
-        markdown_report = generator.generate_full_report(report_data)
+        cache_key = make_cache_key("/api/generate-report", report_data)
+        response = generated_reports.get(cache_key)
+        if response is None:
+            markdown_report = await asyncio.to_thread(
+                report_generator.generate_full_report, report_data
+            )
+            response = {
+                'report': markdown_report,
+                'format': 'markdown',
+                'generated_at': str(datetime.now())
+            }
+            generated_reports.set(cache_key, response)
         
-        return {
-            'report': markdown_report,
-            'format': 'markdown',
-            'generated_at': str(datetime.now())
-        }
+        return response
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Report generation failed: {str(e)}")
@@ -699,14 +1148,15 @@ async def generate_report(request: ReportGenerationRequest):
 # User Reports API (Supabase + Clerk)
 # ============================================
 
-# Import Supabase client functions
+# Import Supabase client functions (async, so PostgREST round trips don't
+# block the event loop)
 from supabase_client import (
-    save_report,
-    get_user_reports,
-    get_user_report_by_id,
-    delete_user_report,
-    save_search_history,
-    get_user_search_history
+    close_async_supabase_client,
+    save_report_async,
+    get_user_reports_async,
+    get_user_report_by_id_async,
+    delete_user_report_async,
+    get_user_search_history_async
 )
 
 
@@ -750,7 +1200,7 @@ async def save_user_report(
         if not clerk_user_id:
             raise HTTPException(status_code=401, detail="User ID not found in token")
         
-        result = save_report(
+        result = await save_report_async(
             clerk_user_id=clerk_user_id,
             company_name=request.company_name,
             ticker=request.ticker,
@@ -782,7 +1232,7 @@ async def get_my_reports(
         if not clerk_user_id:
             raise HTTPException(status_code=401, detail="User ID not found in token")
         
-        reports = get_user_reports(
+        reports, total = await get_user_reports_async(
             clerk_user_id=clerk_user_id,
             limit=limit,
             offset=offset
@@ -791,7 +1241,8 @@ async def get_my_reports(
         return {
             "success": True,
             "reports": reports,
-            "count": len(reports)
+            "count": len(reports),
+            "total": total
         }
     
     except Exception as e:
@@ -812,7 +1263,7 @@ async def get_my_report(
         if not clerk_user_id:
             raise HTTPException(status_code=401, detail="User ID not found in token")
         
-        report = get_user_report_by_id(
+        report = await get_user_report_by_id_async(
             clerk_user_id=clerk_user_id,
             report_id=report_id
         )
@@ -842,7 +1293,7 @@ async def delete_my_report(
         if not clerk_user_id:
             raise HTTPException(status_code=401, detail="User ID not found in token")
         
-        deleted = delete_user_report(
+        deleted = await delete_user_report_async(
             clerk_user_id=clerk_user_id,
             report_id=report_id
         )
@@ -876,7 +1327,7 @@ async def get_my_search_history(
         if not clerk_user_id:
             raise HTTPException(status_code=401, detail="User ID not found in token")
         
-        history = get_user_search_history(
+        history = await get_user_search_history_async(
             clerk_user_id=clerk_user_id,
             limit=limit
         )
@@ -893,4 +1344,19 @@ async def get_my_search_history(
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    # DEV=1 runs a single auto-reloading process. Otherwise run
+    # WEB_CONCURRENCY workers. Response caches and in-flight request
+    # coalescing live in each worker's memory, so every worker warms its
+    # own caches; scale out behind sticky sessions to keep hit rates up.
+    # uvicorn[standard] brings uvloop and httptools, which "auto" selects
+    # wherever they are supported (uvloop is unavailable on Windows).
+    dev = os.getenv("DEV") == "1"
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=dev,
+        workers=None if dev else int(os.getenv("WEB_CONCURRENCY", "1")),
+        loop="auto",
+        http="auto",
+    )
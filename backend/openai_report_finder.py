@@ -8,11 +8,20 @@ with Serper API as fallback for URL validation/additional search.
 import os
 import re
 import json
+import asyncio
+import hashlib
+import logging
+import threading
+import httpx
 import requests
-from typing import List, Dict, Optional
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Iterator, List, Literal, Optional
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from urllib.parse import urlparse
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urljoin, urlparse
+from pydantic import BaseModel, ConfigDict
 
 try:
     from openai import OpenAI
@@ -25,6 +34,301 @@ try:
 except ImportError:
     OpenRouterFallbackRetriever = None
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from requests_cache import CachedSession
+    HAS_REQUESTS_CACHE = True
+except ImportError:
+    HAS_REQUESTS_CACHE = False
+
+from response_cache import TTLCache, normalize_query
+
+logger = logging.getLogger(__name__)
+
+SERPER_SEARCH_URL = 'https://google.serper.dev/search'
+
+# Maximum queries per Serper batch request
+SERPER_BATCH_SIZE = 100
+
+# Maximum Serper requests in flight when independent searches run together
+SERPER_CONCURRENCY = 5
+
+# STEP 5 (OpenRouter LLM fallback) is opt-in; when enabled it only runs if
+# Serper found nothing or covered less than this share of requested years
+OPENROUTER_FALLBACK_ENABLED = os.getenv("OPENROUTER_FALLBACK", "0") == "1"
+OPENROUTER_FALLBACK_MAX_COVERAGE = float(os.getenv("OPENROUTER_FALLBACK_MAX_COVERAGE", "0.8"))
+
+# Largest prefix of a user-supplied reports page that is read and scanned
+MAX_PAGE_BYTES = 10 * 1024 * 1024
+
+# Serper responses are reused for a day: in memory per process, and on disk
+# (sqlite, via requests-cache) for the synchronous session when installed
+SERPER_CACHE_SECONDS = 86400
+HTTP_CACHE_PATH = os.getenv("REPORT_FINDER_HTTP_CACHE", ".report_finder_http_cache")
+_serper_cache = TTLCache(maxsize=2048, ttl=SERPER_CACHE_SECONDS)
+
+# Serper requests currently on the wire, by cache key, so threads asking
+# for the same payload at the same time share one request
+_serper_inflight: Dict[str, Future] = {}
+_serper_inflight_lock = threading.Lock()
+
+# PDF links in a page, matched in a single pass: anchor hrefs (with their
+# link text), data-* attributes, then any quoted absolute or root-relative URL
+_PDF_LINK_RE = re.compile(
+    r'<a[^>]+href=["\'](?P<href>[^"\']*\.pdf[^"\']*)["\'][^>]*>(?P<text>[^<]*)</a>'
+    r'|data-[a-z-]+=["\'](?P<data>[^"\']*\.pdf[^"\']*)["\']'
+    r'|["\'](?P<quoted>(?:/|http)[^"\']*\.pdf[^"\']*)["\']',
+    re.IGNORECASE,
+)
+
+# Quoted absolute or root-relative PDF URLs inside <script> bodies
+_SCRIPT_PDF_URL_RE = re.compile(r'["\']((?:/|http)[^"\']*\.pdf[^"\']*)["\']', re.IGNORECASE)
+
+# data-* attributes IR pages use to carry document links
+_PDF_DATA_ATTRS = ('data-href', 'data-url', 'data-file', 'data-src', 'data-link', 'data-download')
+
+_YEAR_RE = re.compile(r'(20\d{2})')
+_PROMPT_URL_RE = re.compile(r'https?://[^\s<>"\'()]+')
+_PARENTHETICAL_RE = re.compile(r'\s*\([^)]*\)')
+_VALID_PDF_URL_RE = re.compile(
+    r'^https?://'
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'
+    r'localhost|'
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
+    r'(?::\d+)?'
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+# Keyword sets tested against URLs, each matched in one scan
+_REPORTS_URL_KEYWORD_RE = re.compile('|'.join(map(re.escape, [
+    'report', 'financial', 'result', 'investor',
+    'filing', 'disclosure', 'publication', 'annual', 'quarterly',
+])), re.IGNORECASE)
+_REPORTS_PAGE_PATH_RE = re.compile('|'.join(map(re.escape, [
+    'report', 'result', 'financial', 'publication', 'filing', 'disclosure', 'annual', 'quarterly',
+])), re.IGNORECASE)
+_IR_ARCHIVE_PATH_RE = re.compile('|'.join(map(re.escape, [
+    '/investor', '/ir/', '/reports/', '/annual/', '/results/',
+    '/informes/', '/downloads/', '/rapports/', '/berichte/',
+    '/raporlar/', '/relatorios/', '/rapporti/',
+])))
+
+# Reporting-year patterns for search results, in priority order
+_REPORT_YEAR_PATTERNS = tuple(re.compile(pattern) for pattern in [
+    # "Annual Report 2020", "2020 Annual Report"
+    r'annual\s+report\s+(\d{4})',
+    r'(\d{4})\s+annual\s+report',
+    # "FY2020", "FY 2020", "Fiscal Year 2020"
+    r'fy\s*(\d{4})',
+    r'fiscal\s+year\s+(\d{4})',
+    # "For the year ended 31 December 2020", "Year ended 2020"
+    r'(?:for\s+)?(?:the\s+)?year\s+ended\s+(?:\d+\s+\w+\s+)?(\d{4})',
+    # "10-K 2020", "Form 10-K 2020", "2020 10-K"
+    r'10-k\s+(\d{4})',
+    r'(\d{4})\s+(?:form\s+)?10-k',
+    r'form\s+10-k\s+(\d{4})',
+    # "20-F 2020", "Form 20-F 2020"
+    r'20-f\s+(\d{4})',
+    r'(\d{4})\s+(?:form\s+)?20-f',
+    # "Results 2020", "FY20 Results"
+    r'results?\s+(\d{4})',
+    r'fy(\d{2})\s+results?',  # FY20 -> 2020
+    # URL patterns like /2020/, _2020_, -2020-
+    r'/(\d{4})/',
+    r'[_-](\d{4})[_.-]',
+    r'(\d{4})\.pdf$',
+])
+
+# OpenAI/OpenRouter calls from every finder share one keep-alive pool
+LLM_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+
+class ParsedQuery(BaseModel):
+    """Structured output of the OpenAI query parser."""
+    model_config = ConfigDict(extra='forbid')
+    
+    company: str
+    report_type: Literal['annual', 'quarterly', '10-k', '10-q', 'earnings', 'financial_statements']
+    years: List[int]
+    quarters: Optional[List[str]]  # None unless specific quarters were requested
+
+
+# Strict JSON schema handed to the API, so replies always match ParsedQuery
+PARSED_QUERY_RESPONSE_FORMAT = {
+    'type': 'json_schema',
+    'json_schema': {
+        'name': 'parsed_query',
+        'schema': ParsedQuery.model_json_schema(),
+        'strict': True,
+    },
+}
+
+
+def _mount_pooled_adapter(session: requests.Session) -> requests.Session:
+    """Mount a keep-alive adapter with a shared pool and light retries."""
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+@lru_cache(maxsize=1)
+def _shared_http_session() -> requests.Session:
+    """
+    One pooled keep-alive session for Serper searches, shared by every
+    finder in the process (API keys are sent per request, never as
+    session headers).
+    
+    With requests-cache installed, Serper responses persist in sqlite so
+    restarts during development don't repeat the same searches; API keys
+    are redacted from the cache key. Only POSTs are cached.
+    """
+    if HAS_REQUESTS_CACHE:
+        session = CachedSession(
+            HTTP_CACHE_PATH,
+            backend='sqlite',
+            expire_after=SERPER_CACHE_SECONDS,
+            allowable_methods=('POST',),
+            ignored_parameters=['X-API-KEY'],
+        )
+    else:
+        session = requests.Session()
+    return _mount_pooled_adapter(session)
+
+
+@lru_cache(maxsize=1)
+def _shared_page_session() -> requests.Session:
+    """
+    Pooled session for user-supplied pages. It is kept out of the HTTP
+    cache, which would read and store the whole body before the
+    MAX_PAGE_BYTES cut-off applies.
+    """
+    return _mount_pooled_adapter(requests.Session())
+
+
+@lru_cache(maxsize=1)
+def _shared_llm_http_client() -> httpx.Client:
+    """
+    Pooled HTTP client for the finders' LLM clients.
+    
+    Finders are created per credential set; sharing the transport means a
+    new finder reuses warm TLS connections to the API host instead of
+    opening its own. httpx.Client is safe to share across threads.
+    """
+    return httpx.Client(limits=LLM_HTTP_LIMITS, follow_redirects=True)
+
+# find_reports results keyed by the parsed request (company, report type,
+# years, quarters), so paraphrased prompts reuse one retrieval ladder
+REQUEST_RESULT_CACHE_SECONDS = 3600
+_request_result_cache = TTLCache(maxsize=2048, ttl=REQUEST_RESULT_CACHE_SECONDS)
+
+# OpenAI query parses keyed by normalized prompt; the TTL keeps the
+# "current year" default from going stale
+PARSED_QUERY_CACHE_SECONDS = 6 * 3600
+_parsed_query_cache = TTLCache(maxsize=512, ttl=PARSED_QUERY_CACHE_SECONDS)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize a request body, with orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(content: bytes):
+    """Decode a response body, with orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _serper_cache_key(body: bytes) -> str:
+    """Cache key for a serialized Serper payload."""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _claim_serper_flight(cache_key: str):
+    """
+    Join or start the in-flight request for a Serper payload.
+    
+    Returns (future, owner). The owner must send the request and pass the
+    outcome to _land_serper_flight; everyone else waits on the future.
+    """
+    with _serper_inflight_lock:
+        flight = _serper_inflight.get(cache_key)
+        if flight is not None:
+            return flight, False
+        flight = _serper_inflight[cache_key] = Future()
+        return flight, True
+
+
+def _land_serper_flight(cache_key: str, flight: Future, results) -> None:
+    """Cache a successful body, retire the flight and wake its waiters."""
+    if results is not None:
+        _serper_cache.set(cache_key, results)
+    with _serper_inflight_lock:
+        _serper_inflight.pop(cache_key, None)
+    flight.set_result(results)
+
+
+@lru_cache(maxsize=1024)
+def _cached_urlparse(url: str):
+    """urlparse for URLs that recur across results (IR pages, PDF hosts)."""
+    return urlparse(url)
+
+
+def _pdf_candidates_from_tree(html: str):
+    """
+    Yield (url, title, is_anchor) for PDF links found by parsing the page:
+    anchors, data-* link attributes, then quoted URLs in <script> bodies.
+    """
+    tree = LexborHTMLParser(html)
+    
+    for node in tree.css('a[href]'):
+        url = node.attributes.get('href') or ''
+        if '.pdf' in url.lower():
+            yield url, (node.text(strip=True) or "Untitled PDF"), True
+    
+    selector = ', '.join(f'[{attr}]' for attr in _PDF_DATA_ATTRS)
+    for node in tree.css(selector):
+        for attr in _PDF_DATA_ATTRS:
+            url = node.attributes.get(attr) or ''
+            if '.pdf' in url.lower():
+                yield url, 'PDF from data attribute', False
+    
+    for node in tree.css('script'):
+        for match in _SCRIPT_PDF_URL_RE.finditer(node.text(deep=True) or ''):
+            if len(match.group(1)) < 500:  # Avoid garbage
+                yield match.group(1), 'PDF from script', False
+
+
+def _pdf_candidates_from_regex(html: str):
+    """
+    Yield (url, title, is_anchor) for PDF links in a single regex pass over
+    the raw page; the leftmost alternative wins at each offset.
+    """
+    for match in _PDF_LINK_RE.finditer(html):
+        if match.group('href') is not None:
+            yield match.group('href'), (match.group('text').strip() or "Untitled PDF"), True
+        elif match.group('data') is not None:
+            yield match.group('data'), 'PDF from data attribute', False
+        elif len(match.group('quoted')) < 500:  # Avoid garbage
+            yield match.group('quoted'), 'PDF from script', False
+
 
 class OpenAISerperReportFinder:
     """
@@ -43,15 +347,19 @@ class OpenAISerperReportFinder:
         self.openai_key = openai_key or os.getenv("OPENAI_API_KEY")
         self.serper_key = serper_key or os.getenv("SERPER_API_KEY")
         self.base_url = base_url or os.getenv("OPENAI_BASE_URL")
+        self._http = _shared_http_session()
+        self._page_http = _shared_page_session()
         
         # Initialize OpenRouter retriever as primary
         self.openrouter_retriever = None
         if OpenRouterFallbackRetriever:
             try:
-                self.openrouter_retriever = OpenRouterFallbackRetriever()
-                print("[+] OpenRouter initialized as PRIMARY search method")
+                self.openrouter_retriever = OpenRouterFallbackRetriever(
+                    http_client=_shared_llm_http_client()
+                )
+                logger.info("[+] OpenRouter initialized as PRIMARY search method")
             except Exception as e:
-                print(f"Warning: Could not initialize OpenRouter: {e}")
+                logger.warning("Could not initialize OpenRouter: %s", e)
         
         # Initialize OpenAI for query parsing
         self.openai_client = None
@@ -59,10 +367,11 @@ class OpenAISerperReportFinder:
             try:
                 self.openai_client = OpenAI(
                     api_key=self.openai_key,
-                    base_url=self.base_url
+                    base_url=self.base_url,
+                    http_client=_shared_llm_http_client()
                 )
             except Exception as e:
-                print(f"Warning: Could not initialize OpenAI: {e}")
+                logger.warning("Could not initialize OpenAI: %s", e)
     
     def find_reports(self, prompt: str) -> Dict:
         """
@@ -78,23 +387,41 @@ class OpenAISerperReportFinder:
                 - requested_years: Original years requested
                 - source_pages: Categorized source page URLs
         """
-        print(f"\n{'='*60}")
-        print(f"Processing prompt: {prompt}")
-        print(f"{'='*60}")
+        result = None
+        for event in self.find_reports_stream(prompt):
+            if event['event'] == 'result':
+                result = event['data']
+        return result
+    
+    def find_reports_stream(self, prompt: str) -> Iterator[Dict]:
+        """
+        Run find_reports, yielding progress as each ladder step finishes.
+        
+        Yields {'event': name, 'data': payload} dicts:
+            - parsed: the parsed request (company, report_type, years, quarters)
+            - official_website: official website, IR page and reports pages
+            - reports: {'step', 'reports', 'missing_years'} after each search
+              step that ran, with only that step's new reports
+            - result: the complete find_reports output, always last
+        
+        Cached requests and prompts with a reports URL yield only `result`.
+        """
+        logger.info("Processing prompt: %s", prompt)
         
         # STEP 0: Check if user provided a reports URL directly
         user_provided_url = self._extract_url_from_prompt(prompt)
         if user_provided_url:
-            print(f"\n[STEP 0] User provided URL detected: {user_provided_url}")
-            return self._extract_from_user_url(prompt, user_provided_url)
+            logger.info("[STEP 0] User provided URL detected: %s", user_provided_url)
+            yield {'event': 'result', 'data': self._extract_from_user_url(prompt, user_provided_url)}
+            return
         
         # Step 1: Parse query
         parsed = self._parse_query(prompt)
-        print(f"\nParsed query:")
-        print(f"  Company: {parsed.get('company')}")
-        print(f"  Report Type: {parsed.get('report_type')}")
-        print(f"  Years: {parsed.get('years')}")
-        print(f"  Quarters: {parsed.get('quarters')}")
+        logger.info(
+            "Parsed query: company=%s report_type=%s years=%s quarters=%s",
+            parsed.get('company'), parsed.get('report_type'),
+            parsed.get('years'), parsed.get('quarters'),
+        )
         
         if not parsed.get('company'):
             raise ValueError("Could not identify company from prompt")
@@ -105,79 +432,154 @@ class OpenAISerperReportFinder:
         report_type = parsed.get('report_type', 'annual')
         requested_quarters = parsed.get('quarters')  # ['Q1'], ['Q1','Q2','Q3','Q4'], or None
         
+        # Differently worded prompts often parse to the same request
+        cache_key = (
+            normalize_query(parsed['company']),
+            report_type,
+            tuple(requested_years),
+            tuple(requested_quarters or ()),
+            self.serper_key,
+        )
+        cached = _request_result_cache.get(cache_key)
+        if cached is not None:
+            logger.info("[CACHE] Reusing results for the same parsed request")
+            yield {'event': 'result', 'data': cached}
+            return
+        
+        yield {'event': 'parsed', 'data': {
+            'company': parsed['company'],
+            'report_type': report_type,
+            'years': list(requested_years),
+            'quarters': requested_quarters or [],
+        }}
+        
         # Initialize output structure
         reports = []
         reports_pages = []
         official_website = ''
         official_investor_relations = ''
         notes_list = []
+        requested_set = frozenset(requested_years)
+        found_years = set()  # Updated as each step adds reports
+        seen_report_urls = set()
+        
+        def add_reports(new_reports: List[Dict]) -> List[Dict]:
+            """Append reports whose URL no earlier step returned; return those."""
+            added = []
+            for r in new_reports:
+                if r.get('url') not in seen_report_urls:
+                    seen_report_urls.add(r.get('url'))
+                    added.append(r)
+                    if r.get('type') != 'investor_relations_page':
+                        found_years.add(r.get('year'))
+            reports.extend(added)
+            return added
         
         # ============================================
         # STRICT RETRIEVAL LADDER
         # ============================================
         
+        # STEP 1 (IR page) and STEP 3 (PDF search) are independent Serper
+        # lookups: start both, so the PDF search runs while the IR page is found
+        if self.serper_key:
+            logger.info("[STEP 1] Finding official company website...")
+            logger.info("[STEP 3] Searching for PDF documents...")
+            executor = ThreadPoolExecutor(max_workers=2)
+            ir_future = executor.submit(self._find_investor_relations_page, parsed['company'])
+            serper_future = executor.submit(
+                self._search_with_serper,
+                company=parsed['company'],
+                report_type=report_type,
+                years=requested_years,
+                requested_quarters=requested_quarters
+            )
+            executor.shutdown(wait=False)
+        
         # STEP 1: Find official domain and IR page via Serper
         if self.serper_key:
-            print(f"\n[STEP 1] Finding official company website...")
-            ir_page = self._find_investor_relations_page(parsed['company'])
+            ir_page = ir_future.result()
             if ir_page:
                 official_investor_relations = ir_page
                 # Extract official website from IR page
-                from urllib.parse import urlparse
-                parsed_url = urlparse(ir_page)
+                parsed_url = _cached_urlparse(ir_page)
                 official_website = f"{parsed_url.scheme}://{parsed_url.netloc}"
-                print(f"  Found: {official_website}")
+                logger.info("Found: %s", official_website)
                 notes_list.append(f"Found official IR: {ir_page}")
             
             # STEP 2: Reports pages search SKIPPED for speed - users can use IR link
             # print(f\"\\n[STEP 2] Searching for reports listing pages...\")\n            # reports_pages = self._find_reports_pages(parsed['company'], official_website)
             if reports_pages:
                 notes_list.append(f"Found {len(reports_pages)} reports pages")
-                for rp in reports_pages:
-                    print(f"  Found {rp['doc_category']}: {rp['url']}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    for rp in reports_pages:
+                        logger.debug("Found %s: %s", rp['doc_category'], rp['url'])
             
             # FALLBACK: If no reports pages but have IR page, add it as fallback
             if not reports_pages and official_investor_relations:
                 reports_pages = [{'doc_category': 'Investor Relations', 'url': official_investor_relations}]
-                print(f"  Fallback: Using IR page as reports page")
+                logger.info("Fallback: Using IR page as reports page")
+            
+            yield {'event': 'official_website', 'data': {
+                'official_website': official_website,
+                'official_investor_relations': official_investor_relations,
+                'reports_pages': list(reports_pages),
+            }}
         
         # STEP 3: Search for PDFs using Serper (primary)
         if self.serper_key:
-            print(f"\n[STEP 3] Searching for PDF documents...")
-            serper_reports = self._search_with_serper(
-                company=parsed['company'],
-                report_type=report_type,
-                years=requested_years,
-                requested_quarters=requested_quarters
-            )
-            reports.extend(serper_reports)
-            print(f"[SERPER] Found {len(serper_reports)} documents")
+            serper_reports = add_reports(serper_future.result())
+            logger.info("[SERPER] Found %s documents", len(serper_reports))
             if serper_reports:
                 notes_list.append(f"Serper found {len(serper_reports)} PDFs")
         
         # Calculate missing years after Serper
-        found_years = set(r.get('year') for r in reports if r.get('type') != 'investor_relations_page')
-        missing_years = sorted([y for y in requested_years if y not in found_years])
+        missing_years = sorted(requested_set - found_years)
+        if self.serper_key:
+            yield {'event': 'reports', 'data': {
+                'step': 'serper', 'reports': serper_reports, 'missing_years': missing_years,
+            }}
+        if not missing_years:
+            logger.info("[SKIP] All requested years covered, skipping fallback steps")
         
         # STEP 4: Site-restricted search for missing years
-        if missing_years and self.serper_key and official_website:
-            print(f"\n[STEP 4] Site-restricted search for missing years: {missing_years}")
-            site_domain = urlparse(official_website).netloc
-            for year in missing_years:
-                site_reports = self._search_site_restricted(
-                    site_domain, parsed['company'], report_type, year
-                )
-                if site_reports:
-                    reports.extend(site_reports)
-                    notes_list.append(f"Site search found {len(site_reports)} for {year}")
-        
-        # Recalculate missing years
-        found_years = set(r.get('year') for r in reports if r.get('type') != 'investor_relations_page')
-        missing_years = sorted([y for y in requested_years if y not in found_years])
+        elif self.serper_key and official_website:
+            logger.info("[STEP 4] Site-restricted search for missing years: %s", missing_years)
+            site_domain = _cached_urlparse(official_website).netloc
+            # Years are independent: search them in parallel, keep year order
+            with ThreadPoolExecutor(max_workers=min(8, len(missing_years))) as executor:
+                per_year = list(executor.map(
+                    lambda year: self._search_site_restricted(
+                        site_domain, parsed['company'], report_type, year
+                    ),
+                    missing_years
+                ))
+            site_added = []
+            for year, site_reports in zip(missing_years, per_year):
+                added = add_reports(site_reports)
+                if added:
+                    site_added.extend(added)
+                    notes_list.append(f"Site search found {len(added)} for {year}")
+            missing_years = sorted(requested_set - found_years)
+            yield {'event': 'reports', 'data': {
+                'step': 'site_search', 'reports': site_added, 'missing_years': missing_years,
+            }}
+        
+        # STEP 5: OpenRouter fallback, off by default for speed. When Serper
+        # already covers most requested years, the gaps are only noted: an
+        # LLM call is not worth a few seconds for one or two years
+        coverage = len(found_years & requested_set) / max(1, len(requested_set))
+        run_fallback = (
+            OPENROUTER_FALLBACK_ENABLED
+            and self.openrouter_retriever
+            and (not reports or (missing_years and coverage < OPENROUTER_FALLBACK_MAX_COVERAGE))
+        )
+        if OPENROUTER_FALLBACK_ENABLED and reports and missing_years and not run_fallback:
+            logger.info("[STEP 5] Skipped: Serper coverage %.0f%%", coverage * 100)
+            notes_list.append(f"Skipped LLM fallback: Serper coverage {coverage:.0%}")
         
-        # STEP 5: OpenRouter fallback DISABLED for speed (uncomment if needed)
-        if False and (not reports or missing_years) and self.openrouter_retriever:
-            print(f"\n[STEP 5] OpenRouter AI fallback...")
+        if run_fallback:
+            logger.info("[STEP 5] OpenRouter AI fallback...")
+            openrouter_added = []
             try:
                 doc_types = self._get_doc_types(report_type)
                 
@@ -195,36 +597,39 @@ class OpenAISerperReportFinder:
                     official_investor_relations = result.get('official_investor_relations')
                 
                 # Add OpenRouter reports_pages
-                if result.get('reports_pages'):
-                    for rp in result.get('reports_pages', []):
-                        if rp not in reports_pages:
-                            reports_pages.append(rp)
+                seen_page_urls = {rp.get('url') for rp in reports_pages}
+                for rp in result.get('reports_pages') or []:
+                    if rp.get('url') not in seen_page_urls:
+                        seen_page_urls.add(rp.get('url'))
+                        reports_pages.append(rp)
                 
                 # Add OpenRouter documents for missing years only
-                for doc in result.get('documents', []):
-                    doc_year = self._extract_year(doc.get('period', ''))
-                    if doc_year in missing_years:
-                        reports.append({
-                            'year': doc_year,
-                            'type': doc.get('doc_type', report_type),
-                            'title': doc.get('title', ''),
-                            'url': doc.get('pdf_url', ''),
-                            'source_page': doc.get('source_page', ''),
-                            'source': 'openrouter'
-                        })
+                openrouter_added = add_reports([
+                    {
+                        'year': doc_year,
+                        'type': doc.get('doc_type', report_type),
+                        'title': doc.get('title', ''),
+                        'url': doc.get('pdf_url', ''),
+                        'source_page': doc.get('source_page', ''),
+                        'source': 'openrouter'
+                    }
+                    for doc in result.get('documents', [])
+                    if (doc_year := self._extract_year(doc.get('period', ''))) in missing_years
+                ])
                 
                 if result.get('notes') and 'error' not in result.get('notes', '').lower():
                     notes_list.append(f"OpenRouter: {result.get('notes')}")
                 
-                print(f"[OPENROUTER] Added documents from AI fallback")
+                logger.info("[OPENROUTER] Added documents from AI fallback")
                 
             except Exception as e:
-                print(f"[OPENROUTER] Error: {e}")
+                logger.warning("[OPENROUTER] Error: %s", e)
                 # Don't show raw errors to users - just log them
-        
-        # Recalculate missing years
-        found_years = set(r.get('year') for r in reports if r.get('type') != 'investor_relations_page')
-        missing_years = sorted([y for y in requested_years if y not in found_years])
+            
+            missing_years = sorted(requested_set - found_years)
+            yield {'event': 'reports', 'data': {
+                'step': 'openrouter', 'reports': openrouter_added, 'missing_years': missing_years,
+            }}
         
         # STEP 6: DISABLED - AI analysis was too slow
         # if not reports or missing_years:
@@ -237,50 +642,52 @@ class OpenAISerperReportFinder:
         notes = ". ".join(notes_list) if notes_list else "Search completed"
         
         # Log results
-        print(f"\n[OK] FINAL RESULTS: Found {len(reports)} total results")
-        print(f"   Company: {parsed['company']}")
-        print(f"   Official website: {official_website}")
-        print(f"   Reports pages: {len(reports_pages)}")
-        print(f"   Requested years: {requested_years}")
-        print(f"   Found years: {sorted(found_years)}")
-        if missing_years:
-            print(f"   [!] Missing years: {missing_years}")
+        logger.info(
+            "[OK] FINAL RESULTS: %s results for %s (website %s, %s reports pages); "
+            "requested years %s, found %s, missing %s",
+            len(reports), parsed['company'], official_website or '-', len(reports_pages),
+            requested_years, sorted(found_years, key=str), missing_years or '-',
+        )
         
         # Calculate missing periods (quarters for quarterly, years for annual)
-        missing_periods = []
-        if report_type == 'quarterly' and requested_quarters:
+        quarterly_periods = report_type == 'quarterly' and requested_quarters
+        if quarterly_periods:
             # For quarterly: check each (year, quarter) pair
-            found_periods = set()
-            for r in reports:
-                if r.get('quarter') and r.get('year'):
-                    found_periods.add((r.get('year'), r.get('quarter')))
-            
-            for year in requested_years:
-                for quarter in requested_quarters:
-                    if (year, quarter.upper()) not in found_periods:
-                        missing_periods.append(f"{quarter.upper()} {year}")
+            requested_periods = [
+                (year, quarter.upper())
+                for year in requested_years
+                for quarter in requested_quarters
+            ]
+            found_periods = {
+                (r.get('year'), r.get('quarter'))
+                for r in reports
+                if r.get('quarter') and r.get('year')
+            }
+            missing_periods = [
+                f"{quarter} {year}"
+                for year, quarter in requested_periods
+                if (year, quarter) not in found_periods
+            ]
             
-            print(f"   Found periods: {sorted(found_periods) if found_periods else 'None'}")
+            logger.info("Found periods: %s", sorted(found_periods) if found_periods else 'None')
         else:
             # For annual: missing_periods = missing_years formatted
             missing_periods = [f"FY{y}" for y in missing_years]
         
         if missing_periods:
-            print(f"   [!] Missing periods: {missing_periods}")
+            logger.info("[!] Missing periods: %s", missing_periods)
         
         # Build request structure for output
         request_info = {
             'doc_type': report_type,
             'periods': []
         }
-        if report_type == 'quarterly' and requested_quarters:
-            for year in requested_years:
-                for quarter in requested_quarters:
-                    request_info['periods'].append(f"{quarter.upper()} {year}")
+        if quarterly_periods:
+            request_info['periods'] = [f"{quarter} {year}" for year, quarter in requested_periods]
         else:
             request_info['periods'] = [f"FY{y}" for y in requested_years]
         
-        return {
+        result = {
             'company': parsed['company'],
             'request': request_info,  # New: structured request info
             'official_website': official_website,
@@ -293,6 +700,18 @@ class OpenAISerperReportFinder:
             'requested_quarters': requested_quarters or [],  # New: requested quarters
             'notes': notes
         }
+        if reports or reports_pages:
+            _request_result_cache.set(cache_key, result)
+        yield {'event': 'result', 'data': result}
+    
+    async def find_reports_async(self, prompt: str) -> Dict:
+        """
+        Awaitable find_reports for async callers.
+        
+        The retrieval ladder runs in a worker thread of the running loop's
+        default executor, so the event loop keeps serving other requests.
+        """
+        return await asyncio.to_thread(self.find_reports, prompt)
     
     def _get_doc_types(self, report_type: str) -> List[str]:
         """Map report type to list of document types for OpenRouter."""
@@ -342,16 +761,16 @@ Do NOT say generic things like "not found" or "unavailable"."""
             )
             
             reason = response.choices[0].message.content.strip()
-            print(f"  AI Analysis: {reason}")
+            logger.info("AI Analysis: %s", reason)
             return reason
             
         except Exception as e:
-            print(f"  AI Analysis failed: {e}")
+            logger.warning("AI Analysis failed: %s", e)
             return f"Reports for {company} ({missing_years}) could not be located - please check the company's official investor relations page"
     
     def _extract_year(self, period: str) -> int:
         """Extract year from period string like 'FY2023' or 'Q1 2024'."""
-        match = re.search(r'(20\d{2})', period)
+        match = _YEAR_RE.search(period)
         if match:
             return int(match.group(1))
         return datetime.now().year
@@ -362,20 +781,15 @@ Do NOT say generic things like "not found" or "unavailable"."""
         Returns URL if it looks like a reports/financial page.
         """
         # Find all URLs in the prompt
-        url_pattern = r'https?://[^\s<>"\'()]+'
-        urls = re.findall(url_pattern, prompt)
+        urls = _PROMPT_URL_RE.findall(prompt)
         
         if not urls:
             return None
         
         # Check if any URL looks like a reports page
-        reports_keywords = ['report', 'financial', 'result', 'investor', 
-                           'filing', 'disclosure', 'publication', 'annual', 'quarterly']
-        
         for url in urls:
-            url_lower = url.lower()
-            if any(kw in url_lower for kw in reports_keywords):
-                print(f"  Detected reports page URL: {url}")
+            if _REPORTS_URL_KEYWORD_RE.search(url):
+                logger.info("Detected reports page URL: %s", url)
                 return url
         
         # Return first URL even if doesn't have keywords
@@ -386,7 +800,7 @@ Do NOT say generic things like "not found" or "unavailable"."""
         Extract PDFs directly from user-provided reports URL.
         This is the PRIMARY source when user provides a URL.
         """
-        print(f"\n[DIRECT EXTRACTION] Fetching page: {reports_url}")
+        logger.info("[DIRECT EXTRACTION] Fetching page: %s", reports_url)
         
         # Parse the original prompt for company and years
         parsed = self._parse_query(prompt)
@@ -395,7 +809,7 @@ Do NOT say generic things like "not found" or "unavailable"."""
         report_type = parsed.get('report_type', 'annual')
         
         # Extract official website from URL
-        parsed_url = urlparse(reports_url)
+        parsed_url = _cached_urlparse(reports_url)
         official_website = f"{parsed_url.scheme}://{parsed_url.netloc}"
         
         reports = []
@@ -409,27 +823,36 @@ Do NOT say generic things like "not found" or "unavailable"."""
                 'Accept-Language': 'en-US,en;q=0.5',
             }
             
-            response = requests.get(reports_url, headers=headers, timeout=15)
-            response.raise_for_status()
-            
-            html_content = response.text
-            print(f"  Page fetched: {len(html_content)} bytes")
+            # Stream the body so an oversized page is cut off at
+            # MAX_PAGE_BYTES instead of being buffered whole
+            with self._page_http.get(reports_url, headers=headers, timeout=15, stream=True) as response:
+                response.raise_for_status()
+                body = bytearray()
+                for chunk in response.iter_content(chunk_size=65536):
+                    body += chunk
+                    if len(body) >= MAX_PAGE_BYTES:
+                        del body[MAX_PAGE_BYTES:]
+                        logger.info("Page truncated at %s bytes", MAX_PAGE_BYTES)
+                        break
+                html_content = body.decode(response.encoding or 'utf-8', errors='replace')
+            logger.info("Page fetched: %s bytes", len(body))
             
             # Extract all PDF links from the page
             pdf_links = self._extract_pdfs_from_html(html_content, reports_url)
-            print(f"  Found {len(pdf_links)} PDF links")
+            logger.info("Found %s PDF links", len(pdf_links))
             
             # Filter and categorize PDFs
+            requested_years_set = set(requested_years)
             for pdf in pdf_links:
                 pdf_url = pdf['url']
                 title = pdf['title']
                 
                 # Try to extract year from title or URL
-                year_match = re.search(r'(20\d{2})', title + pdf_url)
+                year_match = _YEAR_RE.search(title + pdf_url)
                 pdf_year = int(year_match.group(1)) if year_match else None
                 
                 # If we have specific years requested, filter
-                if requested_years and pdf_year and pdf_year not in requested_years:
+                if requested_years and pdf_year and pdf_year not in requested_years_set:
                     continue
                 
                 # Detect document type from title
@@ -460,18 +883,18 @@ Do NOT say generic things like "not found" or "unavailable"."""
             
         except requests.RequestException as e:
             notes_list.append(f"Failed to fetch page: {str(e)}")
-            print(f"  Error fetching page: {e}")
+            logger.warning("Error fetching page: %s", e)
         except Exception as e:
             notes_list.append(f"Extraction error: {str(e)}")
-            print(f"  Extraction error: {e}")
+            logger.warning("Extraction error: %s", e)
         
         # Calculate missing years
         found_years = set(r.get('year') for r in reports)
-        missing_years = sorted([y for y in requested_years if y not in found_years])
+        missing_years = sorted(set(requested_years) - found_years)
         
         notes = ". ".join(notes_list) if notes_list else "Extraction completed"
         
-        print(f"\n[OK] Extracted {len(reports)} reports from user-provided URL")
+        logger.info("[OK] Extracted %s reports from user-provided URL", len(reports))
         
         return {
             'company': company,
@@ -487,63 +910,38 @@ Do NOT say generic things like "not found" or "unavailable"."""
     def _extract_pdfs_from_html(self, html: str, base_url: str) -> List[Dict]:
         """
         Extract PDF links from HTML content.
-        Handles relative URLs and various link patterns.
+        Handles relative URLs and various link patterns; parses the page with
+        selectolax when available and falls back to a regex scan.
         """
-        from urllib.parse import urljoin
-        
         pdf_links = []
-        seen_urls = set()
+        by_url = {}
+        anchored = set()  # URLs whose title came from anchor text
         
-        # Pattern 1: Direct PDF links in href
-        href_pattern = r'<a[^>]+href=["\']([^"\']+\.pdf[^"\']*)["\'][^>]*>([^<]*)</a>'
-        for match in re.finditer(href_pattern, html, re.IGNORECASE):
-            url = match.group(1)
-            title = match.group(2).strip() or "Untitled PDF"
-            
+        # Root-relative links just need the page origin; urljoin would
+        # re-parse base_url for every one of them
+        base = _cached_urlparse(base_url)
+        origin = f"{base.scheme}://{base.netloc}"
+        
+        candidates = _pdf_candidates_from_tree(html) if HAS_SELECTOLAX else _pdf_candidates_from_regex(html)
+        for url, title, is_anchor in candidates:
             # Handle relative URLs
-            if not url.startswith('http'):
-                url = urljoin(base_url, url)
-            
-            if url not in seen_urls:
-                seen_urls.add(url)
-                pdf_links.append({'url': url, 'title': title})
-        
-        # Pattern 2: Links with .pdf anywhere in href (may have query params)
-        href_pattern2 = r'<a[^>]+href=["\']([^"\']*["\']?)[^>]*>([^<]*)</a>'
-        for match in re.finditer(href_pattern2, html, re.IGNORECASE):
-            url = match.group(1).rstrip('"\'')
-            title = match.group(2).strip()
-            
-            if '.pdf' in url.lower():
-                if not url.startswith('http'):
-                    url = urljoin(base_url, url)
-                
-                if url not in seen_urls:
-                    seen_urls.add(url)
-                    pdf_links.append({'url': url, 'title': title or "PDF Document"})
-        
-        # Pattern 3: Data attributes that may contain PDF URLs
-        data_pattern = r'data-[a-z-]+=["\']([^"\']*\.pdf[^"\']*)["\']'
-        for match in re.finditer(data_pattern, html, re.IGNORECASE):
-            url = match.group(1)
-            if not url.startswith('http'):
+            if url.startswith('http'):
+                pass
+            elif url.startswith('/') and not url.startswith('//') and '/.' not in url:
+                url = origin + url
+            else:
                 url = urljoin(base_url, url)
             
-            if url not in seen_urls:
-                seen_urls.add(url)
-                pdf_links.append({'url': url, 'title': 'PDF from data attribute'})
-        
-        # Pattern 4: JavaScript strings containing PDF URLs
-        js_pattern = r'["\']([^"\']*\.pdf[^"\']*)["\']'
-        for match in re.finditer(js_pattern, html, re.IGNORECASE):
-            url = match.group(1)
-            if url.startswith('/') or url.startswith('http'):
-                if not url.startswith('http'):
-                    url = urljoin(base_url, url)
-                
-                if url not in seen_urls and len(url) < 500:  # Avoid garbage
-                    seen_urls.add(url)
-                    pdf_links.append({'url': url, 'title': 'PDF from script'})
+            # A script/data hit earlier in the page keeps its place, but takes
+            # the link text once the same URL turns up in an anchor
+            entry = by_url.get(url)
+            if entry is None:
+                entry = by_url[url] = {'url': url, 'title': title}
+                pdf_links.append(entry)
+            elif is_anchor and url not in anchored:
+                entry['title'] = title
+            if is_anchor:
+                anchored.add(url)
         
         return pdf_links
     
@@ -561,41 +959,32 @@ Do NOT say generic things like "not found" or "unavailable"."""
             ('Filings', 'filings disclosures regulatory'),
         ]
         
-        for doc_category, keywords in categories:
-            query = f'"{company}" {keywords} investor relations page'
+        # The category searches are independent, so they go out as one batch
+        responses = self._serper_search_batch([
+            f'"{company}" {keywords} investor relations page'
+            for _, keywords in categories
+        ], num=5)
+        
+        seen_urls = set()
+        for (doc_category, _), results in zip(categories, responses):
+            if results is None:
+                continue
             
-            try:
-                response = requests.post(
-                    'https://google.serper.dev/search',
-                    headers={
-                        'X-API-KEY': self.serper_key,
-                        'Content-Type': 'application/json'
-                    },
-                    json={'q': query, 'num': 5},
-                    timeout=5
-                )
-                
-                if response.status_code == 200:
-                    results = response.json()
-                    
-                    # Look for pages with report-like URLs
-                    for result in results.get('organic', []):
-                        url = result.get('link', '')
-                        title = result.get('title', '').lower()
-                        
-                        # Check if URL contains report-related paths
-                        report_paths = ['report', 'result', 'financial', 'publication', 'filing', 'disclosure', 'annual', 'quarterly']
-                        if any(path in url.lower() for path in report_paths):
-                            # Avoid adding duplicates
-                            if not any(rp['url'] == url for rp in reports_pages):
-                                reports_pages.append({
-                                    'doc_category': doc_category,
-                                    'url': url
-                                })
-                                break  # Only add first match per category
+            # Look for pages with report-like URLs
+            for result in results.get('organic', []):
+                url = result.get('link', '')
+                title = result.get('title', '').lower()
                 
-            except Exception as e:
-                print(f"    Error searching for {doc_category} pages: {e}")
+                # Check if URL contains report-related paths
+                if _REPORTS_PAGE_PATH_RE.search(url):
+                    # Avoid adding duplicates
+                    if url not in seen_urls:
+                        seen_urls.add(url)
+                        reports_pages.append({
+                            'doc_category': doc_category,
+                            'url': url
+                        })
+                        break  # Only add first match per category
         
         return reports_pages
     
@@ -609,42 +998,30 @@ Do NOT say generic things like "not found" or "unavailable"."""
             f'site:{site_domain} results reports archive {year} pdf',
         ]
         
-        all_results = []
+        # All variants go out in one batched request; the first variant
+        # that yields PDFs wins, as when they were tried one by one
+        for results in self._serper_search_batch(queries, num=5):
+            if results is not None:
+                pdf_results = self._extract_pdf_urls(results, year, report_type, company)
+                if pdf_results:
+                    return pdf_results
         
-        for query in queries:
-            print(f"    -> Site search: {query}")
-            
-            try:
-                response = requests.post(
-                    'https://google.serper.dev/search',
-                    headers={
-                        'X-API-KEY': self.serper_key,
-                        'Content-Type': 'application/json'
-                    },
-                    json={'q': query, 'num': 5},
-                    timeout=5
-                )
-                
-                if response.status_code == 200:
-                    results = response.json()
-                    pdf_results = self._extract_pdf_urls(results, year, report_type, company)
-                    if pdf_results:
-                        all_results.extend(pdf_results)
-                        break  # Stop if we found results
-                
-            except Exception as e:
-                print(f"    Error in site search: {e}")
-        
-        return all_results
+        return []
     
     def _parse_query(self, prompt: str) -> Dict:
         """Parse query using OpenAI or fallback to regex."""
-        # Try OpenAI first
+        # Try OpenAI first; repeated prompts reuse the earlier parse
         if self.openai_client:
+            cache_key = normalize_query(prompt)
+            cached = _parsed_query_cache.get(cache_key)
+            if cached is not None:
+                return cached
             try:
-                return self._parse_with_openai(prompt)
+                parsed = self._parse_with_openai(prompt)
+                _parsed_query_cache.set(cache_key, parsed)
+                return parsed
             except Exception as e:
-                print(f"OpenAI parsing failed: {e}, using fallback")
+                logger.warning("OpenAI parsing failed: %s, using fallback", e)
         
         # Fallback to regex
         return self._parse_with_regex(prompt)
@@ -657,14 +1034,6 @@ Do NOT say generic things like "not found" or "unavailable"."""
 3. Years (expand ranges like "2020 to 2024" to [2020, 2021, 2022, 2023, 2024])
 4. Specific quarters if mentioned (Q1, Q2, Q3, Q4 or ranges like Q1-Q4)
 
-Respond in JSON:
-{
-  "company": "company name or ticker",
-  "report_type": "annual|quarterly|10-k|10-q|earnings|financial_statements",
-  "years": [2020, 2021, 2022],
-  "quarters": ["Q1", "Q2", "Q3", "Q4"]  // Only if specific quarters requested, otherwise null
-}
-
 IMPORTANT:
 - If user says "Q1 2023" -> quarters: ["Q1"], years: [2023]
 - If user says "Q1-Q4 2023" -> quarters: ["Q1", "Q2", "Q3", "Q4"], years: [2023]
@@ -678,11 +1047,12 @@ IMPORTANT:
                 {"role": "user", "content": prompt}
             ],
             temperature=0,
-            response_format={"type": "json_object"},
+            max_tokens=200,
+            response_format=PARSED_QUERY_RESPONSE_FORMAT,
             timeout=5  # Reduced timeout for faster responses
         )
         
-        return json.loads(response.choices[0].message.content)
+        return ParsedQuery.model_validate_json(response.choices[0].message.content).model_dump()
     
     def _parse_with_regex(self, prompt: str) -> Dict:
         """Fallback parser using regex patterns with STRICT quarter handling."""
@@ -815,61 +1185,57 @@ IMPORTANT:
         KEY RULE for QUARTERLY: Returns EXACTLY ONE PDF per (year, quarter) pair.
         requested_quarters: If specified (e.g. ['Q1']), only return docs for those specific quarters.
         """
-        print(f"\n[SEARCH] Searching {len(years)} years...")
+        logger.info("[SEARCH] Searching %s years...", len(years))
         if requested_quarters:
-            print(f"  -> Looking for specific quarters: {requested_quarters}")
+            logger.info("-> Looking for specific quarters: %s", requested_quarters)
         all_candidates = []
         
         # For quarterly requests with specific quarters, search for each (year, quarter) pair
         if report_type == 'quarterly' and requested_quarters:
             # Create list of (year, quarter) pairs to search
             search_periods = [(year, q) for year in years for q in requested_quarters]
-            print(f"  [PERIODS] Searching {len(search_periods)} period(s): {search_periods}")
+            logger.info("[PERIODS] Searching %s period(s): %s", len(search_periods), search_periods)
             
-            # Process periods in parallel (max 4 concurrent)
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                future_to_period = {
-                    executor.submit(self._search_quarter, company, year, quarter): (year, quarter) 
+            # All periods share each query round: one batched Serper request per round
+            found = self._run_search_rounds(
+                {
+                    (year, quarter): self._quarter_queries(company, year, quarter)
                     for year, quarter in search_periods
-                }
-                
-                for future in as_completed(future_to_period):
-                    year, quarter = future_to_period[future]
-                    try:
-                        period_candidates = future.result(timeout=10)
-                        if period_candidates:
-                            all_candidates.extend(period_candidates)
-                            print(f"  [OK] {quarter} {year}: Found {len(period_candidates)} candidates")
-                        else:
-                            print(f"  - {quarter} {year}: No candidates found")
-                    except Exception as e:
-                        print(f"  [X] {quarter} {year}: Error - {e}")
+                },
+                lambda period, results: self._quarter_candidates(results, company, *period),
+                enough=1,
+            )
+            for (year, quarter), period_candidates in found.items():
+                if period_candidates:
+                    all_candidates.extend(period_candidates)
+                    logger.info("[OK] %s %s: Found %s candidates", quarter, year, len(period_candidates))
+                else:
+                    logger.info("- %s %s: No candidates found", quarter, year)
         else:
-            # Process years in parallel (max 5 concurrent) for speed
-            with ThreadPoolExecutor(max_workers=5) as executor:
-                future_to_year = {
-                    executor.submit(self._search_year, company, report_type, year, requested_quarters): year 
+            # All years share each query round: one batched Serper request per round
+            found = self._run_search_rounds(
+                {
+                    year: self._year_queries(company, report_type, year, requested_quarters)
                     for year in years
-                }
-                
-                for future in as_completed(future_to_year):
-                    year = future_to_year[future]
-                    try:
-                        year_candidates = future.result(timeout=5)
-                        if year_candidates:
-                            all_candidates.extend(year_candidates)
-                            print(f"  [OK] Year {year}: Found {len(year_candidates)} candidates")
-                        else:
-                            print(f"  - Year {year}: No candidates found")
-                    except Exception as e:
-                        print(f"  [X] Year {year}: Error - {e}")
+                },
+                lambda year, results: self._extract_pdf_urls(
+                    results, year, report_type, company, requested_quarters
+                ),
+                enough=2,
+            )
+            for year, year_candidates in found.items():
+                if year_candidates:
+                    all_candidates.extend(year_candidates)
+                    logger.info("[OK] Year %s: Found %s candidates", year, len(year_candidates))
+                else:
+                    logger.info("- Year %s: No candidates found", year)
         
         # ========== SELECTION LOGIC ==========
         best_reports = []
         
         if report_type == 'quarterly' and requested_quarters:
             # QUARTERLY MODE: Select ONE BEST PDF per (year, quarter) pair
-            print(f"\n[SELECT] Selecting best PDF per period from {len(all_candidates)} candidates...")
+            logger.info("[SELECT] Selecting best PDF per period from %s candidates...", len(all_candidates))
             
             # Group candidates by (year, quarter)
             candidates_by_period = {}
@@ -895,14 +1261,14 @@ IMPORTANT:
                         if best_score > 0:
                             best_doc['score'] = best_score
                             best_reports.append(best_doc)
-                            print(f"  [BEST] {quarter} {year}: {best_doc['title'][:50]}... (score: {best_score})")
+                            logger.info("[BEST] %s %s: %s... (score: %s)", quarter, year, best_doc['title'][:50], best_score)
                         else:
-                            print(f"  [NONE] {quarter} {year}: All candidates rejected (best score: {best_score})")
+                            logger.info("[NONE] %s %s: All candidates rejected (best score: %s)", quarter, year, best_score)
                     else:
-                        print(f"  [MISS] {quarter} {year}: No candidates found")
+                        logger.info("[MISS] %s %s: No candidates found", quarter, year)
         else:
             # ANNUAL MODE: Select ONE BEST PDF per year
-            print(f"\n[SELECT] Selecting best PDF per year from {len(all_candidates)} candidates...")
+            logger.info("[SELECT] Selecting best PDF per year from %s candidates...", len(all_candidates))
             
             # Group candidates by reporting_period_year
             candidates_by_year = {}
@@ -923,11 +1289,11 @@ IMPORTANT:
                     if best_score > 0:
                         best_doc['score'] = best_score
                         best_reports.append(best_doc)
-                        print(f"  [BEST] Year {year}: {best_doc['title'][:50]}... (score: {best_score})")
+                        logger.info("[BEST] Year %s: %s... (score: %s)", year, best_doc['title'][:50], best_score)
                     else:
-                        print(f"  [NONE] Year {year}: All candidates rejected (best score: {best_score})")
+                        logger.info("[NONE] Year %s: All candidates rejected (best score: %s)", year, best_score)
                 else:
-                    print(f"  [MISS] Year {year}: No candidates found")
+                    logger.info("[MISS] Year %s: No candidates found", year)
         
         return best_reports
     
@@ -949,7 +1315,7 @@ IMPORTANT:
         # ========== SOURCE PRIORITY (MOST IMPORTANT) ==========
         # Check if URL is from company's own domain
         significant_words = self._get_significant_words(company)
-        domain = urlparse(doc.get('url', '')).netloc.lower()
+        domain = _cached_urlparse(doc.get('url', '')).netloc.lower()
         
         is_company_domain = any(word in domain for word in significant_words)
         is_exchange_domain = any(ex in domain for ex in [
@@ -959,10 +1325,10 @@ IMPORTANT:
         
         if is_company_domain:
             score += 100  # STRONGLY prefer company IR PDFs
-            print(f"    +100 (company domain)")
+            logger.debug("+100 (company domain)")
         elif is_exchange_domain:
             score -= 50  # Penalize exchange filings for "annual report" requests
-            print(f"    -50 (exchange/regulator domain)")
+            logger.debug("-50 (exchange/regulator domain)")
         
         # ========== CONTENT SCORING ==========
         # Prefer "Annual Report" in title (multiple languages)
@@ -987,12 +1353,7 @@ IMPORTANT:
             score += 20
         
         # Prefer IR archive paths (multiple languages)
-        ir_paths = [
-            '/investor', '/ir/', '/reports/', '/annual/', '/results/',
-            '/informes/', '/downloads/', '/rapports/', '/berichte/',
-            '/raporlar/', '/relatorios/', '/rapporti/'
-        ]
-        if any(path in url_lower for path in ir_paths):
+        if _IR_ARCHIVE_PATH_RE.search(url_lower):
             score += 30
         
         # ========== EXCLUSION PENALTIES ==========
@@ -1008,14 +1369,8 @@ IMPORTANT:
         
         return score
     
-    def _search_quarter(self, company: str, year: int, quarter: str) -> List[Dict]:
-        """
-        Search for reports for a single (year, quarter) using targeted queries.
-        
-        This method is designed to be called in parallel by ThreadPoolExecutor.
-        Returns candidates with the 'quarter' field already set.
-        """
-        all_candidates = []
+    def _quarter_queries(self, company: str, year: int, quarter: str) -> List[str]:
+        """Query strategies for a single (year, quarter), in order."""
         quarter_upper = quarter.upper()
         
         # Quarter-specific labels for search
@@ -1027,69 +1382,35 @@ IMPORTANT:
         }
         labels = quarter_labels.get(quarter_upper, [quarter])
         
-        # Generate targeted queries for this specific quarter (limited for speed)
-        queries = [
+        # Generate targeted queries for this specific quarter (limited to 2 for speed)
+        return [
             f'"{company}" "{labels[0]} {year}" results pdf',
             f'"{company}" "{labels[0]} {year}" financial results filetype:pdf',
         ]
-        
-        # Try each query strategy (limit to 2 for speed)
-        for query in queries[:2]:
-            print(f"    -> Searching: {query}")
-            
-            try:
-                response = requests.post(
-                    'https://google.serper.dev/search',
-                    headers={
-                        'X-API-KEY': self.serper_key,
-                        'Content-Type': 'application/json'
-                    },
-                    json={
-                        'q': query,
-                        'num': 10
-                    },
-                    timeout=5
-                )
-                
-                if response.status_code == 200:
-                    results = response.json()
-                    # Extract with the specific quarter filter
-                    candidates = self._extract_pdf_urls(
-                        results, year, 'quarterly', company, [quarter_upper]
-                    )
-                    if candidates:
-                        # VERIFY: Only keep candidates that actually match the requested quarter
-                        # Do NOT forcefully override the quarter - trust the extraction
-                        verified_candidates = []
-                        for c in candidates:
-                            extracted_quarter = c.get('quarter')
-                            if extracted_quarter == quarter_upper:
-                                verified_candidates.append(c)
-                            else:
-                                print(f"    [FILTER] Rejected {c.get('title', '')[:40]}... (extracted {extracted_quarter}, need {quarter_upper})")
-                        
-                        if verified_candidates:
-                            all_candidates.extend(verified_candidates)
-                            # If we found good results, stop searching
-                            if len(verified_candidates) >= 1:
-                                break
-                else:
-                    print(f"      [ERROR] Serper returned status {response.status_code}")
-            
-            except Exception as e:
-                print(f"      Serper search error: {e}")
-        
-        return all_candidates
     
-    def _search_year(self, company: str, report_type: str, year: int, requested_quarters: List[str] = None) -> List[Dict]:
-        """
-        Search for reports for a single year using multiple query strategies.
+    def _quarter_candidates(self, results: Dict, company: str, year: int, quarter: str) -> List[Dict]:
+        """Candidates from one Serper result that match the requested quarter."""
+        quarter_upper = quarter.upper()
         
-        This method is designed to be called in parallel by ThreadPoolExecutor.
-        requested_quarters: If specified (e.g. ['Q1']), only return docs for those specific quarters.
-        """
-        all_candidates = []
+        # Extract with the specific quarter filter
+        candidates = self._extract_pdf_urls(
+            results, year, 'quarterly', company, [quarter_upper]
+        )
         
+        # VERIFY: Only keep candidates that actually match the requested quarter
+        # Do NOT forcefully override the quarter - trust the extraction
+        verified_candidates = []
+        for c in candidates:
+            extracted_quarter = c.get('quarter')
+            if extracted_quarter == quarter_upper:
+                verified_candidates.append(c)
+            else:
+                logger.debug("[FILTER] Rejected %s... (extracted %s, need %s)", c.get('title', '')[:40], extracted_quarter, quarter_upper)
+        
+        return verified_candidates
+    
+    def _year_queries(self, company: str, report_type: str, year: int, requested_quarters: List[str] = None) -> List[str]:
+        """Query strategies for a single year, broadest first."""
         # Get clean company name for site search - remove ticker symbols
         company_clean = company.lower().replace('pjsc', '').replace('oil company', '').strip()
         company_first_word = company_clean.split()[0] if company_clean.split() else company_clean
@@ -1111,7 +1432,7 @@ IMPORTANT:
             # Remove ticker suffixes from parenthetical content
             paren_parts = paren_content.split(',')
             company_for_search = paren_parts[0].strip()  # Take first part before comma
-            print(f"  [DEBUG] Using English name from parentheses: '{company_for_search}'")
+            logger.debug("Using English name from parentheses: '%s'", company_for_search)
         else:
             # Remove parenthetical content (tickers)
             company_for_search = main_name
@@ -1193,39 +1514,166 @@ IMPORTANT:
                 f'"{company}" {report_type} report {year} filetype:pdf',
             ]
         
-        # Try each query strategy
-        for query in queries:
-            print(f"  -> Searching: {query}")
+        return queries
+    
+    def _run_search_rounds(self, jobs: Dict, extract, enough: int) -> Dict:
+        """
+        Run per-period query ladders with one batched Serper request per round.
+        
+        Round i sends the i-th query of every period still searching in a
+        single request. A period stops searching once one query yields at
+        least `enough` candidates, as when its queries ran one by one.
+        
+        Args:
+            jobs: {period: [query, ...]} with queries in strategy order
+            extract: extract(period, serper_results) -> candidates
+            enough: Candidates from one query that end a period's search
             
-            try:
-                response = requests.post(
-                    'https://google.serper.dev/search',
-                    headers={
-                        'X-API-KEY': self.serper_key,
-                        'Content-Type': 'application/json'
-                    },
-                    json={
-                        'q': query,
-                        'num': 10
-                    },
-                    timeout=5
-                )
-                
-                if response.status_code == 200:
-                    results = response.json()
-                    candidates = self._extract_pdf_urls(results, year, report_type, company, requested_quarters)
-                    if candidates:
-                        all_candidates.extend(candidates)
-                        # If we found good results, stop searching
-                        if len(candidates) >= 2:
-                            break
-                else:
-                    print(f"    [ERROR] Serper returned status {response.status_code}: {response.text}")
+        Returns:
+            {period: candidates} for every period in jobs
+        """
+        found = {period: [] for period in jobs}
+        pending = list(jobs)
+        
+        for round_index in range(max((len(q) for q in jobs.values()), default=0)):
+            batch = [
+                (period, jobs[period][round_index])
+                for period in pending
+                if round_index < len(jobs[period])
+            ]
+            if not batch:
+                break
             
-            except Exception as e:
-                print(f"    Serper search error: {e}")
+            pending = []
+            for (period, query), results in zip(
+                batch, self._serper_search_batch([query for _, query in batch])
+            ):
+                candidates = extract(period, results) if results is not None else []
+                found[period].extend(candidates)
+                # If we found good results, stop searching this period
+                if len(candidates) < enough:
+                    pending.append(period)
+        
+        return found
+    
+    def _serper_search_batch(self, queries: List[str], num: int = 10) -> List[Optional[Dict]]:
+        """
+        Run several Serper searches in one request per SERPER_BATCH_SIZE queries.
+        
+        Serper accepts a JSON array of queries and answers with a list in
+        the same order. Returns one result dict per query, or None where
+        the request failed.
+        """
+        chunks = [
+            queries[start:start + SERPER_BATCH_SIZE]
+            for start in range(0, len(queries), SERPER_BATCH_SIZE)
+        ]
+        for query in queries:
+            logger.info("-> Searching: %s", query)
+        
+        responses = self._serper_post_many(
+            [[{'q': query, 'num': num} for query in chunk] for chunk in chunks],
+            timeout=15
+        )
+        
+        results: List[Optional[Dict]] = []
+        for chunk, batch_results in zip(chunks, responses):
+            if batch_results is None:
+                batch_results = []
+            elif isinstance(batch_results, dict):
+                batch_results = [batch_results]
+            results.extend(batch_results)
+            results.extend([None] * (len(chunk) - len(batch_results)))
+        
+        return results
+    
+    def _serper_post(self, payload, timeout: float = 5):
+        """
+        POST one Serper search payload (a query dict or a batch list).
+        
+        Returns the decoded JSON body, or None if the request failed.
+        Successful bodies are cached by payload for SERPER_CACHE_SECONDS,
+        and concurrent callers with the same payload share one request.
+        """
+        body = _json_dumps(payload)
+        cache_key = _serper_cache_key(body)
+        cached = _serper_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        flight, owner = _claim_serper_flight(cache_key)
+        if not owner:
+            return flight.result()
+        
+        results = None
+        try:
+            results = self._serper_fetch(body, timeout)
+        finally:
+            _land_serper_flight(cache_key, flight, results)
+        return results
+    
+    def _serper_fetch(self, body: bytes, timeout: float):
+        """POST a serialized payload over the shared session; None on failure."""
+        try:
+            response = self._http.post(
+                SERPER_SEARCH_URL,
+                headers={
+                    'X-API-KEY': self.serper_key,
+                    'Content-Type': 'application/json'
+                },
+                data=body,
+                timeout=timeout
+            )
+            
+            if response.status_code == 200:
+                return _json_loads(response.content)
+            logger.warning("Serper returned status %s: %s", response.status_code, response.text)
         
-        return all_candidates
+        except Exception as e:
+            logger.warning("Serper search error: %s", e)
+        return None
+    
+    def _serper_post_many(self, payloads: List, timeout: float = 5) -> List:
+        """
+        POST independent Serper payloads concurrently.
+        
+        Latency is that of the slowest request rather than the sum. Returns
+        one decoded body (or None on failure) per payload, in order, sending
+        at most SERPER_CONCURRENCY at a time. Payloads already in flight
+        from another thread are awaited rather than sent again.
+        """
+        bodies = [_json_dumps(payload) for payload in payloads]
+        keys = [_serper_cache_key(body) for body in bodies]
+        results = [_serper_cache.get(key) for key in keys]
+        
+        owned, waiting = [], []
+        for i, cached in enumerate(results):
+            if cached is None:
+                flight, owner = _claim_serper_flight(keys[i])
+                (owned if owner else waiting).append((i, flight))
+        
+        fetched = [None] * len(owned)
+        try:
+            if len(owned) == 1:
+                fetched = [self._serper_fetch(bodies[owned[0][0]], timeout)]
+            elif owned:
+                # Threads over the shared session keep the pooled connections
+                # and the HTTP cache
+                with ThreadPoolExecutor(max_workers=min(SERPER_CONCURRENCY, len(owned))) as executor:
+                    fetched = list(executor.map(
+                        lambda i: self._serper_fetch(bodies[i], timeout),
+                        [i for i, _ in owned]
+                    ))
+        finally:
+            for (i, flight), body in zip(owned, fetched):
+                _land_serper_flight(keys[i], flight, body)
+                results[i] = body
+        
+        # Ours are sent before waiting on other threads', so no thread
+        # ever blocks while holding a flight someone else needs
+        for i, flight in waiting:
+            results[i] = flight.result()
+        return results
     
     def _deduplicate_reports(self, reports: List[Dict]) -> List[Dict]:
         """
@@ -1257,37 +1705,12 @@ IMPORTANT:
         Returns:
             The extracted reporting period year (fiscal year)
         """
-        # Patterns to match fiscal/reporting year (in priority order)
-        patterns = [
-            # "Annual Report 2020", "2020 Annual Report"
-            r'annual\s+report\s+(\d{4})',
-            r'(\d{4})\s+annual\s+report',
-            # "FY2020", "FY 2020", "Fiscal Year 2020"
-            r'fy\s*(\d{4})',
-            r'fiscal\s+year\s+(\d{4})',
-            # "For the year ended 31 December 2020", "Year ended 2020"
-            r'(?:for\s+)?(?:the\s+)?year\s+ended\s+(?:\d+\s+\w+\s+)?(\d{4})',
-            # "10-K 2020", "Form 10-K 2020", "2020 10-K"
-            r'10-k\s+(\d{4})',
-            r'(\d{4})\s+(?:form\s+)?10-k',
-            r'form\s+10-k\s+(\d{4})',
-            # "20-F 2020", "Form 20-F 2020"
-            r'20-f\s+(\d{4})',
-            r'(\d{4})\s+(?:form\s+)?20-f',
-            # "Results 2020", "FY20 Results"
-            r'results?\s+(\d{4})',
-            r'fy(\d{2})\s+results?',  # FY20 -> 2020
-            # URL patterns like /2020/, _2020_, -2020-
-            r'/(\d{4})/',
-            r'[_-](\d{4})[_.-]',
-            r'(\d{4})\.pdf$',
-        ]
         
         combined_text = f"{title} {url} {snippet}".lower()
         
         # Try each pattern
-        for pattern in patterns:
-            match = re.search(pattern, combined_text)
+        for pattern in _REPORT_YEAR_PATTERNS:
+            match = pattern.search(combined_text)
             if match:
                 year_str = match.group(1)
                 # Handle 2-digit years (FY20 -> 2020)
@@ -1412,8 +1835,8 @@ IMPORTANT:
             # PDF URL domain MUST belong to the requested company
             # Rejects PDFs from related but different companies (e.g., Prosus when Naspers requested)
             if not self._validate_company_domain(link, company):
-                domain = urlparse(link).netloc
-                print(f"  [X] REJECTED (WRONG COMPANY DOMAIN '{domain}'): {original_title[:50]}")
+                domain = _cached_urlparse(link).netloc
+                logger.debug("[X] REJECTED (WRONG COMPANY DOMAIN '%s'): %s", domain, original_title[:50])
                 continue
             
             # ========== STEP 1: STRICT EXCLUSION CHECK ==========
@@ -1423,7 +1846,7 @@ IMPORTANT:
             is_excluded = any(kw in title_and_link for kw in exclude_keywords)
             if is_excluded:
                 excluded_kw = [kw for kw in exclude_keywords if kw in title_and_link][0]
-                print(f"  [X] REJECTED (excluded keyword '{excluded_kw}'): {original_title[:50]}")
+                logger.debug("[X] REJECTED (excluded keyword '%s'): %s", excluded_kw, original_title[:50])
                 continue
             
             # ========== STEP 2: ACADEMIC SOURCE CHECK ==========
@@ -1432,7 +1855,7 @@ IMPORTANT:
                 'sciencedirect', 'wiley', 'tandfonline', 'emerald'
             ])
             if is_academic:
-                print(f"  [X] REJECTED (academic source): {original_title[:50]}")
+                logger.debug("[X] REJECTED (academic source): %s", original_title[:50])
                 continue
             
             # ========== STEP 3: DOCUMENT TYPE VALIDATION ==========
@@ -1464,7 +1887,7 @@ IMPORTANT:
                 
                 if is_full_year_doc:
                     rejected_kw = [kw for kw in quarterly_reject_keywords if kw in combined_text][0]
-                    print(f"  [X] REJECTED (FULL YEAR doc for quarterly request - '{rejected_kw}'): {original_title[:50]}")
+                    logger.debug("[X] REJECTED (FULL YEAR doc for quarterly request - '%s'): %s", rejected_kw, original_title[:50])
                     continue
                 
                 # ========== EXACT QUARTER MATCHING ==========
@@ -1472,11 +1895,11 @@ IMPORTANT:
                     normalized_req = [q.upper() for q in requested_quarters]
                     
                     if doc_quarter is None:
-                        print(f"  [X] REJECTED (no specific Q1/Q2/Q3/Q4 label, interim/H1/H2 not accepted): {original_title[:50]}")
+                        logger.debug("[X] REJECTED (no specific Q1/Q2/Q3/Q4 label, interim/H1/H2 not accepted): %s", original_title[:50])
                         continue
                     
                     if doc_quarter not in normalized_req:
-                        print(f"  [X] REJECTED (WRONG QUARTER - found {doc_quarter}, need {normalized_req}): {original_title[:50]}")
+                        logger.debug("[X] REJECTED (WRONG QUARTER - found %s, need %s): %s", doc_quarter, normalized_req, original_title[:50])
                         continue
                 else:
                     # Generic quarterly request - accept any quarter label
@@ -1487,19 +1910,19 @@ IMPORTANT:
                     ]
                     has_quarter_label = any(kw in combined_text for kw in quarter_generic_keywords)
                     if not has_quarter_label:
-                        print(f"  [X] REJECTED (no quarterly indicator): {original_title[:50]}")
+                        logger.debug("[X] REJECTED (no quarterly indicator): %s", original_title[:50])
                         continue
             
             elif report_type == 'earnings':
                 has_earnings = any(kw in combined_text for kw in earnings_keywords)
                 if not has_earnings:
-                    print(f"  [X] REJECTED (not earnings release): {original_title[:50]}")
+                    logger.debug("[X] REJECTED (not earnings release): %s", original_title[:50])
                     continue
             
             elif report_type == 'presentation':
                 has_presentation = any(kw in combined_text for kw in presentation_keywords)
                 if not has_presentation:
-                    print(f"  [X] REJECTED (not presentation): {original_title[:50]}")
+                    logger.debug("[X] REJECTED (not presentation): %s", original_title[:50])
                     continue
             
             # ========== STRICT ANNUAL REPORT VALIDATION ==========
@@ -1521,7 +1944,7 @@ IMPORTANT:
                 is_wrong_type = any(kw in combined_text for kw in annual_reject_keywords)
                 if is_wrong_type:
                     rejected_kw = [kw for kw in annual_reject_keywords if kw in combined_text][0]
-                    print(f"  [X] REJECTED (WRONG DOC TYPE - '{rejected_kw}' found): {original_title[:50]}")
+                    logger.debug("[X] REJECTED (WRONG DOC TYPE - '%s' found): %s", rejected_kw, original_title[:50])
                     continue
                 
                 # ACCEPT: Must have annual report keywords OR be a full-year financial document
@@ -1545,14 +1968,14 @@ IMPORTANT:
 
                 has_annual = any(kw in combined_text for kw in annual_accept_keywords)
                 if not has_annual:
-                    print(f"  [X] REJECTED (no annual keywords): {original_title[:50]}")
+                    logger.debug("[X] REJECTED (no annual keywords): %s", original_title[:50])
                     continue
             
             # ========== STEP 4: MANDATORY COMPANY NAME VERIFICATION ==========
             # This is the CRITICAL check that prevents wrong companies (Visa, Home Depot, etc.)
             company_lower = company.lower()
             # Remove parenthetical content and clean up
-            company_main = re.sub(r'\s*\([^)]*\)', '', company_lower).strip()
+            company_main = _PARENTHETICAL_RE.sub('', company_lower).strip()
             # Also handle Turkish/special characters by keeping original + ASCII version
             company_ascii = company_main.encode('ascii', 'ignore').decode('ascii')
             company_words = company_main.split() + company_ascii.split()
@@ -1582,16 +2005,16 @@ IMPORTANT:
                 
                 if len(matches) >= 1:
                     company_matched = True
-                    print(f"  [DEBUG] Company words: {significant_words}, Matches: {matches}")
+                    logger.debug("Company words: %s, Matches: %s", significant_words, matches)
             
             # Fallback: Check if the main compound word appears as substring (e.g., "kazmunaygas" in text)
             if not company_matched and main_company_word:
                 if main_company_word in combined_text:
                     company_matched = True
-                    print(f"  [DEBUG] Compound name match: '{main_company_word}' found")
+                    logger.debug("Compound name match: '%s' found", main_company_word)
             
             if not company_matched:
-                print(f"  [X] REJECTED (COMPANY MISMATCH - '{significant_words}' not found in doc): {original_title[:50]}")
+                logger.debug("[X] REJECTED (COMPANY MISMATCH - '%s' not found in doc): %s", significant_words, original_title[:50])
                 continue
             
             # ========== STEP 5: STRICT YEAR EXTRACTION AND VALIDATION ==========
@@ -1605,7 +2028,7 @@ IMPORTANT:
             
             # CRITICAL: STRICT YEAR MATCH - extracted year MUST equal requested year
             if reporting_year != year:
-                print(f"  [X] REJECTED (YEAR MISMATCH: extracted FY{reporting_year}, requested FY{year}): {original_title[:50]}")
+                logger.debug("[X] REJECTED (YEAR MISMATCH: extracted FY%s, requested FY%s): %s", reporting_year, year, original_title[:50])
                 continue
             
             # ========== STEP 6: ACCEPT THE DOCUMENT ==========
@@ -1617,9 +2040,9 @@ IMPORTANT:
             period = f"FY{reporting_year}"
             if doc_quarter:
                 period = f"{doc_quarter} {reporting_year}"
-                print(f"  [OK] ACCEPTED: {original_title[:60]} ({period})")
+                logger.debug("[OK] ACCEPTED: %s (%s)", original_title[:60], period)
             else:
-                print(f"  [OK] ACCEPTED: {original_title[:60]} (FY{reporting_year})")
+                logger.debug("[OK] ACCEPTED: %s (FY%s)", original_title[:60], reporting_year)
             
             pdf_reports.append({
                 'year': reporting_year,
@@ -1643,7 +2066,7 @@ IMPORTANT:
         """
         company_lower = company.lower()
         # Remove parenthetical content
-        company_main = re.sub(r'\s*\([^)]*\)', '', company_lower).strip()
+        company_main = _PARENTHETICAL_RE.sub('', company_lower).strip()
         company_words = company_main.split()
         
         common_words = [
@@ -1670,7 +2093,7 @@ IMPORTANT:
         Company name matching is done separately in _extract_pdf_urls STEP 4.
         """
         try:
-            domain = urlparse(url).netloc.lower()
+            domain = _cached_urlparse(url).netloc.lower()
             # Remove common prefixes
             domain_clean = domain.replace('www.', '').replace('ir.', '')
             
@@ -1726,7 +2149,7 @@ IMPORTANT:
                 if len(caps) >= 2:
                     camel_abbrev = ''.join(caps).lower()
                     if camel_abbrev in domain_clean:
-                        print(f"  [DEBUG] Domain match via CamelCase abbrev: '{camel_abbrev}' in '{domain_clean}'")
+                        logger.debug("Domain match via CamelCase abbrev: '%s' in '%s'", camel_abbrev, domain_clean)
                         return True
             
             return False
@@ -1755,30 +2178,16 @@ IMPORTANT:
             all_candidates = []
             
             for query in queries:
-                print(f"\n[SEARCH] Searching for IR page: {query}")
-                
-                response = requests.post(
-                    'https://google.serper.dev/search',
-                    headers={
-                        'X-API-KEY': self.serper_key,
-                        'Content-Type': 'application/json'
-                    },
-                    json={
-                        'q': query,
-                        'num': 10
-                    },
-                    timeout=5
-                )
+                logger.info("[SEARCH] Searching for IR page: %s", query)
                 
-                if response.status_code != 200:
+                results = self._serper_post({'q': query, 'num': 10})
+                if results is None:
                     continue
                 
-                results = response.json()
-                
                 for result in results.get('organic', []):
                     link = result.get('link', '')
                     title = result.get('title', '').lower()
-                    domain = urlparse(link).netloc.lower()
+                    domain = _cached_urlparse(link).netloc.lower()
                     
                     # Skip PDF files
                     if link.endswith('.pdf'):
@@ -1787,7 +2196,7 @@ IMPORTANT:
                     # EXCLUDE regulators/exchanges - we want company's OWN site
                     regulator_domains = ['sec.gov', 'edgar', 'hkex', 'jse.co.za', 'lse.co.uk', 'bse', 'nse']
                     if any(rd in domain for rd in regulator_domains):
-                        print(f"  [X] Skipping regulator: {link[:50]}")
+                        logger.debug("[X] Skipping regulator: %s", link[:50])
                         continue
                     
                     # Check domain contains company name word
@@ -1796,7 +2205,7 @@ IMPORTANT:
                     
                     has_company_word = any(word in domain_clean for word in significant_words)
                     if not has_company_word:
-                        print(f"  [X] Domain mismatch for '{company}': {domain}")
+                        logger.debug("[X] Domain mismatch for '%s': %s", company, domain)
                         continue
                     
                     # Score the candidate
@@ -1820,7 +2229,7 @@ IMPORTANT:
                         score += 10
                         
                     all_candidates.append((score, link))
-                    print(f"  [OK] Valid company domain (score {score}): {link[:60]}")
+                    logger.debug("[OK] Valid company domain (score %s): %s", score, link[:60])
                 
                 # If we found good candidates, break early
                 if len(all_candidates) >= 3:
@@ -1830,13 +2239,13 @@ IMPORTANT:
             if all_candidates:
                 all_candidates.sort(reverse=True, key=lambda x: x[0])
                 best_url = all_candidates[0][1]
-                print(f"  [BEST] Selected: {best_url}")
+                logger.info("[BEST] Selected: %s", best_url)
                 return best_url
             
             return None
             
         except Exception as e:
-            print(f"Error finding IR page: {e}")
+            logger.warning("Error finding IR page: %s", e)
             return None
     
     def _validate_pdf_url(self, url: str) -> bool:
@@ -1852,21 +2261,15 @@ IMPORTANT:
             return False
         
         # Basic URL validation
-        url_pattern = re.compile(
-            r'^https?://'
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'
-            r'localhost|'
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
-            r'(?::\d+)?'
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        
-        return bool(url_pattern.match(url))
+        return bool(_VALID_PDF_URL_RE.match(url))
 
 
 def main():
     """Test the hybrid report finder."""
     import sys
     
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     if len(sys.argv) < 2:
         print("Usage: python openai_report_finder.py 'query'")
         print("Example: python openai_report_finder.py 'Financial statements of Turkcell TCELL'")
@@ -134,6 +134,7 @@ class OpenRouterFallbackRetriever:
         api_key: Optional[str] = None,
         model: str = None,
         base_url: str = "https://openrouter.ai/api/v1",
+        http_client=None,
     ):
         """
         Initialize the OpenRouter fallback retriever.
@@ -142,6 +143,7 @@ class OpenRouterFallbackRetriever:
             api_key: OpenRouter API key
             model: Model to use (default: openai/gpt-4o)
             base_url: OpenRouter API base URL
+            http_client: Optional shared httpx.Client for connection reuse
         """
         self.api_key = api_key or os.getenv("OPENROUTER_API_KEY") or os.getenv("OPENAI_API_KEY")
         self.model = model or os.getenv("OPENROUTER_MODEL", "openai/gpt-4o")
@@ -157,6 +159,7 @@ class OpenRouterFallbackRetriever:
         self.client = OpenAI(
             api_key=self.api_key,
             base_url=self.base_url,
+            http_client=http_client,
         )
         
         logger.info(f"OpenRouter fallback initialized with model: {self.model}")
@@ -0,0 +1,83 @@
+"""
+Response Cache for Investor-Report-Finder
+
+In-process LRU cache with per-entry expiry for discovery and search
+results, so repeated prompts skip the Serper/OpenAI pipeline.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_query(text: Optional[str]) -> str:
+    """Lowercase a free-text query and collapse its whitespace."""
+    return _WHITESPACE_RE.sub(' ', text or '').strip().lower()
+
+
+def make_cache_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """
+    Stable key for an endpoint call.
+
+    Args:
+        endpoint: Endpoint path, e.g. '/search'
+        params: JSON-serializable request parameters (API keys included;
+            only the digest is kept)
+
+    Returns:
+        Hex digest of the endpoint and its parameters
+    """
+    payload = json.dumps({'endpoint': endpoint, **params}, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire `ttl` seconds after insertion."""
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 3600.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries; least recently used go first
+            ttl: Lifetime of an entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
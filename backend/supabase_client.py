@@ -5,9 +5,20 @@ Provides database operations for storing and retrieving user reports.
 Uses Clerk user IDs (clerk_user_id) for user isolation.
 """
 
+import asyncio
 import os
-from typing import Optional, List, Dict, Any
-from supabase import create_client, Client
+import threading
+from typing import Optional, List, Dict, Any, Tuple
+
+import httpx
+from supabase import (
+    AsyncClient,
+    AsyncClientOptions,
+    Client,
+    ClientOptions,
+    acreate_client,
+    create_client,
+)
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -17,7 +28,24 @@ load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_SERVICE_KEY = os.getenv("SUPABASE_SERVICE_KEY")
 
+# PostgREST/Storage requests share one keep-alive pool, so repeated report
+# reads reuse open TLS connections instead of reconnecting
+SUPABASE_TIMEOUT_SECONDS = 10
+SUPABASE_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
 _supabase_client: Optional[Client] = None
+_supabase_client_lock = threading.Lock()
+
+_async_supabase_client: Optional[AsyncClient] = None
+_async_supabase_client_lock = asyncio.Lock()
+
+
+def _check_credentials() -> None:
+    if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
+        raise ValueError(
+            "Supabase credentials not configured. "
+            "Set SUPABASE_URL and SUPABASE_SERVICE_KEY in .env"
+        )
 
 
 def get_supabase_client() -> Client:
@@ -28,16 +56,62 @@ def get_supabase_client() -> Client:
     global _supabase_client
     
     if _supabase_client is None:
-        if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
-            raise ValueError(
-                "Supabase credentials not configured. "
-                "Set SUPABASE_URL and SUPABASE_SERVICE_KEY in .env"
-            )
-        _supabase_client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+        _check_credentials()
+        # Callers may be worker threads; build the client only once
+        with _supabase_client_lock:
+            if _supabase_client is None:
+                _supabase_client = create_client(
+                    SUPABASE_URL,
+                    SUPABASE_SERVICE_KEY,
+                    options=ClientOptions(
+                        postgrest_client_timeout=SUPABASE_TIMEOUT_SECONDS,
+                        storage_client_timeout=SUPABASE_TIMEOUT_SECONDS,
+                        httpx_client=httpx.Client(
+                            limits=SUPABASE_HTTP_LIMITS,
+                            timeout=SUPABASE_TIMEOUT_SECONDS,
+                        ),
+                    ),
+                )
     
     return _supabase_client
 
 
+async def get_async_supabase_client() -> AsyncClient:
+    """
+    Get or create the async Supabase client singleton.
+    Used by the API handlers so database calls don't block the event loop.
+    """
+    global _async_supabase_client
+    
+    if _async_supabase_client is None:
+        _check_credentials()
+        async with _async_supabase_client_lock:
+            if _async_supabase_client is None:
+                _async_supabase_client = await acreate_client(
+                    SUPABASE_URL,
+                    SUPABASE_SERVICE_KEY,
+                    options=AsyncClientOptions(
+                        postgrest_client_timeout=SUPABASE_TIMEOUT_SECONDS,
+                        storage_client_timeout=SUPABASE_TIMEOUT_SECONDS,
+                        httpx_client=httpx.AsyncClient(
+                            limits=SUPABASE_HTTP_LIMITS,
+                            timeout=SUPABASE_TIMEOUT_SECONDS,
+                        ),
+                    ),
+                )
+    
+    return _async_supabase_client
+
+
+async def close_async_supabase_client() -> None:
+    """Close the async client's connection pool (on application shutdown)."""
+    global _async_supabase_client
+    
+    if _async_supabase_client is not None:
+        await _async_supabase_client.options.httpx_client.aclose()
+        _async_supabase_client = None
+
+
 # ============================================
 # Report Storage Functions
 # ============================================
@@ -166,6 +240,99 @@ def delete_user_report(
     return len(result.data) > 0 if result.data else False
 
 
+async def save_report_async(
+    clerk_user_id: str,
+    company_name: str,
+    ticker: Optional[str],
+    year: int,
+    report_type: str,
+    file_url: str,
+    source_url: Optional[str] = None,
+    title: Optional[str] = None
+) -> Dict[str, Any]:
+    """Async version of save_report."""
+    client = await get_async_supabase_client()
+    
+    data = {
+        "clerk_user_id": clerk_user_id,
+        "company_name": company_name,
+        "ticker": ticker,
+        "year": year,
+        "report_type": report_type,
+        "file_url": file_url,
+        "source_url": source_url,
+        "title": title,
+        "status": "found"
+    }
+    
+    result = await client.table("reports").insert(data).execute()
+    return result.data[0] if result.data else {}
+
+
+async def get_user_reports_async(
+    clerk_user_id: str,
+    limit: int = 50,
+    offset: int = 0
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Get one page of a user's reports together with their total count.
+    
+    The page and the count are fetched concurrently.
+    
+    Returns:
+        (report records, total number of reports for the user)
+    """
+    client = await get_async_supabase_client()
+    
+    page, total = await asyncio.gather(
+        client.table("reports")
+            .select("*")
+            .eq("clerk_user_id", clerk_user_id)
+            .order("created_at", desc=True)
+            .range(offset, offset + limit - 1)
+            .execute(),
+        client.table("reports")
+            .select("id", count="exact", head=True)
+            .eq("clerk_user_id", clerk_user_id)
+            .execute(),
+    )
+    
+    return page.data or [], total.count or 0
+
+
+async def get_user_report_by_id_async(
+    clerk_user_id: str,
+    report_id: str
+) -> Optional[Dict[str, Any]]:
+    """Async version of get_user_report_by_id."""
+    client = await get_async_supabase_client()
+    
+    result = await client.table("reports") \
+        .select("*") \
+        .eq("id", report_id) \
+        .eq("clerk_user_id", clerk_user_id) \
+        .single() \
+        .execute()
+    
+    return result.data
+
+
+async def delete_user_report_async(
+    clerk_user_id: str,
+    report_id: str
+) -> bool:
+    """Async version of delete_user_report."""
+    client = await get_async_supabase_client()
+    
+    result = await client.table("reports") \
+        .delete() \
+        .eq("id", report_id) \
+        .eq("clerk_user_id", clerk_user_id) \
+        .execute()
+    
+    return len(result.data) > 0 if result.data else False
+
+
 # ============================================
 # Search History Functions (Optional)
 # ============================================
@@ -209,6 +376,23 @@ def get_user_search_history(
     return result.data or []
 
 
+async def get_user_search_history_async(
+    clerk_user_id: str,
+    limit: int = 20
+) -> List[Dict[str, Any]]:
+    """Async version of get_user_search_history."""
+    client = await get_async_supabase_client()
+    
+    result = await client.table("search_history") \
+        .select("*") \
+        .eq("clerk_user_id", clerk_user_id) \
+        .order("created_at", desc=True) \
+        .limit(limit) \
+        .execute()
+    
+    return result.data or []
+
+
 # ============================================
 # User Settings Functions
 # ============================================